@@ -16,6 +16,8 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 # Import our models and config
 from app.database import Base
 from app.models.ticket import Ticket  # noqa: F401 - Import to register model
+from app.models.job import AnalysisJob  # noqa: F401 - Import to register model
+from app.models.stats import TicketChanges, TicketStat  # noqa: F401 - Import to register model
 from app.config import settings
 
 # this is the Alembic Config object, which provides
@@ -34,6 +36,14 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Skip the FTS5 virtual table and its shadow tables (managed by hand)"""
+    if type_ == "table" and name.startswith("ticket_fts"):
+        return False
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -56,6 +66,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -66,7 +77,11 @@ def run_migrations_offline() -> None:
 
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations with the given connection"""
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
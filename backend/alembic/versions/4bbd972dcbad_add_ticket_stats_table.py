@@ -0,0 +1,41 @@
+"""Add ticket_stats counter table
+
+Revision ID: 4bbd972dcbad
+Revises: ad3ee1a428ab
+Create Date: 2026-10-16 16:21:48.930512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4bbd972dcbad'
+down_revision: Union[str, Sequence[str], None] = 'ad3ee1a428ab'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('ticket_stats',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('status', sa.Enum('OPEN', 'ANALYZING', 'WAITING_CONFIRM', 'DONE', 'MANUAL_REQUIRED', 'REJECTED', name='ticketstatus'), nullable=False),
+    sa.Column('urgency', sa.String(length=10), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'status', 'urgency')
+    )
+
+    # Backfill from existing tickets
+    op.execute(
+        "INSERT INTO ticket_stats (day, status, urgency, count) "
+        "SELECT date(created_at), status, COALESCE(lower(urgency), 'unset'), COUNT(*) "
+        "FROM tickets GROUP BY date(created_at), status, COALESCE(lower(urgency), 'unset')"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('ticket_stats')
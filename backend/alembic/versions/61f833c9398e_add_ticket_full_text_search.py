@@ -0,0 +1,64 @@
+"""Add FTS5 full-text index over ticket VOC text
+
+Revision ID: 61f833c9398e
+Revises: 4bbd972dcbad
+Create Date: 2026-10-16 17:05:12.663028
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '61f833c9398e'
+down_revision: Union[str, Sequence[str], None] = '4bbd972dcbad'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Kept in step with TICKET_FTS_CREATE / TICKET_FTS_DROP in app/models/ticket.py
+FTS_CREATE = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS ticket_fts USING fts5("
+    "ticket_id UNINDEXED, raw_voc, summary, manual_resolution, tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS tickets_fts_insert AFTER INSERT ON tickets BEGIN "
+    "INSERT INTO ticket_fts (ticket_id, raw_voc, summary, manual_resolution) "
+    "VALUES (new.ticket_id, new.raw_voc, new.summary, new.manual_resolution); END",
+    "CREATE TRIGGER IF NOT EXISTS tickets_fts_update "
+    "AFTER UPDATE OF raw_voc, summary, manual_resolution ON tickets BEGIN "
+    "UPDATE ticket_fts SET raw_voc = new.raw_voc, summary = new.summary, "
+    "manual_resolution = new.manual_resolution WHERE ticket_id = old.ticket_id; END",
+    "CREATE TRIGGER IF NOT EXISTS tickets_fts_delete AFTER DELETE ON tickets BEGIN "
+    "DELETE FROM ticket_fts WHERE ticket_id = old.ticket_id; END",
+]
+
+FTS_DROP = [
+    "DROP TRIGGER IF EXISTS tickets_fts_delete",
+    "DROP TRIGGER IF EXISTS tickets_fts_update",
+    "DROP TRIGGER IF EXISTS tickets_fts_insert",
+    "DROP TABLE IF EXISTS ticket_fts",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # FTS5 is SQLite-only; other backends would use their own text search
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    for statement in FTS_CREATE:
+        op.execute(statement)
+
+    # Backfill existing tickets
+    op.execute(
+        "INSERT INTO ticket_fts (ticket_id, raw_voc, summary, manual_resolution) "
+        "SELECT ticket_id, raw_voc, summary, manual_resolution FROM tickets"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    for statement in FTS_DROP:
+        op.execute(statement)
@@ -0,0 +1,53 @@
+"""Add composite and partial indexes for ticket list queries
+
+Revision ID: ad3ee1a428ab
+Revises: f5933383bcaa
+Create Date: 2026-10-16 14:02:17.208115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ad3ee1a428ab'
+down_revision: Union[str, Sequence[str], None] = 'f5933383bcaa'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE_STATUS_CLAUSE = "status IN ('OPEN', 'ANALYZING', 'WAITING_CONFIRM')"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tickets_created_at_ticket_id', 'tickets', ['created_at', 'ticket_id'], unique=False)
+    op.create_index('ix_tickets_status_created_at', 'tickets', ['status', 'created_at', 'ticket_id'], unique=False)
+    op.create_index('ix_tickets_urgency_created_at', 'tickets', ['urgency', 'created_at', 'ticket_id'], unique=False)
+    op.create_index(
+        'ix_tickets_active_created_at', 'tickets', ['created_at', 'ticket_id'], unique=False,
+        sqlite_where=sa.text(ACTIVE_STATUS_CLAUSE),
+        postgresql_where=sa.text(ACTIVE_STATUS_CLAUSE),
+    )
+
+    # Covered by the primary key and by the composite indexes above
+    op.drop_index('ix_tickets_ticket_id', table_name='tickets')
+    op.drop_index('ix_tickets_status', table_name='tickets')
+    op.drop_index('ix_tickets_urgency', table_name='tickets')
+
+    # SQLite only picks the partial index over (status, created_at) with statistics
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute('ANALYZE tickets')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_tickets_urgency', 'tickets', ['urgency'], unique=False)
+    op.create_index('ix_tickets_status', 'tickets', ['status'], unique=False)
+    op.create_index('ix_tickets_ticket_id', 'tickets', ['ticket_id'], unique=False)
+
+    op.drop_index('ix_tickets_active_created_at', table_name='tickets')
+    op.drop_index('ix_tickets_urgency_created_at', table_name='tickets')
+    op.drop_index('ix_tickets_status_created_at', table_name='tickets')
+    op.drop_index('ix_tickets_created_at_ticket_id', table_name='tickets')
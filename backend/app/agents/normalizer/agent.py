@@ -14,7 +14,7 @@ from app.agents.normalizer.schemas import (
     NormalizerError,
 )
 from app.agents.normalizer.prompts import SYSTEM_PROMPT, create_user_prompt
-from app.services.llm_service import get_llm_service
+from app.services.llm_service import get_llm_service, LLMPriority
 
 
 class NormalizerAgent:
@@ -64,14 +64,16 @@ class NormalizerAgent:
                 received_at=input_data.received_at.isoformat(),
             )
 
-            # Call LLM with timeout
-            response = await asyncio.wait_for(
-                self.llm_service.generate_json(
-                    system_prompt=SYSTEM_PROMPT,
-                    user_prompt=user_prompt,
-                    temperature=0.1,
-                ),
+            # Call LLM with timeout (time queued for admission is not counted)
+            response = await self.llm_service.generate_json(
+                system_prompt=SYSTEM_PROMPT,
+                user_prompt=user_prompt,
+                temperature=0.1,
+                # Normalization decides urgency, so it goes first
+                priority=LLMPriority.HIGH,
                 timeout=self.timeout,
+                # Only cache answers that pass the schema
+                validate=lambda text: self._parse_response(text) is not None,
             )
 
             # Parse JSON response
@@ -18,14 +18,21 @@ from app.agents.solver.schemas import (
 from app.agents.solver.prompts import SYSTEM_PROMPT, format_user_prompt
 from app.agents.solver.tools import (
     get_logs,
-    analyze_error_patterns,
+    analyze_service_error_patterns,
     get_system_info,
     search_similar_vocs,
 )
-from app.services.llm_service import get_llm_service
+from app.services.llm_service import get_llm_service, LLMPriority
 
 logger = logging.getLogger(__name__)
 
+# LLM admission priority by normalized urgency
+URGENCY_PRIORITY = {
+    "high": LLMPriority.HIGH,
+    "medium": LLMPriority.NORMAL,
+    "low": LLMPriority.LOW,
+}
+
 
 class SolverAgent:
     """Solver Agent for analyzing VOC issues and proposing solutions"""
@@ -55,13 +62,14 @@ class SolverAgent:
 
             # Step 3: Call LLM for analysis with timeout
             logger.info(f"Calling LLM for analysis: {input_data.ticket_id}")
-            response = await asyncio.wait_for(
-                self.llm_service.generate_json(
-                    system_prompt=SYSTEM_PROMPT,
-                    user_prompt=analysis_prompt,
-                    temperature=0.1,
-                ),
+            response = await self.llm_service.generate_json(
+                system_prompt=SYSTEM_PROMPT,
+                user_prompt=analysis_prompt,
+                temperature=0.1,
+                priority=self._llm_priority(input_data),
                 timeout=self.timeout,
+                # Only cache answers that pass the schema
+                validate=lambda text: self._parse_response(input_data.ticket_id, text) is not None,
             )
 
             # Step 4: Parse and structure response
@@ -83,10 +91,21 @@ class SolverAgent:
             logger.error(f"Error analyzing {input_data.ticket_id}: {e}")
             return self._create_fallback_output(input_data, error=str(e))
 
+    def _llm_priority(self, input_data: SolverAgentInput) -> LLMPriority:
+        """Map ticket urgency to an LLM admission priority"""
+        if input_data.backfill:
+            return LLMPriority.BACKFILL
+        return URGENCY_PRIORITY.get(input_data.urgency, LLMPriority.NORMAL)
+
     async def _gather_tool_data(self, input_data: SolverAgentInput) -> dict:
         """
         Gather data from all available tools
 
+        The log tools are async (served by the configured log adapter); the
+        other tools are synchronous and run in the default executor to keep
+        the event loop free. The log branch (logs -> error analysis -> system
+        info) and the similar-VOC search are independent and run concurrently.
+
         Args:
             input_data: VOC input
 
@@ -100,37 +119,50 @@ class SolverAgent:
         # Try to infer service name from VOC content (simple heuristic)
         service = self._infer_service_name(input_data.raw_voc)
 
-        # 1. Get logs
-        logger.info(f"Fetching logs for service: {service}")
-        log_result = get_logs(
-            service=service,
-            start_time=start_time,
-            end_time=end_time,
-            level="ERROR",
-            limit=100
-        )
-
-        # 2. Analyze error patterns
-        error_analysis = None
-        if log_result.logs:
-            logger.info(f"Analyzing {len(log_result.logs)} log entries")
-            error_analysis = analyze_error_patterns(log_result.logs)
+        async def gather_log_evidence():
+            # 1. Get logs
+            logger.info(f"Fetching logs for service: {service}")
+            log_result = await get_logs(
+                service=service,
+                start_time=start_time,
+                end_time=end_time,
+                level="ERROR",
+                limit=100,
+            )
 
-        # 3. Search similar VOCs
+            # 2. Analyze error patterns over the whole window (not just the page)
+            error_analysis = None
+            if log_result.logs:
+                logger.info(f"Analyzing {log_result.total_count} log entries")
+                error_analysis = await analyze_service_error_patterns(
+                    service=service,
+                    start_time=start_time,
+                    end_time=end_time,
+                    level="ERROR",
+                )
+
+            # 3. Get system info if a system is mentioned
+            system_info = None
+            if error_analysis and error_analysis.external_system_errors:
+                # Get info for the most problematic external system
+                system_name = error_analysis.external_system_errors[0].system
+                logger.info(f"Fetching system info for: {system_name}")
+                system_info = await asyncio.to_thread(get_system_info, system_name)
+
+            return log_result, error_analysis, system_info
+
+        # 4. Search similar VOCs (independent of the log branch)
         logger.info(f"Searching similar VOC cases")
-        similar_cases = search_similar_vocs(
+        similar_search = asyncio.to_thread(
+            search_similar_vocs,
             query=input_data.raw_voc,
             top_k=5,
-            min_similarity=0.5
+            min_similarity=0.5,
         )
 
-        # 4. Get system info if a system is mentioned
-        system_info = None
-        if error_analysis and error_analysis.external_system_errors:
-            # Get info for the most problematic external system
-            system_name = error_analysis.external_system_errors[0].system
-            logger.info(f"Fetching system info for: {system_name}")
-            system_info = get_system_info(system_name)
+        (log_result, error_analysis, system_info), similar_cases = await asyncio.gather(
+            gather_log_evidence(), similar_search
+        )
 
         return {
             "logs": log_result.logs,
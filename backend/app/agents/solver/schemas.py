@@ -12,6 +12,8 @@ class SolverAgentInput(BaseModel):
     ticket_id: str = Field(..., description="VOC ticket ID")
     raw_voc: str = Field(..., description="Raw VOC text from user")
     received_at: datetime = Field(..., description="VOC received timestamp")
+    urgency: Optional[Literal["low", "medium", "high"]] = Field(None, description="Normalized urgency")
+    backfill: bool = Field(False, description="Re-analysis or backfill work (lowest LLM priority)")
 
 
 class ConfidenceScore(BaseModel):
@@ -3,13 +3,17 @@ Solver Agent Tools
 """
 
 from app.agents.solver.tools.get_logs import get_logs
-from app.agents.solver.tools.analyze_patterns import analyze_error_patterns
+from app.agents.solver.tools.analyze_patterns import (
+    analyze_error_patterns,
+    analyze_service_error_patterns,
+)
 from app.agents.solver.tools.get_system_info import get_system_info
 from app.agents.solver.tools.search_similar_vocs import search_similar_vocs
 
 __all__ = [
     "get_logs",
     "analyze_error_patterns",
+    "analyze_service_error_patterns",
     "get_system_info",
     "search_similar_vocs",
 ]
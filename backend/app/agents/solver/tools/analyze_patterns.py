@@ -5,7 +5,7 @@ analyze_error_patterns tool - Analyze error patterns in logs
 import logging
 from datetime import datetime
 from collections import defaultdict
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from app.agents.solver.tools.schemas import (
     AnalyzeErrorPatternsInput,
@@ -13,6 +13,8 @@ from app.agents.solver.tools.schemas import (
     ErrorSummary,
     ExternalSystemError
 )
+from app.mock.schemas import LogQueryParams
+from app.services.log_adapter import LogAdapter, get_log_adapter
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +47,7 @@ def analyze_error_patterns(logs: List[Dict[str, Any]]) -> AnalyzeErrorPatternsOu
             stack_trace = log.get("stack_trace")
             message = log.get("message", "")
             timestamp_str = log.get("timestamp", "")
-            metadata = log.get("metadata", {})
+            metadata = log.get("metadata") or {}
 
             # Count by level
             if level == "ERROR":
@@ -124,3 +126,45 @@ def analyze_error_patterns(logs: List[Dict[str, Any]]) -> AnalyzeErrorPatternsOu
     except Exception as e:
         logger.error(f"Error in analyze_error_patterns tool: {e}")
         return AnalyzeErrorPatternsOutput()
+
+
+async def analyze_service_error_patterns(
+    service: str,
+    start_time: datetime,
+    end_time: datetime,
+    level: Optional[str] = None,
+    adapter: Optional[LogAdapter] = None,
+) -> AnalyzeErrorPatternsOutput:
+    """
+    Analyze error patterns of every log of a service in a time window
+
+    The analysis runs in the log backend (inside the log store for the file
+    adapter), so it covers the whole window rather than one page of logs.
+
+    Args:
+        service: Service name to query
+        start_time: Start time for query
+        end_time: End time for query
+        level: Optional log level filter
+        adapter: Log adapter (default: get_log_adapter())
+
+    Returns:
+        AnalyzeErrorPatternsOutput with error analysis
+    """
+    try:
+        params = LogQueryParams(
+            service=service, start_time=start_time, end_time=end_time, level=level
+        )
+        stats = await (adapter or get_log_adapter()).analyze_error_patterns(params)
+
+        logger.info(
+            f"Analyzed logs of {service}: "
+            f"{stats.total_errors} errors, {stats.total_warnings} warnings, "
+            f"{len(stats.error_summary)} unique error codes"
+        )
+
+        return AnalyzeErrorPatternsOutput.model_validate(stats.model_dump())
+
+    except Exception as e:
+        logger.error(f"Error in analyze_service_error_patterns tool: {e}")
+        return AnalyzeErrorPatternsOutput()
@@ -1,36 +1,41 @@
 """
-get_logs tool - Retrieve logs from mock log system
+get_logs tool - Retrieve logs from the configured log adapter
 """
 
 import logging
 from datetime import datetime
+from typing import Optional
 
 from app.agents.solver.tools.schemas import GetLogsInput, GetLogsOutput
-from app.mock import get_mock_log_service
 from app.mock.schemas import LogQueryParams
+from app.services.log_adapter import LogAdapter, get_log_adapter
 
 logger = logging.getLogger(__name__)
 
 
-def get_logs(
+async def get_logs(
     service: str,
     start_time: datetime,
     end_time: datetime,
     level: str = None,
-    limit: int = 100
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    adapter: Optional[LogAdapter] = None,
 ) -> GetLogsOutput:
     """
-    Get logs from mock log system
+    Get one page of logs from the log backend
 
     Args:
         service: Service name to query
         start_time: Start time for query
         end_time: End time for query
         level: Optional log level filter
-        limit: Maximum number of logs
+        limit: Maximum number of logs (page size)
+        cursor: next_cursor of the previous page
+        adapter: Log adapter (default: get_log_adapter())
 
     Returns:
-        GetLogsOutput with logs and count
+        GetLogsOutput with logs, total count and next page cursor
     """
     try:
         # Validate input
@@ -39,11 +44,11 @@ def get_logs(
             start_time=start_time,
             end_time=end_time,
             level=level,
-            limit=limit
+            limit=limit,
+            cursor=cursor,
         )
 
-        # Query mock log service
-        log_service = get_mock_log_service()
+        # Query the log backend
         params = LogQueryParams(
             service=input_data.service,
             start_time=input_data.start_time,
@@ -52,7 +57,7 @@ def get_logs(
             limit=input_data.limit
         )
 
-        result = log_service.query_logs(params)
+        result = await (adapter or get_log_adapter()).search_logs(params, input_data.cursor)
 
         # Convert to dict format
         logs_dict = [
@@ -72,7 +77,8 @@ def get_logs(
 
         return GetLogsOutput(
             logs=logs_dict,
-            total_count=result.total_count
+            total_count=result.total_count,
+            next_cursor=result.next_cursor,
         )
 
     except Exception as e:
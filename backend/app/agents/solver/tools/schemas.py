@@ -16,6 +16,7 @@ class GetLogsInput(BaseModel):
     end_time: datetime = Field(..., description="End time for log query")
     level: Optional[str] = Field(None, description="Filter by log level (DEBUG, INFO, WARN, ERROR)")
     limit: int = Field(100, description="Maximum number of logs to return", ge=1, le=100)
+    cursor: Optional[str] = Field(None, description="next_cursor of the previous page")
 
 
 class GetLogsOutput(BaseModel):
@@ -23,6 +24,7 @@ class GetLogsOutput(BaseModel):
 
     logs: List[Dict[str, Any]] = Field(default_factory=list, description="Retrieved log entries")
     total_count: int = Field(0, description="Total matching logs")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page (None on the last page)")
 
 
 # analyze_error_patterns tool
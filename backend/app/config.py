@@ -10,10 +10,26 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite+aiosqlite:///./voc.db"
+    database_echo: bool = False
+    sqlite_wal: bool = True
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_cache_size_kib: int = 64 * 1024
 
     # LLM
     ollama_base_url: str = "http://localhost:11434"
     ollama_model: str = "gpt-oss:20b"
+    llm_max_in_flight: int = 1
+    llm_priority_aging_seconds: float = 30.0
+    llm_streaming: bool = True
+    llm_stream_max_prefix_chars: int = 2000
+
+    # LLM response cache
+    llm_cache_enabled: bool = True
+    llm_cache_path: str = "./data/llm_cache.sqlite3"
+    llm_cache_max_entries: int = 10000
+    llm_cache_ttl_seconds: float = 7 * 24 * 3600
+    llm_cache_max_temperature: float = 0.3
 
     # Slack
     slack_webhook_url: str = ""
@@ -23,6 +39,53 @@ class Settings(BaseSettings):
     embedding_model: str = "paraphrase-multilingual-MiniLM-L12-v2"
     similarity_top_k: int = 5
     similarity_threshold: float = 0.7
+    embedding_batch_size: int = 32
+    embedding_batch_max_wait_ms: float = 5.0
+    embedding_cache_enabled: bool = True
+    embedding_cache_path: str = "./data/embedding_cache.sqlite3"
+    embedding_cache_max_entries: int = 50000
+
+    # Mock log service: "indexed" (sorted LogEntry lists), "columnar" (NumPy arrays)
+    # or "archive" (compressed segment files on disk)
+    mock_log_store: str = "indexed"
+    mock_log_archive_path: str = "./data/log_archive"
+    mock_log_archive_block_size: int = 1000
+    mock_log_archive_segment_bytes: int = 64 * 1024 * 1024
+    mock_log_archive_cache_blocks: int = 64
+
+    # Log adapter used by the solver tools: "file" (mock log service) or "http"
+    log_adapter: str = "file"
+    log_adapter_url: str = "http://localhost:8001"
+    log_adapter_max_connections: int = 10
+    log_adapter_max_workers: int = 4
+    log_adapter_timeout_seconds: float = 10.0
+
+    # Hot reload of mock log scenarios and RAG seed data (opt-in: the first
+    # poll opens the vector store, which loads the embedding model)
+    hot_reload_enabled: bool = False
+    hot_reload_interval_seconds: float = 2.0
+
+    # Analysis job queue
+    analysis_worker_count: int = 2
+    analysis_job_lease_seconds: float = 60.0
+    analysis_job_max_attempts: int = 3
+    analysis_job_retry_backoff_seconds: float = 10.0
+    analysis_job_poll_interval_seconds: float = 2.0
+
+    # Batch VOC ingestion
+    voc_batch_max_items: int = 5000
+    voc_batch_chunk_size: int = 500
+
+    # Bulk admin actions
+    ticket_bulk_max_items: int = 500
+
+    # Ticket export
+    ticket_export_batch_size: int = 500
+
+    # Ticket event stream (SSE)
+    ticket_events_buffer_size: int = 1000
+    ticket_events_queue_size: int = 256
+    ticket_events_heartbeat_seconds: float = 15.0
 
     # Application
     debug: bool = True
@@ -2,18 +2,68 @@
 Database connection and session management
 """
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 
 from app.config import settings
 
-# Create async engine
+
+def _is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    database = make_url(url).database
+    return _is_sqlite(url) and (not database or database == ":memory:")
+
+
+def configure_sqlite(engine: AsyncEngine, read_only: bool = False) -> None:
+    """
+    Apply the SQLite storage profile to every new connection
+
+    WAL lets readers run alongside the single writer; busy_timeout makes a
+    blocked writer wait instead of failing with "database is locked".
+    """
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if settings.sqlite_wal and not read_only:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+        # Negative cache_size is in KiB
+        cursor.execute(f"PRAGMA cache_size=-{int(settings.sqlite_cache_size_kib)}")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+
+# Create async engine (writer)
 engine = create_async_engine(
     settings.database_url,
-    echo=settings.debug,
+    echo=settings.database_echo,
     future=True
 )
 
+# Separate reader engine so GET endpoints never queue behind the writer's
+# connection pool. An in-memory database cannot be shared between engines.
+if _is_memory_sqlite(settings.database_url):
+    read_engine = engine
+else:
+    read_engine = create_async_engine(
+        settings.database_url,
+        echo=settings.database_echo,
+        future=True
+    )
+
+if _is_sqlite(settings.database_url):
+    configure_sqlite(engine)
+    if read_engine is not engine:
+        configure_sqlite(read_engine, read_only=True)
+
 # Create async session factory
 async_session_maker = async_sessionmaker(
     engine,
@@ -21,6 +71,13 @@ async_session_maker = async_sessionmaker(
     expire_on_commit=False
 )
 
+read_session_maker = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
 # Export as async_session for convenience
 async_session = async_session_maker
 
@@ -43,9 +100,29 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+async def get_read_db() -> AsyncSession:
+    """
+    Dependency for read-only endpoints
+
+    Uses the reader engine and never commits; the read transaction is
+    simply released when the request ends.
+    """
+    async with read_session_maker() as session:
+        yield session
+
+
 async def init_db():
     """
     Initialize database tables
     """
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+
+async def optimize_db():
+    """
+    Refresh SQLite planner statistics where they have drifted
+    """
+    if _is_sqlite(settings.database_url):
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql("PRAGMA optimize")
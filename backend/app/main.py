@@ -11,7 +11,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from app.config import settings
+from app.database import optimize_db
 from app.routers import health, voc, tickets
+from app.services.hot_reload import get_hot_reload_watcher
+from app.services.job_queue import get_job_queue
+from app.services.log_adapter import close_log_adapter
 
 
 # Logging configuration
@@ -46,8 +50,17 @@ async def lifespan(app: FastAPI):
     logger.info("Starting VOC Auto Processing API...")
     logger.info(f"Debug mode: {settings.debug}")
     logger.info(f"Log level: {settings.log_level}")
+    job_queue = get_job_queue()
+    await job_queue.start()
+    hot_reload = get_hot_reload_watcher()
+    if settings.hot_reload_enabled:
+        await hot_reload.start()
     yield
     logger.info("Shutting down VOC Auto Processing API...")
+    await hot_reload.stop()
+    await job_queue.stop()
+    await close_log_adapter()
+    await optimize_db()
 
 
 app = FastAPI(
@@ -2,13 +2,14 @@
 Mock module for Issue Solver Agent
 """
 
-from app.mock.schemas import LogEntry, LogQueryParams, LogQueryResult
+from app.mock.schemas import LogEntry, LogQueryParams, LogQueryResult, ErrorPatternStats
 from app.mock.log_service import MockLogService, get_mock_log_service
 
 __all__ = [
     "LogEntry",
     "LogQueryParams",
     "LogQueryResult",
+    "ErrorPatternStats",
     "MockLogService",
     "get_mock_log_service",
 ]
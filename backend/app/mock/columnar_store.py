@@ -0,0 +1,310 @@
+"""
+Columnar, NumPy-backed log store for the mock log service
+
+Instead of one pydantic ``LogEntry`` per line, a service's logs are kept as
+parallel arrays sorted by time:
+
+- timestamps as int64 epoch microseconds
+- levels and error codes as dictionary-encoded small ints
+- messages, stack traces and components as int32 ids into an interned
+  string table, metadata as ids into a table of interned JSON objects
+
+A log line then costs ~30 bytes plus its share of distinct strings. Time
+windows are located with ``searchsorted``, filters are boolean masks and the
+error pattern summary is a group-by over code arrays. ``LogEntry`` objects
+are only built for the page a query returns.
+
+Same interface as ``ServiceLogIndex``; selected with ``MOCK_LOG_STORE``.
+"""
+
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.mock.log_index import (
+    MAX_STACK_TRACE_PATTERNS, external_system, is_external_message, stack_trace_pattern,
+)
+from app.mock.schemas import (
+    LOG_LEVELS, LogEntry, ErrorCodeStats, ExternalSystemStats, ErrorPatternStats,
+)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_LEVEL_CODES = {level: code for code, level in enumerate(LOG_LEVELS)}
+_ERROR = _LEVEL_CODES["ERROR"]
+_WARN = _LEVEL_CODES["WARN"]
+
+# Id of a missing value in the string and error code columns
+NULL_ID = -1
+
+
+def to_epoch_us(timestamp: datetime) -> int:
+    """Exact epoch microseconds of a timestamp (naive timestamps are UTC)"""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
+def from_epoch_us(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=int(value))
+
+
+class StringTable:
+    """Interned strings addressed by int32 id"""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return NULL_ID
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return string_id
+
+    def get(self, string_id: int) -> Optional[str]:
+        return None if string_id == NULL_ID else self.values[string_id]
+
+
+class ColumnarLogStore:
+    """Logs of one service as time-sorted NumPy columns"""
+
+    # column name -> dtype
+    COLUMNS = {
+        "timestamp": np.int64,
+        "level": np.uint8,
+        "error_code": np.int32,
+        "component": np.int32,
+        "message": np.int32,
+        "stack_trace": np.int32,
+        "metadata": np.int32,
+    }
+
+    def __init__(self):
+        self.strings = StringTable()
+        self.error_codes = StringTable()
+        self.metadata = StringTable()  # JSON text
+        self.systems = StringTable()  # External systems named in metadata
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.empty(0, dtype) for name, dtype in self.COLUMNS.items()
+        }
+        # Rows appended since the last flush, as Python lists per column
+        self._pending: Dict[str, List[int]] = {name: [] for name in self.COLUMNS}
+        # Lookups for the pattern summary, grown with the tables. The
+        # trailing slot answers NULL_ID (-1) lookups.
+        self._external_message = np.zeros(1, bool)
+        self._metadata_system = np.full(1, NULL_ID, np.int32)
+        # Concurrent queries may all try to flush
+        self._flush_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._columns["timestamp"]) + len(self._pending["timestamp"])
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the column arrays (excluding the string tables)"""
+        self._flush()
+        return sum(column.nbytes for column in self._columns.values())
+
+    def append(
+        self,
+        timestamp: datetime,
+        level: str,
+        component: str,
+        message: str,
+        error_code: Optional[str] = None,
+        stack_trace: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Add one log line without building a LogEntry"""
+        pending = self._pending
+        pending["timestamp"].append(to_epoch_us(timestamp))
+        pending["level"].append(_LEVEL_CODES[level])
+        pending["error_code"].append(self.error_codes.intern(error_code))
+        pending["component"].append(self.strings.intern(component))
+        pending["message"].append(self.strings.intern(message))
+        pending["stack_trace"].append(self.strings.intern(stack_trace))
+        pending["metadata"].append(self.metadata.intern(
+            json.dumps(metadata, ensure_ascii=False, sort_keys=True) if metadata else None
+        ))
+
+    def extend(self, entries: Iterable[LogEntry]) -> None:
+        for entry in entries:
+            self.append(
+                entry.timestamp, entry.level, entry.service, entry.message,
+                entry.error_code, entry.stack_trace, entry.metadata,
+            )
+
+    def _flush(self) -> None:
+        """Merge pending rows into the columns, keeping them time-sorted"""
+        if not self._pending["timestamp"]:
+            return
+        with self._flush_lock:
+            if self._pending["timestamp"]:
+                self._merge_pending()
+
+    def _merge_pending(self) -> None:
+        old_timestamps = self._columns["timestamp"]
+        new_timestamps = np.asarray(self._pending["timestamp"], np.int64)
+
+        columns = {
+            name: np.concatenate([self._columns[name], np.asarray(values, dtype)])
+            for (name, dtype), values in zip(self.COLUMNS.items(), self._pending.values())
+        }
+        in_order = (
+            (len(old_timestamps) == 0 or old_timestamps[-1] <= new_timestamps[0])
+            and bool(np.all(new_timestamps[:-1] <= new_timestamps[1:]))
+        )
+        if not in_order:
+            # Stable, so equal timestamps keep their insertion order
+            order = np.argsort(columns["timestamp"], kind="stable")
+            columns = {name: column[order] for name, column in columns.items()}
+
+        self._columns = columns
+        self._pending = {name: [] for name in self.COLUMNS}
+        self._update_string_lookups()
+
+    def _update_string_lookups(self) -> None:
+        messages = self.strings.values[len(self._external_message) - 1:]
+        if messages:
+            self._external_message = np.concatenate([
+                self._external_message[:-1],
+                np.fromiter((is_external_message(s) for s in messages), bool, len(messages)),
+                np.zeros(1, bool),
+            ])
+        metadata = self.metadata.values[len(self._metadata_system) - 1:]
+        if metadata:
+            self._metadata_system = np.concatenate([
+                self._metadata_system[:-1],
+                np.fromiter(
+                    (self.systems.intern(external_system(json.loads(m))) for m in metadata),
+                    np.int32, len(metadata),
+                ),
+                np.full(1, NULL_ID, np.int32),
+            ])
+
+    def _window(self, start_time: datetime, end_time: datetime) -> Tuple[int, int]:
+        self._flush()
+        timestamps = self._columns["timestamp"]
+        return (
+            int(np.searchsorted(timestamps, to_epoch_us(start_time), "left")),
+            int(np.searchsorted(timestamps, to_epoch_us(end_time), "right")),
+        )
+
+    def _rows(self, start_time: datetime, end_time: datetime, level: Optional[str]) -> np.ndarray:
+        """Row positions within the window, optionally of one level"""
+        lo, hi = self._window(start_time, end_time)
+        if level is None:
+            return np.arange(lo, hi)
+        return np.flatnonzero(self._columns["level"][lo:hi] == _LEVEL_CODES[level]) + lo
+
+    def _entry(self, row: int) -> LogEntry:
+        columns, strings = self._columns, self.strings
+        metadata = self.metadata.get(columns["metadata"][row])
+        return LogEntry(
+            timestamp=from_epoch_us(columns["timestamp"][row]),
+            level=LOG_LEVELS[columns["level"][row]],
+            service=strings.get(columns["component"][row]),
+            message=strings.get(columns["message"][row]),
+            error_code=self.error_codes.get(columns["error_code"][row]),
+            stack_trace=strings.get(columns["stack_trace"][row]),
+            metadata=json.loads(metadata) if metadata else None,
+        )
+
+    def query(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        level: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[LogEntry], int]:
+        """
+        Logs within the time window (inclusive), optionally of one level
+
+        Returns:
+            (at most ``limit`` entries oldest first, total matching count)
+        """
+        if level is not None and level not in _LEVEL_CODES:
+            return [], 0
+        rows = self._rows(start_time, end_time, level)
+        page = rows if limit is None else rows[:limit]
+        return [self._entry(row) for row in page], len(rows)
+
+    def error_patterns(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        level: Optional[str] = None,
+    ) -> ErrorPatternStats:
+        """
+        Summarise error codes, stack traces and external system errors
+
+        Args:
+            start_time: Window start (inclusive)
+            end_time: Window end (inclusive)
+            level: Only consider logs of this level
+
+        Returns:
+            Error pattern summary of every log in the window
+        """
+        rows = self._rows(start_time, end_time, level)
+        columns = self._columns
+        levels = columns["level"][rows]
+
+        # Error codes: group ERROR rows by code (rows are time-sorted)
+        error_rows = rows[(levels == _ERROR) & (columns["error_code"][rows] != NULL_ID)]
+        codes = columns["error_code"][error_rows]
+        unique_codes, first, counts = np.unique(codes, return_index=True, return_counts=True)
+        _, last_reversed = np.unique(codes[::-1], return_index=True)
+        last = len(codes) - 1 - last_reversed
+        # First-seen order, then by count (stable), as the per-log analysis does
+        order = np.argsort(first, kind="stable")
+        order = order[np.argsort(-counts[order], kind="stable")]
+        summaries = [
+            ErrorCodeStats(
+                error_code=self.error_codes.get(unique_codes[i]),
+                count=int(counts[i]),
+                first_occurrence=from_epoch_us(columns["timestamp"][error_rows[first[i]]]),
+                last_occurrence=from_epoch_us(columns["timestamp"][error_rows[last[i]]]),
+                sample_message=self.strings.get(columns["message"][error_rows[first[i]]]),
+            )
+            for i in order
+        ]
+
+        # Stack traces: distinct traces in first-seen order, reduced to patterns
+        traces = columns["stack_trace"][rows]
+        traces = traces[traces != NULL_ID]
+        unique_traces, trace_first = np.unique(traces, return_index=True)
+        patterns: Dict[str, None] = {}
+        for trace_id in unique_traces[np.argsort(trace_first)]:
+            patterns.setdefault(stack_trace_pattern(self.strings.get(trace_id)))
+            if len(patterns) == MAX_STACK_TRACE_PATTERNS:
+                break
+
+        # External systems: messages naming a gateway, grouped by metadata system
+        systems = self._metadata_system[columns["metadata"][rows]]
+        external = self._external_message[columns["message"][rows]] & (systems != NULL_ID)
+        system_ids, system_counts = np.unique(systems[external], return_counts=True)
+        by_count = np.argsort(-system_counts, kind="stable")
+
+        return ErrorPatternStats(
+            error_summary=summaries,
+            stack_trace_patterns=list(patterns),
+            external_system_errors=[
+                ExternalSystemStats(
+                    system=self.systems.get(system_ids[i]), error_count=int(system_counts[i])
+                )
+                for i in by_count
+            ],
+            total_errors=int(np.count_nonzero(levels == _ERROR)),
+            total_warnings=int(np.count_nonzero(levels == _WARN)),
+        )
@@ -0,0 +1,486 @@
+"""
+On-disk segmented log archive for the mock log service
+
+Logs are stored per service as append-only segment files under the archive
+root::
+
+    <root>/<service>/000000.seg   zlib-compressed blocks of log rows
+    <root>/<service>/000000.idx   one fixed-width record per block
+
+A block holds up to ``block_size`` time-sorted rows encoded as a JSON array.
+Its index record keeps the block's offset, length, CRC, row count, min/max
+timestamp and per-level counts, so the sparse time index of a whole service
+stays in memory (52 bytes per block) while the logs stay on disk:
+
+- a window query only reads and decompresses blocks overlapping the window,
+  and stops once the requested page is complete;
+- blocks entirely inside the window are counted from the index alone;
+- decoded blocks are kept in a small LRU cache shared by all services.
+
+Segments roll over at ``segment_max_bytes``. Data is written before its index
+record, so on open a torn index record or unindexed trailing bytes (a crash
+mid-append) are truncated away.
+
+Importers read the JSON scenario format and JSONL (one log object per line)
+in batches of one block::
+
+    python -m app.mock.log_archive ./data/log_archive logs.jsonl --service PaymentService
+"""
+
+import argparse
+import heapq
+import json
+import logging
+import threading
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from app.mock.columnar_store import from_epoch_us, to_epoch_us
+from app.mock.log_index import ErrorPatternAccumulator
+from app.mock.schemas import LOG_LEVELS, LogEntry, ErrorPatternStats
+
+logger = logging.getLogger(__name__)
+
+_LEVEL_CODES = {level: code for code, level in enumerate(LOG_LEVELS)}
+
+# One record per block in the .idx files (little-endian, packed)
+INDEX_DTYPE = np.dtype([
+    ("offset", "<u8"),
+    ("length", "<u4"),
+    ("count", "<u4"),
+    ("crc", "<u4"),
+    ("min_ts", "<i8"),
+    ("max_ts", "<i8"),
+    ("levels", "<u4", (len(LOG_LEVELS),)),
+])
+
+# Row layout inside a block
+Row = List[Any]  # [ts_us, level_code, component, message, error_code, stack_trace, metadata]
+_TS, _LEVEL, _COMPONENT, _MESSAGE, _ERROR_CODE, _STACK_TRACE, _METADATA = range(7)
+
+
+def parse_log_entry(data: Dict[str, Any]) -> LogEntry:
+    """Build a LogEntry from a scenario/JSONL log object"""
+    timestamp = data.get("timestamp")
+    if isinstance(timestamp, str):
+        data = {**data, "timestamp": datetime.fromisoformat(timestamp.replace("Z", "+00:00"))}
+    return LogEntry(**data)
+
+
+def _row(entry: LogEntry) -> Row:
+    return [
+        to_epoch_us(entry.timestamp), _LEVEL_CODES[entry.level], entry.service,
+        entry.message, entry.error_code, entry.stack_trace, entry.metadata or None,
+    ]
+
+
+def _entry(row: Row) -> LogEntry:
+    return LogEntry(
+        timestamp=from_epoch_us(row[_TS]),
+        level=LOG_LEVELS[row[_LEVEL]],
+        service=row[_COMPONENT],
+        message=row[_MESSAGE],
+        error_code=row[_ERROR_CODE],
+        stack_trace=row[_STACK_TRACE],
+        metadata=row[_METADATA],
+    )
+
+
+class BlockCache:
+    """LRU cache of decoded blocks"""
+
+    def __init__(self, max_blocks: int):
+        self.max_blocks = max_blocks
+        self._blocks: "OrderedDict[tuple, List[Row]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[List[Row]]:
+        with self._lock:
+            rows = self._blocks.get(key)
+            if rows is not None:
+                self._blocks.move_to_end(key)
+            return rows
+
+    def put(self, key: tuple, rows: List[Row]) -> None:
+        if self.max_blocks <= 0:
+            return
+        with self._lock:
+            self._blocks[key] = rows
+            self._blocks.move_to_end(key)
+            while len(self._blocks) > self.max_blocks:
+                self._blocks.popitem(last=False)
+
+
+class ServiceArchive:
+    """Segments of one service; same query interface as ServiceLogIndex"""
+
+    def __init__(
+        self,
+        directory: Path,
+        block_size: int,
+        segment_max_bytes: int,
+        cache: BlockCache,
+    ):
+        self.directory = directory
+        self.block_size = block_size
+        self.segment_max_bytes = segment_max_bytes
+        self._cache = cache
+        self._lock = threading.Lock()
+        self._readers: Dict[int, BinaryIO] = {}
+        # Sparse time index: one record per block, and the block's segment
+        self._index = np.empty(0, INDEX_DTYPE)
+        self._segment_of = np.empty(0, np.int32)
+        # Blocks written since the last flush: (segment, record)
+        self._pending: List[Tuple[int, np.ndarray]] = []
+        # Blocks read from disk and decompressed (cache misses)
+        self.blocks_decoded = 0
+
+        directory.mkdir(parents=True, exist_ok=True)
+        segments = sorted(int(path.stem) for path in directory.glob("*.seg"))
+        for segment in segments:
+            records = self._recover(segment)
+            self._index = np.concatenate([self._index, records])
+            self._segment_of = np.concatenate([
+                self._segment_of, np.full(len(records), segment, np.int32)
+            ])
+        self._segment = segments[-1] if segments else 0
+        self._segment_size = self._path(self._segment, ".seg").stat().st_size if segments else 0
+
+    def __len__(self) -> int:
+        self._flush()
+        return int(self._index["count"].sum())
+
+    def _path(self, segment: int, suffix: str) -> Path:
+        return self.directory / f"{segment:06d}{suffix}"
+
+    def _recover(self, segment: int) -> np.ndarray:
+        """Load a segment's index, dropping anything a crash left incomplete"""
+        seg_path, idx_path = self._path(segment, ".seg"), self._path(segment, ".idx")
+        raw = idx_path.read_bytes() if idx_path.exists() else b""
+        records = np.frombuffer(raw, INDEX_DTYPE, len(raw) // INDEX_DTYPE.itemsize).copy()
+
+        seg_size = seg_path.stat().st_size
+        valid = len(records)
+        while valid and int(records[valid - 1]["offset"] + records[valid - 1]["length"]) > seg_size:
+            valid -= 1
+        records = records[:valid]
+        data_end = int(records[-1]["offset"] + records[-1]["length"]) if valid else 0
+
+        if valid * INDEX_DTYPE.itemsize != len(raw) or data_end != seg_size:
+            logger.warning(
+                f"Truncating incomplete log archive segment {seg_path} "
+                f"({valid} blocks, {seg_size - data_end} stray bytes)"
+            )
+            with open(idx_path, "wb") as f:
+                f.write(records.tobytes())
+            with open(seg_path, "r+b") as f:
+                f.truncate(data_end)
+        return records
+
+    def _flush(self) -> None:
+        """Merge index records of newly written blocks"""
+        if not self._pending:
+            return
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._index = np.concatenate([self._index] + [record for _, record in pending])
+            self._segment_of = np.concatenate([
+                self._segment_of, np.array([segment for segment, _ in pending], np.int32)
+            ])
+
+    # --- writes -------------------------------------------------------------
+
+    def extend(self, entries: Iterable[LogEntry]) -> None:
+        """
+        Append entries as blocks of ``block_size`` rows
+
+        Rows are time-sorted within a block (stable); blocks may overlap in
+        time, e.g. when logs arrive out of order.
+        """
+        batch: List[Row] = []
+        with self._lock:
+            for entry in entries:
+                batch.append(_row(entry))
+                if len(batch) == self.block_size:
+                    self._write_block(batch)
+                    batch = []
+            if batch:
+                self._write_block(batch)
+
+    def _write_block(self, rows: List[Row]) -> None:
+        rows.sort(key=lambda row: row[_TS])
+        data = zlib.compress(
+            json.dumps(rows, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        )
+
+        if self._segment_size and self._segment_size + len(data) > self.segment_max_bytes:
+            self._segment += 1
+            self._segment_size = 0
+        segment = self._segment
+
+        record = np.zeros(1, INDEX_DTYPE)
+        record["length"] = len(data)
+        record["count"] = len(rows)
+        record["crc"] = zlib.crc32(data)
+        record["min_ts"] = rows[0][_TS]
+        record["max_ts"] = rows[-1][_TS]
+        record["levels"] = np.bincount([row[_LEVEL] for row in rows], minlength=len(LOG_LEVELS))
+
+        # Data first, then its index record: a crash leaves at most a torn
+        # record or unindexed bytes, both dropped by _recover
+        record["offset"] = self._segment_size
+        with open(self._path(segment, ".seg"), "ab") as f:
+            f.write(data)
+        with open(self._path(segment, ".idx"), "ab") as f:
+            f.write(record.tobytes())
+        self._segment_size += len(data)
+        self._pending.append((segment, record))
+
+    # --- reads --------------------------------------------------------------
+
+    def _block(self, position: int) -> List[Row]:
+        """Decoded rows of a block, by position in the index"""
+        segment = int(self._segment_of[position])
+        record = self._index[position]
+        key = (self.directory, segment, int(record["offset"]))
+        rows = self._cache.get(key)
+        if rows is not None:
+            return rows
+
+        with self._lock:
+            reader = self._readers.get(segment)
+            if reader is None:
+                reader = self._readers[segment] = open(self._path(segment, ".seg"), "rb")
+            reader.seek(int(record["offset"]))
+            data = reader.read(int(record["length"]))
+        if zlib.crc32(data) != int(record["crc"]):
+            raise ValueError(f"Corrupt log block at {key}")
+        rows = json.loads(zlib.decompress(data))
+        self.blocks_decoded += 1
+        self._cache.put(key, rows)
+        return rows
+
+    def _overlapping(self, start: int, end: int, level: Optional[int]) -> np.ndarray:
+        """Positions of blocks that may hold matching rows, in file order"""
+        self._flush()
+        index = self._index
+        mask = (index["min_ts"] <= end) & (index["max_ts"] >= start)
+        if level is not None:
+            mask &= index["levels"][:, level] > 0
+        return np.flatnonzero(mask)
+
+    @staticmethod
+    def _matching(rows: List[Row], start: int, end: int, level: Optional[int]) -> Iterator[Tuple[int, Row]]:
+        for i, row in enumerate(rows):
+            if start <= row[_TS] <= end and (level is None or row[_LEVEL] == level):
+                yield i, row
+
+    def query(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        level: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[LogEntry], int]:
+        """
+        Logs within the time window (inclusive), optionally of one level
+
+        Returns:
+            (at most ``limit`` entries oldest first, total matching count)
+        """
+        if level is not None and level not in _LEVEL_CODES:
+            return [], 0
+        level_code = None if level is None else _LEVEL_CODES[level]
+        start, end = to_epoch_us(start_time), to_epoch_us(end_time)
+        blocks = self._overlapping(start, end, level_code)
+        records = self._index[blocks]
+
+        # Blocks inside the window are counted from the index, edge blocks
+        # have to be decoded
+        inside = (records["min_ts"] >= start) & (records["max_ts"] <= end)
+        counts = records["count"] if level_code is None else records["levels"][:, level_code]
+        total = int(counts[inside].sum())
+        for position in blocks[~inside]:
+            total += sum(1 for _ in self._matching(self._block(position), start, end, level_code))
+
+        # Page: visit blocks by min timestamp and stop once no later block
+        # can hold one of the first ``limit`` rows. Ties keep insertion
+        # order (block position, then row).
+        page: List[Tuple[int, int, int, Row]] = []
+        for position in blocks[np.argsort(records["min_ts"], kind="stable")]:
+            if limit is not None and len(page) >= limit and (
+                not page or self._index[position]["min_ts"] > page[-1][0]
+            ):
+                break
+            page.extend(
+                (row[_TS], int(position), i, row)
+                for i, row in self._matching(self._block(position), start, end, level_code)
+            )
+            page = heapq.nsmallest(limit, page) if limit is not None else page
+        if limit is None:
+            page.sort()
+        return [_entry(row) for *_, row in page], total
+
+    def error_patterns(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        level: Optional[str] = None,
+    ) -> ErrorPatternStats:
+        """
+        Summarise error codes, stack traces and external system errors
+
+        Blocks are decoded one at a time, so memory stays bounded by the
+        block cache however large the window is.
+
+        Args:
+            start_time: Window start (inclusive)
+            end_time: Window end (inclusive)
+            level: Only consider logs of this level
+
+        Returns:
+            Error pattern summary of every log in the window
+        """
+        if level is not None and level not in _LEVEL_CODES:
+            return ErrorPatternStats()
+        level_code = None if level is None else _LEVEL_CODES[level]
+        start, end = to_epoch_us(start_time), to_epoch_us(end_time)
+
+        patterns = ErrorPatternAccumulator()
+        for position in self._overlapping(start, end, level_code):
+            for _, row in self._matching(self._block(position), start, end, level_code):
+                patterns.add(
+                    row[_TS], LOG_LEVELS[row[_LEVEL]], row[_MESSAGE],
+                    row[_ERROR_CODE], row[_STACK_TRACE], row[_METADATA],
+                )
+        return patterns.result(from_epoch_us)
+
+    def close(self) -> None:
+        with self._lock:
+            for reader in self._readers.values():
+                reader.close()
+            self._readers.clear()
+
+
+class LogArchive:
+    """Segmented log archive of all services under one directory"""
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        block_size: int = 1000,
+        segment_max_bytes: int = 64 * 1024 * 1024,
+        cache_blocks: int = 64,
+    ):
+        """
+        Open (or create) a log archive
+
+        Args:
+            root: Archive directory
+            block_size: Rows per compressed block
+            segment_max_bytes: Size at which a new segment file is started
+            cache_blocks: Number of decoded blocks kept in memory
+        """
+        self.root = Path(root)
+        self.block_size = block_size
+        self.segment_max_bytes = segment_max_bytes
+        self._cache = BlockCache(cache_blocks)
+        self._services: Dict[str, ServiceArchive] = {}
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def services(self) -> List[str]:
+        """Services with an archive directory"""
+        return sorted(path.name for path in self.root.iterdir() if path.is_dir())
+
+    def service(self, name: str) -> ServiceArchive:
+        """Archive of one service (created on first use)"""
+        archive = self._services.get(name)
+        if archive is None:
+            if not name or name.startswith(".") or "/" in name or "\\" in name:
+                raise ValueError(f"Invalid service name: {name!r}")
+            archive = self._services[name] = ServiceArchive(
+                self.root / name, self.block_size, self.segment_max_bytes, self._cache
+            )
+        return archive
+
+    def _import(self, logs: Iterable[Tuple[str, LogEntry]]) -> Dict[str, int]:
+        """Append (service, entry) pairs, one block per service at a time"""
+        batches: Dict[str, List[LogEntry]] = {}
+        counts: Dict[str, int] = {}
+        for service, entry in logs:
+            batch = batches.setdefault(service, [])
+            batch.append(entry)
+            if len(batch) == self.block_size:
+                self.service(service).extend(batch)
+                batch.clear()
+            counts[service] = counts.get(service, 0) + 1
+        for service, batch in batches.items():
+            if batch:
+                self.service(service).extend(batch)
+        return counts
+
+    def import_scenario(self, path: Union[str, Path]) -> Dict[str, int]:
+        """
+        Import a JSON scenario file (``{"service": ..., "logs": [...]}``)
+
+        Returns:
+            Number of imported logs per service
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        service = data.get("service")
+        if not service:
+            raise ValueError(f"Scenario without service: {path}")
+        return self._import((service, parse_log_entry(log)) for log in data.get("logs", []))
+
+    def import_jsonl(self, path: Union[str, Path], service: Optional[str] = None) -> Dict[str, int]:
+        """
+        Import a JSONL file with one log object per line, streamed
+
+        Args:
+            path: JSONL file
+            service: Archive all logs under this service (default: each
+                log's own ``service`` field)
+
+        Returns:
+            Number of imported logs per service
+        """
+        def logs() -> Iterator[Tuple[str, LogEntry]]:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = parse_log_entry(json.loads(line))
+                        yield service or entry.service, entry
+
+        return self._import(logs())
+
+    def close(self) -> None:
+        for archive in self._services.values():
+            archive.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Import logs into a mock log archive")
+    parser.add_argument("archive", help="Archive directory")
+    parser.add_argument("files", nargs="+", help="Scenario .json or .jsonl files")
+    parser.add_argument("--service", help="Service for JSONL logs (default: per-log service)")
+    parser.add_argument("--block-size", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    archive = LogArchive(args.archive, block_size=args.block_size)
+    for path in args.files:
+        if path.endswith((".jsonl", ".ndjson")):
+            counts = archive.import_jsonl(path, service=args.service)
+        else:
+            counts = archive.import_scenario(path)
+        print(f"{path}: {counts}")
+    archive.close()
+
+
+if __name__ == "__main__":
+    main()
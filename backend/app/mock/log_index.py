@@ -0,0 +1,257 @@
+"""
+Time-sorted log index for the mock log service
+
+Logs are kept per service, and per (service, level), in lists sorted by
+timestamp. A time window is located with ``bisect`` on a parallel list of
+epoch seconds, so a range query costs O(log n) plus the entries it returns
+(at most ``limit``) regardless of how many logs a service holds.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.mock.schemas import (
+    LogEntry, ErrorCodeStats, ExternalSystemStats, ErrorPatternStats,
+)
+
+# Number of distinct stack trace patterns reported
+MAX_STACK_TRACE_PATTERNS = 10
+
+
+def to_epoch(timestamp: datetime) -> float:
+    """Epoch seconds of a timestamp (naive timestamps are taken as UTC)"""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
+
+
+def is_external_message(message: str) -> bool:
+    """Whether a log message points at an external system"""
+    message = message.lower()
+    return "external" in message or "gateway" in message
+
+
+def stack_trace_pattern(stack_trace: str) -> str:
+    """Main error line of a stack trace"""
+    return stack_trace.split("\n", 1)[0].strip()
+
+
+def external_system(metadata: Optional[Dict[str, Any]]) -> Optional[str]:
+    """External system named in log metadata"""
+    gateway = (metadata or {}).get("gateway")
+    return str(gateway) if gateway else None
+
+
+class ErrorPatternAccumulator:
+    """
+    Error pattern summary built one log at a time
+
+    Logs may be fed in any order: first occurrences are tracked by
+    (timestamp, feed position), so feeding logs in insertion order - or
+    time-sorted - gives the same result as a stable time sort. Memory grows
+    with the number of distinct codes, patterns and systems, not with logs.
+
+    Timestamps only need to be comparable; ``result`` converts them for the
+    report (e.g. epoch microseconds to datetimes).
+    """
+
+    def __init__(self):
+        self._seen = 0
+        self.total_errors = 0
+        self.total_warnings = 0
+        # code -> [count, first (time, seq), sample message, last time]
+        self._codes: Dict[str, list] = {}
+        # pattern -> first (time, seq)
+        self._patterns: Dict[str, Tuple[Any, int]] = {}
+        # system -> [count, first (time, seq)]
+        self._systems: Dict[str, list] = {}
+
+    def add(
+        self,
+        timestamp: Any,
+        level: str,
+        message: str,
+        error_code: Optional[str] = None,
+        stack_trace: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        seen = (timestamp, self._seen)
+        self._seen += 1
+        if level == "ERROR":
+            self.total_errors += 1
+            if error_code:
+                code = self._codes.get(error_code)
+                if code is None:
+                    self._codes[error_code] = [1, seen, message, timestamp]
+                else:
+                    code[0] += 1
+                    if seen < code[1]:
+                        code[1], code[2] = seen, message
+                    if timestamp >= code[3]:
+                        code[3] = timestamp
+        elif level == "WARN":
+            self.total_warnings += 1
+        if stack_trace:
+            pattern = stack_trace_pattern(stack_trace)
+            first = self._patterns.get(pattern)
+            if first is None or seen < first:
+                self._patterns[pattern] = seen
+        system = external_system(metadata)
+        if system and is_external_message(message):
+            counts = self._systems.setdefault(system, [0, seen])
+            counts[0] += 1
+            counts[1] = min(counts[1], seen)
+
+    def result(self, to_datetime: Callable[[Any], datetime] = lambda value: value) -> ErrorPatternStats:
+        """
+        Summary of the logs added so far
+
+        Args:
+            to_datetime: Converts the fed timestamps to datetimes
+
+        Returns:
+            Codes and systems by count (ties by first occurrence), patterns
+            by first occurrence
+        """
+        codes = sorted(self._codes.items(), key=lambda item: (-item[1][0], item[1][1]))
+        systems = sorted(self._systems.items(), key=lambda item: (-item[1][0], item[1][1]))
+        patterns = sorted(self._patterns, key=self._patterns.__getitem__)
+        return ErrorPatternStats(
+            error_summary=[
+                ErrorCodeStats(
+                    error_code=code,
+                    count=count,
+                    first_occurrence=to_datetime(first[0]),
+                    last_occurrence=to_datetime(last),
+                    sample_message=message,
+                )
+                for code, (count, first, message, last) in codes
+            ],
+            stack_trace_patterns=patterns[:MAX_STACK_TRACE_PATTERNS],
+            external_system_errors=[
+                ExternalSystemStats(system=system, error_count=count)
+                for system, (count, _) in systems
+            ],
+            total_errors=self.total_errors,
+            total_warnings=self.total_warnings,
+        )
+
+
+class SortedLogList:
+    """Log entries sorted by timestamp with bisect range lookup"""
+
+    def __init__(self):
+        self._keys: List[float] = []
+        self._entries: List[LogEntry] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def extend(self, entries: Iterable[LogEntry]) -> None:
+        """
+        Add entries, keeping the list sorted
+
+        Entries that arrive in time order (the common case for log files)
+        are appended; otherwise the list is re-sorted once. Equal timestamps
+        keep their insertion order.
+        """
+        added = [(to_epoch(entry.timestamp), entry) for entry in entries]
+        if not added:
+            return
+        in_order = all(added[i][0] <= added[i + 1][0] for i in range(len(added) - 1))
+        if in_order and (not self._keys or self._keys[-1] <= added[0][0]):
+            self._keys.extend(key for key, _ in added)
+            self._entries.extend(entry for _, entry in added)
+            return
+
+        merged = list(zip(self._keys, self._entries))
+        merged.extend(added)
+        merged.sort(key=lambda item: item[0])
+        self._keys = [key for key, _ in merged]
+        self._entries = [entry for _, entry in merged]
+
+    def bounds(self, start: float, end: float) -> Tuple[int, int]:
+        """Index range of entries with start <= timestamp <= end"""
+        return bisect_left(self._keys, start), bisect_right(self._keys, end)
+
+    def range(self, start: float, end: float, limit: Optional[int] = None) -> Tuple[List[LogEntry], int]:
+        """
+        Entries within [start, end], oldest first
+
+        Only the returned slice is materialised; the match count comes from
+        the bounds.
+
+        Returns:
+            (at most ``limit`` entries, total number of matching entries)
+        """
+        lo, hi = self.bounds(start, end)
+        stop = hi if limit is None else min(hi, lo + limit)
+        return self._entries[lo:stop], hi - lo
+
+
+class ServiceLogIndex:
+    """Logs of one service, indexed by time and by (level, time)"""
+
+    def __init__(self):
+        self._all = SortedLogList()
+        self._by_level: Dict[str, SortedLogList] = {}
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def extend(self, entries: Iterable[LogEntry]) -> None:
+        entries = list(entries)
+        self._all.extend(entries)
+        by_level: Dict[str, List[LogEntry]] = {}
+        for entry in entries:
+            by_level.setdefault(entry.level, []).append(entry)
+        for level, level_entries in by_level.items():
+            self._by_level.setdefault(level, SortedLogList()).extend(level_entries)
+
+    def query(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        level: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[LogEntry], int]:
+        """
+        Logs within the time window (inclusive), optionally of one level
+
+        Returns:
+            (at most ``limit`` entries oldest first, total matching count)
+        """
+        if level is None:
+            logs = self._all
+        else:
+            logs = self._by_level.get(level)
+            if logs is None:
+                return [], 0
+        return logs.range(to_epoch(start_time), to_epoch(end_time), limit)
+
+    def error_patterns(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        level: Optional[str] = None,
+    ) -> ErrorPatternStats:
+        """
+        Summarise error codes, stack traces and external system errors
+
+        Args:
+            start_time: Window start (inclusive)
+            end_time: Window end (inclusive)
+            level: Only consider logs of this level
+
+        Returns:
+            Error pattern summary of every log in the window
+        """
+        entries, _ = self.query(start_time, end_time, level=level)
+        patterns = ErrorPatternAccumulator()
+        for entry in entries:
+            patterns.add(
+                entry.timestamp, entry.level, entry.message,
+                entry.error_code, entry.stack_trace, entry.metadata,
+            )
+        return patterns.result()
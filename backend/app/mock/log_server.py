@@ -0,0 +1,57 @@
+"""
+Stub log API server backed by the mock log service
+
+Serves the API ``HttpLogAdapter`` speaks, so the HTTP path can be run
+against local data::
+
+    uvicorn app.mock.log_server:app --port 8001
+    LOG_ADAPTER=http LOG_ADAPTER_URL=http://localhost:8001 uvicorn app.main:app
+
+Endpoints are synchronous and run in the server's thread pool.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from fastapi import FastAPI, HTTPException, Query
+
+from app.mock.log_service import get_mock_log_service
+from app.mock.schemas import ErrorPatternStats, LogLevel, LogQueryParams, LogQueryResult
+
+app = FastAPI(title="Mock Log API", version="0.1.0")
+
+
+@app.get("/logs", response_model=LogQueryResult)
+def query_logs(
+    service: str,
+    start_time: datetime,
+    end_time: datetime,
+    level: Optional[LogLevel] = None,
+    limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = None,
+):
+    """One page of logs, oldest first; follow next_cursor for the rest"""
+    params = LogQueryParams(
+        service=service, start_time=start_time, end_time=end_time, level=level, limit=limit
+    )
+    try:
+        return get_mock_log_service().query_logs(params, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.get("/logs/error-patterns", response_model=ErrorPatternStats)
+def analyze_error_patterns(
+    service: str,
+    start_time: datetime,
+    end_time: datetime,
+    level: Optional[LogLevel] = None,
+):
+    """Error pattern summary over every matching log"""
+    params = LogQueryParams(service=service, start_time=start_time, end_time=end_time, level=level)
+    return get_mock_log_service().analyze_error_patterns(params)
+
+
+@app.get("/health")
+def health():
+    return {"status": "healthy", "services": get_mock_log_service().get_available_services()}
@@ -2,19 +2,32 @@
 Mock Log Service for Issue Solver Agent
 """
 
+import base64
+import hashlib
 import json
 import logging
+import os
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
-from app.mock.schemas import LogEntry, LogQueryParams, LogQueryResult
+from app.config import settings
+from app.mock.columnar_store import ColumnarLogStore, from_epoch_us, to_epoch_us
+from app.mock.log_archive import LogArchive, ServiceArchive, parse_log_entry
+from app.mock.log_index import ServiceLogIndex
+from app.mock.schemas import LogEntry, LogQueryParams, LogQueryResult, ErrorPatternStats
 
 logger = logging.getLogger(__name__)
 
 # Scenario data directory
 SCENARIOS_DIR = Path(__file__).parent / "data" / "scenarios"
 
+# Scenario files imported into a log archive (stored in the archive directory)
+SCENARIO_STATE_FILE = "scenario_state.json"
+
 # Service to scenario mapping
 SERVICE_SCENARIO_MAP = {
     "PaymentService": ["s1_integration_timeout.json", "s4_complex_error.json"],
@@ -24,90 +37,351 @@ SERVICE_SCENARIO_MAP = {
 }
 
 
+LogStore = Union[ServiceLogIndex, ColumnarLogStore, ServiceArchive]
+
+LOG_STORES = {
+    "indexed": ServiceLogIndex,
+    "columnar": ColumnarLogStore,
+    "archive": ServiceArchive,
+}
+
+
+def encode_log_cursor(after_us: int, skip: int, total: int) -> str:
+    """
+    Encode a log page position as an opaque URL-safe cursor
+
+    Args:
+        after_us: Timestamp (epoch microseconds) of the last returned log
+        skip: Number of returned logs with exactly that timestamp
+        total: Total matching logs of the query
+    """
+    payload = json.dumps([after_us, skip, total], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_log_cursor(cursor: str) -> Tuple[int, int, int]:
+    """
+    Decode a cursor produced by encode_log_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        after_us, skip, total = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not all(isinstance(value, int) for value in (after_us, skip, total)) or skip < 1:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return after_us, skip, total
+
+
+class ReadWriteLock:
+    """Many concurrent readers or one writer"""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writing = False
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        with self._condition:
+            while self._writing:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        with self._condition:
+            while self._writing or self._readers:
+                self._condition.wait()
+            self._writing = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+
+@dataclass
+class ScenarioFileState:
+    """What has been loaded from one scenario file"""
+
+    digest: str  # SHA-256 of the file content
+    service: Optional[str]
+    log_digests: Counter  # digest of each log object -> occurrences
+
+    def to_dict(self) -> dict:
+        return {"digest": self.digest, "service": self.service, "log_digests": dict(self.log_digests)}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ScenarioFileState":
+        return cls(data["digest"], data.get("service"), Counter(data["log_digests"]))
+
+
+def _log_digest(log_data: dict) -> str:
+    return hashlib.sha1(
+        json.dumps(log_data, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+
 class MockLogService:
     """Service for querying mock logs"""
 
-    def __init__(self):
-        """Initialize mock log service"""
-        self._logs_cache: dict[str, List[LogEntry]] = {}
+    def __init__(self, store: Optional[str] = None, scenarios_dir: Optional[Path] = None):
+        """
+        Initialize mock log service
+
+        Args:
+            store: Log store type ("indexed", "columnar" or "archive",
+                default: settings.mock_log_store)
+            scenarios_dir: Scenario JSON directory (default: bundled scenarios)
+        """
+        self._scenarios_dir = scenarios_dir or SCENARIOS_DIR
+        store = store or settings.mock_log_store
+        if store not in LOG_STORES:
+            raise ValueError(f"Unknown mock log store: {store}")
+        self._store_class = LOG_STORES[store]
+        self._logs_cache: dict[str, LogStore] = {}
+        self._archive: Optional[LogArchive] = None
+        # Queries share the lock; loads and reloads hold it exclusively
+        self._lock = ReadWriteLock()
+        self._scenario_files: Dict[Path, ScenarioFileState] = {}
+
+        if store == "archive":
+            self._archive = LogArchive(
+                settings.mock_log_archive_path,
+                block_size=settings.mock_log_archive_block_size,
+                segment_max_bytes=settings.mock_log_archive_segment_bytes,
+                cache_blocks=settings.mock_log_archive_cache_blocks,
+            )
+            services = self._archive.services()
+            if services:
+                # Logs persist across restarts; only scenario changes are imported
+                for service in services:
+                    self._logs_cache[service] = self._archive.service(service)
+                logger.info(f"Opened log archive: {settings.mock_log_archive_path} ({len(services)} services)")
+                self._resume_archive()
+                return
+        self._load_scenarios()
+
+    def _resume_archive(self) -> None:
+        """Import scenario files added or changed since the archive was last updated"""
+        states = self._read_scenario_state()
+        if states is None:
+            # Archive built before the state file existed (or by the CLI)
+            logger.warning("Log archive has no scenario state; assuming current scenario files are imported")
+            self._load_scenarios(append=False)
+            return
+
+        self._scenario_files = states
         self._load_scenarios()
+        for path in sorted(set(states) - set(self._scenarios_dir.glob("*.json"))):
+            self.remove_scenario_file(path)
+
+    def _scenario_state_path(self) -> Path:
+        return self._archive.root / SCENARIO_STATE_FILE
 
-    def _load_scenarios(self) -> None:
+    def _read_scenario_state(self) -> Optional[Dict[Path, ScenarioFileState]]:
+        """Per-file state saved with the archive, or None if there is none"""
+        path = self._scenario_state_path()
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        # Keyed by file name, so the scenarios directory can move
+        return {
+            self._scenarios_dir / name: ScenarioFileState.from_dict(state)
+            for name, state in data.items()
+        }
+
+    def _save_scenario_state(self) -> None:
+        """Persist per-file state next to the archive (write lock held)"""
+        path = self._scenario_state_path()
+        data = {
+            file_path.name: state.to_dict()
+            for file_path, state in sorted(self._scenario_files.items())
+        }
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @property
+    def scenarios_dir(self) -> Path:
+        return self._scenarios_dir
+
+    def _load_scenarios(self, append: bool = True) -> None:
         """Load all scenario files into cache"""
-        if not SCENARIOS_DIR.exists():
-            logger.warning(f"Scenarios directory not found: {SCENARIOS_DIR}")
+        if not self._scenarios_dir.exists():
+            logger.warning(f"Scenarios directory not found: {self._scenarios_dir}")
             return
 
-        for scenario_file in SCENARIOS_DIR.glob("*.json"):
+        for scenario_file in sorted(self._scenarios_dir.glob("*.json")):
             try:
-                with open(scenario_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    service = data.get("service")
-                    logs_data = data.get("logs", [])
-
-                    # Parse logs
-                    logs = []
-                    for log_data in logs_data:
-                        # Convert timestamp string to datetime
-                        log_data["timestamp"] = datetime.fromisoformat(
-                            log_data["timestamp"].replace("Z", "+00:00")
-                        )
-                        log = LogEntry(**log_data)
-                        logs.append(log)
-
-                    # Cache by service
-                    if service:
-                        if service not in self._logs_cache:
-                            self._logs_cache[service] = []
-                        self._logs_cache[service].extend(logs)
-
-                logger.info(f"Loaded scenario: {scenario_file.name} ({len(logs)} logs)")
-
+                count = self.load_scenario_file(scenario_file, append=append)
+                logger.info(f"Loaded scenario: {scenario_file.name} ({count} logs)")
             except Exception as e:
                 logger.error(f"Failed to load scenario {scenario_file}: {e}")
 
-    def query_logs(self, params: LogQueryParams) -> LogQueryResult:
+    def load_scenario_file(self, path: Path, append: bool = True) -> int:
         """
-        Query mock logs
+        Load a new or changed scenario file, incrementally
+
+        Only logs that were not loaded from this file before are appended to
+        the service's store. If logs were removed or the file moved to another
+        service, the affected in-memory stores are rebuilt from their files
+        (the on-disk archive is append-only and keeps removed logs).
 
         Args:
-            params: Query parameters
+            path: Scenario JSON file
+            append: False to only record the file as loaded
 
         Returns:
-            Query result with logs
+            Number of logs added to the stores (0 if the file is unchanged)
+
+        Raises:
+            ValueError: If the file is not valid scenario JSON
+        """
+        content = path.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock.write():
+            previous = self._scenario_files.get(path)
+            if previous is not None and previous.digest == digest:
+                return 0
+
+            added = self._apply_scenario_file(path, content, digest, previous, append)
+            if self._archive is not None:
+                # Saved after the logs are archived: a crash in between
+                # imports this file's delta twice rather than losing it
+                self._save_scenario_state()
+            return added
+
+    def _apply_scenario_file(
+        self,
+        path: Path,
+        content: bytes,
+        digest: str,
+        previous: Optional[ScenarioFileState],
+        append: bool,
+    ) -> int:
+        """Load a changed scenario file's delta (write lock held)"""
+        data = json.loads(content)
+        service = data.get("service")
+        logs_data = data.get("logs", [])
+        digests = [_log_digest(log_data) for log_data in logs_data]
+        # Parse before recording the file, so a broken file is retried
+        entries = [parse_log_entry(log_data) for log_data in logs_data]
+        counts = Counter(digests)
+        state = ScenarioFileState(digest, service, counts)
+        if not append:
+            self._scenario_files[path] = state
+            return 0
+
+        loaded = Counter()
+        if previous is not None and previous.service == service:
+            loaded = previous.log_digests
+        if previous is not None and (loaded - counts or previous.service != service):
+            if self._archive is None:
+                self._scenario_files[path] = state
+                for affected in {previous.service, service} - {None}:
+                    self._rebuild_service(affected)
+                return len(entries) if service else 0
+            logger.warning(f"Log archive is append-only; logs removed from {path.name} are kept")
+
+        # Append logs beyond what was loaded before (multiset difference)
+        added = counts - loaded
+        new_entries = []
+        for log_digest, entry in zip(digests, entries):
+            if added[log_digest] > 0:
+                added[log_digest] -= 1
+                new_entries.append(entry)
+        if service and new_entries:
+            self._add_logs(service, new_entries)
+        # Recorded only once the logs are in, so a failed append is retried
+        self._scenario_files[path] = state
+        return len(new_entries) if service else 0
+
+    def remove_scenario_file(self, path: Path) -> None:
+        """Forget a deleted scenario file and drop its logs (in-memory stores)"""
+        with self._lock.write():
+            state = self._scenario_files.pop(path, None)
+            if state is None or not state.service:
+                return
+            if self._archive is not None:
+                logger.warning(f"Log archive is append-only; logs of {path.name} are kept")
+                self._save_scenario_state()
+                return
+            self._rebuild_service(state.service)
+
+    def _rebuild_service(self, service: str) -> None:
+        """Reload a service's store from its scenario files (write lock held)"""
+        store = self._store_class()
+        for path, state in sorted(self._scenario_files.items()):
+            if state.service != service:
+                continue
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            store.extend(parse_log_entry(log_data) for log_data in data.get("logs", []))
+        if len(store):
+            self._logs_cache[service] = store
+        else:
+            self._logs_cache.pop(service, None)
+        logger.info(f"Rebuilt logs of {service} ({len(store)} logs)")
+
+    def query_logs(self, params: LogQueryParams, cursor: Optional[str] = None) -> LogQueryResult:
         """
-        # Get logs for service
-        all_logs = self._logs_cache.get(params.service, [])
-
-        if not all_logs:
-            logger.warning(f"No logs found for service: {params.service}")
-            return LogQueryResult(logs=[], total_count=0, filtered_count=0)
-
-        # Ensure timezone aware comparison
-        start_time = params.start_time
-        end_time = params.end_time
-        if start_time.tzinfo is None:
-            from datetime import timezone
-            start_time = start_time.replace(tzinfo=timezone.utc)
-            end_time = end_time.replace(tzinfo=timezone.utc)
-
-        # Filter by time range
-        filtered_logs = [
-            log for log in all_logs
-            if start_time <= log.timestamp <= end_time
-        ]
-
-        # Filter by level if specified
-        if params.level:
-            filtered_logs = [
-                log for log in filtered_logs
-                if log.level == params.level
-            ]
-
-        total_count = len(filtered_logs)
-
-        # Apply limit
-        limited_logs = filtered_logs[:params.limit]
+        Query mock logs, one page at a time
+
+        Pages are keyed by the timestamp of the last returned log (plus how
+        many logs share it), so following ``next_cursor`` visits every
+        matching log exactly once, oldest first.
+
+        Args:
+            params: Query parameters (limit is the page size)
+            cursor: next_cursor of the previous page (None for the first page)
+
+        Returns:
+            Query result with one page of logs
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        start_time, skip, total_count = params.start_time, 0, None
+        if cursor:
+            after_us, skip, total_count = decode_log_cursor(cursor)
+            start_time = from_epoch_us(after_us)
+
+        with self._lock.read():
+            # Get logs for service
+            store = self._logs_cache.get(params.service)
+
+            if not store:
+                logger.warning(f"No logs found for service: {params.service}")
+                return LogQueryResult(logs=[], total_count=0, filtered_count=0)
+
+            # Time window and level filters are resolved by the store
+            logs, remaining = store.query(
+                start_time, params.end_time, level=params.level, limit=skip + params.limit
+            )
+        limited_logs = logs[skip:]
+        if total_count is None:
+            total_count = remaining
+
+        next_cursor = None
+        if limited_logs and remaining > len(logs):
+            last_us = to_epoch_us(limited_logs[-1].timestamp)
+            same_time = sum(1 for log in logs if to_epoch_us(log.timestamp) == last_us)
+            next_cursor = encode_log_cursor(last_us, same_time, total_count)
 
         logger.info(
             f"Query: service={params.service}, "
@@ -119,16 +393,50 @@ class MockLogService:
         return LogQueryResult(
             logs=limited_logs,
             total_count=total_count,
-            filtered_count=len(limited_logs)
+            filtered_count=len(limited_logs),
+            next_cursor=next_cursor,
         )
 
+    def analyze_error_patterns(self, params: LogQueryParams) -> ErrorPatternStats:
+        """
+        Summarise error patterns over every log matching the query
+
+        Unlike query_logs the result is not limited to one page.
+
+        Args:
+            params: Query parameters (limit is ignored)
+
+        Returns:
+            Error code, stack trace and external system summary
+        """
+        with self._lock.read():
+            store = self._logs_cache.get(params.service)
+            if not store:
+                return ErrorPatternStats()
+            return store.error_patterns(params.start_time, params.end_time, level=params.level)
+
+    def add_logs(self, service: str, logs: List[LogEntry]) -> None:
+        """Add log entries for a service to its store"""
+        with self._lock.write():
+            self._add_logs(service, logs)
+
+    def _add_logs(self, service: str, logs: List[LogEntry]) -> None:
+        if service not in self._logs_cache:
+            if self._archive is not None:
+                self._logs_cache[service] = self._archive.service(service)
+            else:
+                self._logs_cache[service] = self._store_class()
+        self._logs_cache[service].extend(logs)
+
     def get_available_services(self) -> List[str]:
         """Get list of available services"""
         return list(self._logs_cache.keys())
 
     def get_log_count_by_service(self, service: str) -> int:
         """Get total log count for a service"""
-        return len(self._logs_cache.get(service, []))
+        with self._lock.read():
+            store = self._logs_cache.get(service)
+            return len(store) if store else 0
 
 
 _mock_log_service_instance: Optional[MockLogService] = None
@@ -3,15 +3,19 @@ Mock Log Schemas
 """
 
 from datetime import datetime
-from typing import Optional, Dict, Any, Literal
+from typing import Optional, Dict, Any, List, Literal
 from pydantic import BaseModel, Field
 
 
+LogLevel = Literal["DEBUG", "INFO", "WARN", "ERROR"]
+LOG_LEVELS = ("DEBUG", "INFO", "WARN", "ERROR")
+
+
 class LogEntry(BaseModel):
     """Mock log entry"""
 
     timestamp: datetime = Field(..., description="Log timestamp")
-    level: Literal["DEBUG", "INFO", "WARN", "ERROR"] = Field(..., description="Log level")
+    level: LogLevel = Field(..., description="Log level")
     service: str = Field(..., description="Service/module name")
     message: str = Field(..., description="Log message")
     error_code: Optional[str] = Field(None, description="Error code")
@@ -30,7 +34,7 @@ class LogQueryParams(BaseModel):
     service: str = Field(..., description="Service name to query")
     start_time: datetime = Field(..., description="Start time")
     end_time: datetime = Field(..., description="End time")
-    level: Optional[Literal["DEBUG", "INFO", "WARN", "ERROR"]] = Field(None, description="Filter by level")
+    level: Optional[LogLevel] = Field(None, description="Filter by level")
     limit: int = Field(100, description="Max number of logs", ge=1, le=100)
 
 
@@ -40,3 +44,31 @@ class LogQueryResult(BaseModel):
     logs: list[LogEntry] = Field(default_factory=list)
     total_count: int = Field(0, description="Total matching logs")
     filtered_count: int = Field(0, description="Count after limit applied")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page (None on the last page)")
+
+
+class ErrorCodeStats(BaseModel):
+    """Occurrences of one error code"""
+
+    error_code: str
+    count: int
+    first_occurrence: datetime
+    last_occurrence: datetime
+    sample_message: str
+
+
+class ExternalSystemStats(BaseModel):
+    """Errors attributed to one external system"""
+
+    system: str
+    error_count: int
+
+
+class ErrorPatternStats(BaseModel):
+    """Error pattern summary of a log window"""
+
+    error_summary: List[ErrorCodeStats] = Field(default_factory=list)
+    stack_trace_patterns: List[str] = Field(default_factory=list)
+    external_system_errors: List[ExternalSystemStats] = Field(default_factory=list)
+    total_errors: int = 0
+    total_warnings: int = 0
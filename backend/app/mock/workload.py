@@ -0,0 +1,498 @@
+"""
+Synthetic log and VOC workload generator for scale testing
+
+Produces a reproducible large dataset for the mock log service and the RAG
+seed loader:
+
+- logs for every service in ``SERVICE_SCENARIO_MAP``: background traffic
+  with Poisson arrivals, plus incidents - traffic bursts with error logs
+  carrying error codes, stack traces and gateway metadata modelled on the
+  bundled scenarios;
+- VOCs correlated with those incidents (received during or shortly after
+  one, describing its symptoms), plus unrelated improvement requests.
+
+Output layout::
+
+    <output>/logs/<Service>.jsonl     one log object per line (LogArchive.import_jsonl)
+    <output>/scenarios/<Service>.json scenario format (MockLogService(scenarios_dir=...)),
+                                      with ``log_format="scenario"``
+    <output>/vocs.json                seed format (load_seed_data(path)) plus VOCCreate fields
+    <output>/incidents.json           incidents the logs and VOCs were built from
+
+Everything is derived from ``seed``; the same arguments always produce the
+same files. Logs are written one line at a time, so memory does not grow
+with the volume::
+
+    python -m app.mock.workload ./data/workload --logs 2000000 --vocs 5000 --seed 42
+"""
+
+import argparse
+import json
+import logging
+import random
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO, Tuple, Union
+
+from app.mock.log_service import SERVICE_SCENARIO_MAP
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_START = datetime(2024, 1, 15, tzinfo=timezone.utc)
+
+# Share of the log volume per service
+SERVICE_WEIGHTS = {
+    "PaymentService": 0.4,
+    "OrderService": 0.3,
+    "RefundService": 0.2,
+    "MainService": 0.1,
+}
+
+GATEWAYS = ["PaymentGateway", "KCP", "TossPay", "KakaoPay", "NaverPay"]
+
+# service -> [(level, message template, weight)]; {gateway} and {n} are filled in
+BACKGROUND_LOGS = {
+    "PaymentService": [
+        ("INFO", "Payment request initiated", 30),
+        ("INFO", "Calling external payment gateway", 20),
+        ("INFO", "Payment approved", 25),
+        ("DEBUG", "Payment request payload validated", 15),
+        ("WARN", "Gateway response slower than {n}ms", 3),
+        ("ERROR", "Card declined by issuer", 1),
+    ],
+    "OrderService": [
+        ("INFO", "Order created", 30),
+        ("INFO", "Order detail viewed", 30),
+        ("INFO", "Cancel button clicked", 5),
+        ("DEBUG", "Order cache hit", 20),
+        ("WARN", "Order query took {n}ms", 3),
+    ],
+    "RefundService": [
+        ("INFO", "Refund request received", 30),
+        ("INFO", "Refund completed", 25),
+        ("DEBUG", "Refund eligibility checked", 20),
+        ("WARN", "Refund retry scheduled", 2),
+    ],
+    "MainService": [
+        ("INFO", "Page rendered", 40),
+        ("INFO", "User session started", 20),
+        ("DEBUG", "Static asset served", 30),
+    ],
+}
+
+
+@dataclass(frozen=True)
+class IncidentKind:
+    """Error pattern of one incident type and the VOCs it causes"""
+
+    service: str
+    error_code: str
+    message: str
+    problem_type: str
+    affected_system: str
+    voc_texts: Tuple[str, ...]
+    summary: str
+    resolution: str
+    stack_trace: Optional[str] = None
+    # Follow-up line logged after an error
+    follow_up: Optional[str] = None
+    uses_gateway: bool = False
+
+
+INCIDENT_KINDS = {
+    "gateway_timeout": IncidentKind(
+        service="PaymentService",
+        error_code="EXTERNAL_TIMEOUT",
+        message="External API timeout: {gateway} did not respond within threshold",
+        follow_up="Payment marked as failed due to gateway timeout",
+        uses_gateway=True,
+        problem_type="integration_error",
+        affected_system="결제 게이트웨이",
+        voc_texts=(
+            "결제하려고 했는데 한참 기다리다가 결제 실패라고 나와요.",
+            "결제 버튼 누르고 1분 넘게 로딩만 돌다가 오류가 났어요. 카드는 정상이라고 합니다.",
+            "결제가 계속 실패해요. '결제 처리 중 오류가 발생했습니다'라고만 나옵니다.",
+        ),
+        summary="결제 시 게이트웨이 응답 지연으로 결제 실패",
+        resolution="PG사 응답 타임아웃 확인. PG사 측 장애 복구 후 정상화됨.",
+    ),
+    "gateway_error": IncidentKind(
+        service="PaymentService",
+        error_code="GATEWAY_ERROR",
+        message="External gateway returned error response: {gateway} HTTP 502",
+        uses_gateway=True,
+        problem_type="integration_error",
+        affected_system="결제 시스템",
+        voc_texts=(
+            "간편결제로 결제했는데 결제사에서는 승인됐다는데 주문은 실패로 나와요.",
+            "결제 수단 선택 후 바로 오류 화면이 떠요. 다른 결제 수단은 괜찮아요.",
+        ),
+        summary="간편결제 게이트웨이 오류 응답으로 결제 실패",
+        resolution="결제사 API 오류 응답 확인. 결제사 조치 후 상태 동기화 진행.",
+    ),
+    "unhandled_exception": IncidentKind(
+        service="PaymentService",
+        error_code="UNHANDLED_EXCEPTION",
+        message="Unhandled exception while processing gateway response",
+        stack_trace=(
+            "java.lang.IllegalStateException: Unexpected response format\n"
+            "\tat com.example.PaymentService.handleGatewayResponse(PaymentService.java:200)\n"
+            "\tat com.example.PaymentController.pay(PaymentController.java:87)"
+        ),
+        problem_type="code_error",
+        affected_system="결제 시스템",
+        voc_texts=(
+            "결제 완료 화면에서 갑자기 오류 페이지가 나왔어요. 결제가 된 건지 모르겠어요.",
+            "결제는 됐다고 문자가 왔는데 주문 내역에는 없어요.",
+        ),
+        summary="결제 응답 처리 중 예외 발생으로 주문 상태 불일치",
+        resolution="게이트웨이 응답 파싱 예외 처리 누락 수정. 영향 주문 상태 보정.",
+    ),
+    "refund_npe": IncidentKind(
+        service="RefundService",
+        error_code="NPE_ERROR",
+        message="NullPointerException while processing refund",
+        stack_trace=(
+            "java.lang.NullPointerException\n"
+            "\tat com.example.RefundService.processRefund(RefundService.java:142)\n"
+            "\tat com.example.RefundController.handleRefund(RefundController.java:58)"
+        ),
+        problem_type="code_error",
+        affected_system="환불 시스템",
+        voc_texts=(
+            "환불 신청 버튼을 누르면 오류가 나요. 몇 번을 해도 똑같아요.",
+            "환불 요청했는데 '일시적인 오류'라고만 나오고 진행이 안 돼요.",
+        ),
+        summary="환불 신청 시 서버 오류로 환불 진행 불가",
+        resolution="환불 처리 로직 null 체크 누락 수정. 실패한 환불 요청 재처리.",
+    ),
+    "order_db_timeout": IncidentKind(
+        service="OrderService",
+        error_code="DB_TIMEOUT",
+        message="Database query timeout while loading order history",
+        stack_trace=(
+            "java.sql.SQLTimeoutException: Query timed out\n"
+            "\tat com.example.OrderRepository.findByUser(OrderRepository.java:77)\n"
+            "\tat com.example.OrderService.history(OrderService.java:120)"
+        ),
+        follow_up="Order history request failed",
+        problem_type="code_error",
+        affected_system="주문 관리 시스템",
+        voc_texts=(
+            "주문 내역 페이지가 안 열려요. 계속 로딩만 돼요.",
+            "지난달 주문이 목록에서 안 보여요. 새로고침해도 안 나와요.",
+        ),
+        summary="주문 내역 조회 지연 및 실패",
+        resolution="주문 내역 조회 쿼리 인덱스 추가. 타임아웃 해소 확인.",
+    ),
+}
+
+# VOCs not caused by an incident
+IMPROVEMENT_VOCS = [
+    ("OrderService", "주문 취소 버튼을 찾기가 너무 어려워요. 어디 있나요?",
+     "주문 취소 버튼 위치 안내 요청", "주문 관리 시스템", "UX 개선 백로그 등록"),
+    ("MainService", "상품 검색 결과에 관련 없는 상품이 먼저 나와요.",
+     "검색 결과 정확도 개선 요청", "검색 시스템", "검색 랭킹 개선 백로그 등록"),
+    ("RefundService", "환불이 언제 처리되는지 안내가 없어서 답답해요.",
+     "환불 진행 상태 안내 부족", "환불 시스템", "환불 상태 알림 개선 백로그 등록"),
+]
+
+SURNAMES = "김이박최정강조윤장임"
+GIVEN_NAMES = ["민준", "서연", "도윤", "지우", "하준", "서윤", "은우", "지민", "예준", "수아"]
+
+
+@dataclass
+class Incident:
+    """One error burst of one service"""
+
+    incident_id: str
+    kind: str
+    service: str
+    start: datetime
+    end: datetime
+    gateway: Optional[str] = None
+    # Probability that a log line during the incident is one of its errors
+    error_rate: float = 0.3
+    # Log rate during the incident relative to normal traffic (retries, errors)
+    burst: float = 5.0
+
+    def to_json(self) -> Dict[str, Any]:
+        return {**asdict(self), "start": _iso(self.start), "end": _iso(self.end)}
+
+
+def _iso(timestamp: datetime) -> str:
+    return timestamp.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def plan_incidents(
+    rng: random.Random,
+    count: int,
+    start: datetime,
+    duration: timedelta,
+) -> List[Incident]:
+    """Incidents spread over the window, each lasting 1-20 minutes"""
+    incidents = []
+    kinds = sorted(INCIDENT_KINDS)
+    for i in range(count):
+        kind = rng.choice(kinds)
+        length = timedelta(seconds=rng.uniform(60, 1200))
+        begin = start + rng.random() * max(duration - length, timedelta(0))
+        incidents.append(Incident(
+            incident_id=f"INC-{i + 1:04d}",
+            kind=kind,
+            service=INCIDENT_KINDS[kind].service,
+            start=begin,
+            end=begin + length,
+            gateway=rng.choice(GATEWAYS) if INCIDENT_KINDS[kind].uses_gateway else None,
+            error_rate=round(rng.uniform(0.1, 0.6), 2),
+            burst=round(rng.uniform(3, 10), 1),
+        ))
+    incidents.sort(key=lambda incident: incident.start)
+    return incidents
+
+
+def generate_service_logs(
+    out: TextIO,
+    service: str,
+    count: int,
+    incidents: List[Incident],
+    start: datetime,
+    duration: timedelta,
+    seed: int,
+    separator: str = "\n",
+) -> int:
+    """
+    Write ``count`` time-ordered logs of one service as JSON objects
+
+    Args:
+        out: Text stream
+        service: Service name
+        count: Number of log lines
+        incidents: Incidents of this service
+        start: First timestamp
+        duration: Time span of the logs
+        seed: Random seed
+        separator: Written between objects
+
+    Returns:
+        Number of lines written
+    """
+    rng = random.Random(f"{seed}:{service}")
+    templates = BACKGROUND_LOGS[service]
+    weights = [weight for *_, weight in templates]
+    # Background gap such that the logs, bursts included, span the window
+    burst_seconds = sum(
+        (incident.burst - 1) * (incident.end - incident.start).total_seconds()
+        for incident in incidents
+    )
+    mean_gap = (duration.total_seconds() + burst_seconds) / max(count, 1)
+    incidents = sorted(incidents, key=lambda incident: incident.start)
+
+    now = start
+    written = 0
+    active = 0  # first incident that has not ended yet
+    incident: Optional[Incident] = None
+    while written < count:
+        rate = incident.burst / mean_gap if incident else 1 / mean_gap
+        now += timedelta(seconds=rng.expovariate(rate))
+        while active < len(incidents) and incidents[active].end < now:
+            active += 1
+        incident = None
+        for candidate in incidents[active:]:
+            if candidate.start > now:
+                break
+            if now <= candidate.end:
+                incident = candidate
+                break
+
+        request_id = f"REQ-{rng.randrange(16 ** 8):08x}"
+        if incident is not None and rng.random() < incident.error_rate:
+            kind = INCIDENT_KINDS[incident.kind]
+            metadata: Dict[str, Any] = {"request_id": request_id, "incident_id": incident.incident_id}
+            if incident.gateway:
+                metadata.update(gateway=incident.gateway, duration_ms=rng.randrange(5000, 30000))
+            error = {
+                "level": "ERROR",
+                "message": kind.message.format(gateway=incident.gateway),
+                "error_code": kind.error_code,
+                "metadata": metadata,
+            }
+            if kind.stack_trace:
+                error["stack_trace"] = kind.stack_trace
+            lines = [error]
+            if kind.follow_up:
+                lines.append({"level": "WARN", "message": kind.follow_up, "metadata": {"request_id": request_id}})
+        else:
+            level, message, _ = rng.choices(templates, weights)[0]
+            metadata = {"request_id": request_id}
+            if "gateway" in message:
+                metadata["gateway"] = rng.choice(GATEWAYS)
+            lines = [{
+                "level": level,
+                "message": message.format(n=rng.randrange(500, 5000)),
+                "metadata": metadata,
+            }]
+
+        for line in lines[:count - written]:
+            if written:
+                out.write(separator)
+            out.write(json.dumps(
+                {"timestamp": _iso(now), "service": service, **line}, ensure_ascii=False
+            ))
+            written += 1
+    return written
+
+
+def generate_vocs(
+    rng: random.Random,
+    count: int,
+    incidents: List[Incident],
+    start: datetime,
+    duration: timedelta,
+    incident_ratio: float = 0.8,
+) -> List[Dict[str, Any]]:
+    """
+    VOCs in seed format, mostly reporting one of the incidents
+
+    Besides the ``load_seed_data`` fields each VOC carries ``customer_name``,
+    ``channel`` and ``received_at`` (``VOCCreate``) and the ``service`` and
+    ``incident_id`` it relates to.
+    """
+    vocs = []
+    for _ in range(count):
+        incident = rng.choice(incidents) if incidents and rng.random() < incident_ratio else None
+        if incident is not None:
+            kind = INCIDENT_KINDS[incident.kind]
+            received_at = incident.start + timedelta(
+                seconds=rng.uniform(0, (incident.end - incident.start).total_seconds() + 7200)
+            )
+            voc = {
+                "raw_voc": rng.choice(kind.voc_texts),
+                "summary": kind.summary,
+                "problem_type_primary": kind.problem_type,
+                "affected_system": kind.affected_system,
+                "resolution": kind.resolution,
+                "service": incident.service,
+                "incident_id": incident.incident_id,
+            }
+        else:
+            service, text, summary, system, resolution = rng.choice(IMPROVEMENT_VOCS)
+            received_at = start + rng.random() * duration
+            voc = {
+                "raw_voc": text,
+                "summary": summary,
+                "problem_type_primary": "business_improvement",
+                "affected_system": system,
+                "resolution": resolution,
+                "service": service,
+                "incident_id": None,
+            }
+        vocs.append({
+            "ticket_id": None,
+            "raw_voc": voc.pop("raw_voc"),
+            "summary": voc.pop("summary"),
+            "problem_type_primary": voc.pop("problem_type_primary"),
+            "problem_type_secondary": None,
+            "affected_system": voc.pop("affected_system"),
+            "resolution": voc.pop("resolution"),
+            "confidence": round(rng.uniform(0.7, 0.98), 2),
+            "customer_name": rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES),
+            "channel": rng.choice(["email", "slack"]),
+            "received_at": _iso(received_at),
+            **voc,
+        })
+    vocs.sort(key=lambda voc: voc["received_at"])
+    for i, voc in enumerate(vocs):
+        voc["ticket_id"] = f"GEN-{i + 1:06d}"
+    return vocs
+
+
+def generate_workload(
+    output_dir: Union[str, Path],
+    log_count: int = 1_000_000,
+    voc_count: int = 1000,
+    incident_count: int = 20,
+    seed: int = 0,
+    start: datetime = DEFAULT_START,
+    days: float = 1.0,
+    log_format: str = "jsonl",
+) -> Dict[str, Any]:
+    """
+    Generate logs, incidents and VOCs into a directory
+
+    Args:
+        output_dir: Output directory (created if missing)
+        log_count: Total log lines across all services
+        voc_count: Number of VOCs
+        incident_count: Number of incidents
+        seed: Random seed; equal arguments give identical files
+        start: Start of the log window
+        days: Length of the log window
+        log_format: "jsonl" (logs/<Service>.jsonl) or "scenario"
+            (scenarios/<Service>.json)
+
+    Returns:
+        Log counts per service, number of VOCs and incidents
+    """
+    if log_format not in ("jsonl", "scenario"):
+        raise ValueError(f"Unknown log format: {log_format}")
+    output_dir = Path(output_dir)
+    duration = timedelta(days=days)
+    rng = random.Random(seed)
+    incidents = plan_incidents(rng, incident_count, start, duration)
+
+    services = sorted(SERVICE_SCENARIO_MAP)
+    total_weight = sum(SERVICE_WEIGHTS.get(service, 0.1) for service in services)
+    counts = {
+        service: int(log_count * SERVICE_WEIGHTS.get(service, 0.1) / total_weight)
+        for service in services
+    }
+    counts[services[0]] += log_count - sum(counts.values())
+
+    log_dir = output_dir / ("logs" if log_format == "jsonl" else "scenarios")
+    log_dir.mkdir(parents=True, exist_ok=True)
+    for service in services:
+        service_incidents = [incident for incident in incidents if incident.service == service]
+        suffix = ".jsonl" if log_format == "jsonl" else ".json"
+        with open(log_dir / f"{service}{suffix}", "w", encoding="utf-8") as f:
+            if log_format == "jsonl":
+                generate_service_logs(f, service, counts[service], service_incidents, start, duration, seed)
+                f.write("\n")
+            else:
+                header = {"scenario_id": f"GEN-{service}", "description": "Synthetic workload", "service": service}
+                f.write(json.dumps(header, ensure_ascii=False)[:-1] + ', "logs": [\n')
+                generate_service_logs(
+                    f, service, counts[service], service_incidents, start, duration, seed, separator=",\n"
+                )
+                f.write("\n]}\n")
+        logger.info(f"Generated {counts[service]} logs for {service}")
+
+    vocs = generate_vocs(rng, voc_count, incidents, start, duration)
+    with open(output_dir / "vocs.json", "w", encoding="utf-8") as f:
+        json.dump(vocs, f, ensure_ascii=False, indent=2)
+    with open(output_dir / "incidents.json", "w", encoding="utf-8") as f:
+        json.dump([incident.to_json() for incident in incidents], f, ensure_ascii=False, indent=2)
+
+    return {"logs": counts, "vocs": len(vocs), "incidents": len(incidents)}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic log and VOC workload")
+    parser.add_argument("output", help="Output directory")
+    parser.add_argument("--logs", type=int, default=1_000_000, help="Total log lines")
+    parser.add_argument("--vocs", type=int, default=1000, help="Number of VOCs")
+    parser.add_argument("--incidents", type=int, default=20, help="Number of incidents")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--days", type=float, default=1.0, help="Length of the log window")
+    parser.add_argument("--format", choices=["jsonl", "scenario"], default="jsonl", dest="log_format")
+    args = parser.parse_args(argv)
+
+    print(generate_workload(
+        args.output, args.logs, args.vocs, args.incidents, args.seed, days=args.days,
+        log_format=args.log_format,
+    ))
+
+
+if __name__ == "__main__":
+    main()
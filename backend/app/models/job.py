@@ -0,0 +1,43 @@
+"""
+Analysis job database model
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, Text, Enum as SQLEnum
+from sqlalchemy.sql import func
+import enum
+
+from app.database import Base
+
+
+class JobStatus(str, enum.Enum):
+    """Analysis job status enum"""
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+
+class AnalysisJob(Base):
+    """Persistent analysis job (normalization + solver) for a ticket"""
+
+    __tablename__ = "analysis_jobs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    ticket_id = Column(String(50), nullable=False, index=True)
+    status = Column(SQLEnum(JobStatus), nullable=False, default=JobStatus.PENDING, index=True)
+
+    # Retry bookkeeping
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    available_at = Column(DateTime(timezone=True), nullable=False)
+    last_error = Column(Text, nullable=True)
+
+    # Lease held by the worker currently running the job
+    locked_by = Column(String(100), nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<AnalysisJob {self.id} {self.ticket_id} ({self.status})>"
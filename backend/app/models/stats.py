@@ -0,0 +1,40 @@
+"""
+Ticket statistics database model
+"""
+
+from sqlalchemy import Column, Date, Integer, String, Enum as SQLEnum
+
+from app.database import Base
+from app.models.ticket import TicketStatus
+
+# Urgency bucket for tickets that have not been normalized yet
+URGENCY_UNSET = "unset"
+
+# Primary key of the single ticket_changes row
+TICKET_CHANGES_ID = 1
+
+
+class TicketStat(Base):
+    """Number of tickets per (creation day, status, urgency)"""
+
+    __tablename__ = "ticket_stats"
+
+    day = Column(Date, primary_key=True)
+    status = Column(SQLEnum(TicketStatus), primary_key=True)
+    urgency = Column(String(10), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<TicketStat {self.day} {self.status} {self.urgency}={self.count}>"
+
+
+class TicketChanges(Base):
+    """Table-wide ticket change counter (a single row)"""
+
+    __tablename__ = "ticket_changes"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<TicketChanges version={self.version}>"
@@ -3,8 +3,8 @@ Ticket database model
 """
 
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Text, Float, JSON, Enum as SQLEnum
-from sqlalchemy.sql import func
+from sqlalchemy import Column, String, DateTime, Text, Float, JSON, Index, DDL, event, Enum as SQLEnum
+from sqlalchemy.sql import func, text
 import enum
 
 from app.database import Base
@@ -33,16 +33,48 @@ class Urgency(str, enum.Enum):
     HIGH = "high"
 
 
+# Statuses shown in the admin work queue (covered by a partial index)
+ACTIVE_STATUSES = (
+    TicketStatus.OPEN,
+    TicketStatus.ANALYZING,
+    TicketStatus.WAITING_CONFIRM,
+)
+_ACTIVE_STATUS_CLAUSE = "status IN ({})".format(
+    ", ".join(f"'{s.name}'" for s in ACTIVE_STATUSES)
+)
+
+
 class Ticket(Base):
     """Ticket model"""
 
     __tablename__ = "tickets"
+    __table_args__ = (
+        # Admin list queries: filter, then walk created_at DESC (ticket_id as tie-breaker)
+        Index("ix_tickets_created_at_ticket_id", "created_at", "ticket_id"),
+        Index("ix_tickets_status_created_at", "status", "created_at", "ticket_id"),
+        Index("ix_tickets_urgency_created_at", "urgency", "created_at", "ticket_id"),
+        Index(
+            "ix_tickets_active_created_at",
+            "created_at",
+            "ticket_id",
+            sqlite_where=text(_ACTIVE_STATUS_CLAUSE),
+            postgresql_where=text(_ACTIVE_STATUS_CLAUSE),
+        ),
+    )
 
     # Basic info
-    ticket_id = Column(String(50), primary_key=True, index=True)
-    status = Column(SQLEnum(TicketStatus), nullable=False, default=TicketStatus.OPEN, index=True)
+    ticket_id = Column(String(50), primary_key=True)
+    status = Column(SQLEnum(TicketStatus), nullable=False, default=TicketStatus.OPEN)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    # Set Python-side on insert and update: one sub-second format for ETags and
+    # ordering (server_default only covers rows inserted outside the ORM)
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=datetime.utcnow,
+        nullable=False,
+    )
     assignee = Column(String(100), nullable=True)
 
     # VOC input info
@@ -56,7 +88,7 @@ class Ticket(Base):
     suspected_type_primary = Column(String(50), nullable=True)
     suspected_type_secondary = Column(String(50), nullable=True)
     affected_system = Column(String(100), nullable=True)
-    urgency = Column(SQLEnum(Urgency), nullable=True, index=True)
+    urgency = Column(SQLEnum(Urgency), nullable=True)
 
     # Agent analysis result
     agent_decision_primary = Column(String(50), nullable=True)
@@ -73,3 +105,38 @@ class Ticket(Base):
 
     def __repr__(self):
         return f"<Ticket {self.ticket_id} ({self.status})>"
+
+
+# Full-text index over the VOC text (SQLite FTS5)
+#
+# ticket_fts holds a copy of the searchable columns keyed by ticket_id and is
+# kept in sync by triggers, so Core UPDATEs are covered too. The trigram
+# tokenizer gives substring matching, which suits Korean text where
+# particles are attached to the word ("결제가", "결제를").
+TICKET_FTS_COLUMNS = ("raw_voc", "summary", "manual_resolution")
+
+TICKET_FTS_CREATE = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS ticket_fts USING fts5("
+    "ticket_id UNINDEXED, raw_voc, summary, manual_resolution, tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS tickets_fts_insert AFTER INSERT ON tickets BEGIN "
+    "INSERT INTO ticket_fts (ticket_id, raw_voc, summary, manual_resolution) "
+    "VALUES (new.ticket_id, new.raw_voc, new.summary, new.manual_resolution); END",
+    "CREATE TRIGGER IF NOT EXISTS tickets_fts_update "
+    "AFTER UPDATE OF raw_voc, summary, manual_resolution ON tickets BEGIN "
+    "UPDATE ticket_fts SET raw_voc = new.raw_voc, summary = new.summary, "
+    "manual_resolution = new.manual_resolution WHERE ticket_id = old.ticket_id; END",
+    "CREATE TRIGGER IF NOT EXISTS tickets_fts_delete AFTER DELETE ON tickets BEGIN "
+    "DELETE FROM ticket_fts WHERE ticket_id = old.ticket_id; END",
+]
+
+TICKET_FTS_DROP = [
+    "DROP TRIGGER IF EXISTS tickets_fts_delete",
+    "DROP TRIGGER IF EXISTS tickets_fts_update",
+    "DROP TRIGGER IF EXISTS tickets_fts_insert",
+    "DROP TABLE IF EXISTS ticket_fts",
+]
+
+for _statement in TICKET_FTS_CREATE:
+    event.listen(Ticket.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+for _statement in TICKET_FTS_DROP:
+    event.listen(Ticket.__table__, "before_drop", DDL(_statement).execute_if(dialect="sqlite"))
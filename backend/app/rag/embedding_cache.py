@@ -0,0 +1,185 @@
+"""
+Embedding cache
+
+Persistent cache of text embeddings, keyed by (model name, SHA-256 of text)
+and stored as float32 blobs in a local SQLite file. The same VOC text is
+embedded for the similarity query, for indexing and again on every seed
+reload; with the cache each distinct text is encoded once per model.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+import numpy as np
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """SQLite-backed embedding cache with LRU eviction"""
+
+    def __init__(
+        self,
+        model_name: str,
+        path: Optional[str] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.model_name = model_name
+        self.path = path or settings.embedding_cache_path
+        self.max_entries = max_entries or settings.embedding_cache_max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        self._invalidate_other_models()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database and create the table if needed"""
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                model TEXT NOT NULL,
+                key TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                last_accessed REAL NOT NULL,
+                PRIMARY KEY (model, key)
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_embedding_cache_last_accessed "
+            "ON embedding_cache (last_accessed)"
+        )
+        conn.commit()
+        return conn
+
+    def _invalidate_other_models(self) -> None:
+        """Drop vectors produced by a different embedding model"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM embedding_cache WHERE model != ?", (self.model_name,)
+            )
+            self._conn.commit()
+        if cursor.rowcount:
+            logger.info(
+                f"Invalidated {cursor.rowcount} cached embeddings from other models"
+            )
+
+    @staticmethod
+    def make_key(text: str) -> str:
+        """Build the content hash for a text"""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get_many(self, texts: List[str]) -> Dict[str, List[float]]:
+        """
+        Look up cached vectors
+
+        Returns:
+            Mapping of text to vector for every cache hit
+        """
+        keys = {self.make_key(text): text for text in texts}
+        if not keys:
+            return {}
+
+        now = time.time()
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            key_list = list(keys)
+            # Stay below SQLite's bound-parameter limit
+            for i in range(0, len(key_list), 500):
+                chunk = key_list[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embedding_cache "
+                    f"WHERE model = ? AND key IN ({placeholders})",
+                    (self.model_name, *chunk),
+                ).fetchall()
+                for key, blob in rows:
+                    found[keys[key]] = np.frombuffer(blob, dtype=np.float32).tolist()
+
+                hit_keys = [key for key, _ in rows]
+                if hit_keys:
+                    self._conn.executemany(
+                        "UPDATE embedding_cache SET last_accessed = ? WHERE model = ? AND key = ?",
+                        [(now, self.model_name, key) for key in hit_keys],
+                    )
+            self._conn.commit()
+
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def set_many(self, items: Dict[str, List[float]]) -> None:
+        """Store vectors and evict least recently used entries"""
+        if not items:
+            return
+
+        now = time.time()
+        rows = [
+            (
+                self.model_name,
+                self.make_key(text),
+                np.asarray(vector, dtype=np.float32).tobytes(),
+                now,
+            )
+            for text, vector in items.items()
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (model, key, vector, last_accessed) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Trim to max_entries (caller holds the lock)"""
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            cursor = self._conn.execute(
+                "DELETE FROM embedding_cache WHERE rowid IN ("
+                "SELECT rowid FROM embedding_cache ORDER BY last_accessed LIMIT ?)",
+                (overflow,),
+            )
+            self.evictions += cursor.rowcount
+
+    def clear(self) -> None:
+        """Delete all cached vectors"""
+        with self._lock:
+            self._conn.execute("DELETE FROM embedding_cache")
+            self._conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            (entries,) = self._conn.execute(
+                "SELECT COUNT(*) FROM embedding_cache"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "model": self.model_name,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
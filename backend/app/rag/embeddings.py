@@ -2,22 +2,113 @@
 Embedding service using sentence-transformers
 """
 
+import asyncio
 import logging
-from typing import List, Optional
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Tuple
 from functools import lru_cache
 
 from sentence_transformers import SentenceTransformer
 
 from app.config import settings
+from app.rag.embedding_cache import EmbeddingCache
 
 logger = logging.getLogger(__name__)
 
 
+class EmbeddingBatcher:
+    """
+    Micro-batching executor for embedding requests
+
+    A dedicated thread owns the model's ``encode`` call. Requests submitted
+    from any thread or from the event loop are queued; the thread collects
+    them for up to ``max_wait_seconds`` (or until ``max_batch_size`` texts
+    are waiting) and encodes them in a single call.
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[List[str]], List[List[float]]],
+        max_batch_size: int,
+        max_wait_seconds: float,
+    ):
+        self._encode = encode
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.batches = 0
+
+        self._queue: "queue.Queue[Tuple[List[str], Future]]" = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="embedding-batcher", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, texts: List[str]) -> Future:
+        """Queue texts for encoding; the future resolves to their vectors"""
+        future: Future = Future()
+        self._queue.put((texts, future))
+        return future
+
+    def _get(self, timeout: Optional[float] = None) -> Tuple[List[str], Future]:
+        """Dequeue the next request whose caller is still waiting"""
+        while True:
+            texts, future = self._queue.get(timeout=timeout)
+            # Claims the future: a caller cancelling from now on is a no-op,
+            # so setting the result later cannot raise InvalidStateError
+            if future.set_running_or_notify_cancel():
+                return texts, future
+
+    def _collect(self) -> List[Tuple[List[str], Future]]:
+        """Block for the first request, then gather more until full or timed out"""
+        batch = [self._get()]
+        size = len(batch[0][0])
+        deadline = time.monotonic() + self.max_wait_seconds
+        while size < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(item)
+            size += len(item[0])
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self._dispatch(self._collect())
+            except Exception as e:
+                # Never let the thread die: later requests would hang forever
+                logger.error(f"Embedding batch dispatch failed: {e}")
+
+    def _dispatch(self, batch: List[Tuple[List[str], Future]]) -> None:
+        texts = [text for item_texts, _ in batch for text in item_texts]
+        try:
+            vectors = self._encode(texts)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        self.batches += 1
+        offset = 0
+        for item_texts, future in batch:
+            future.set_result(vectors[offset:offset + len(item_texts)])
+            offset += len(item_texts)
+
+
 class EmbeddingService:
     """Service for generating text embeddings"""
 
     _instance: Optional["EmbeddingService"] = None
     _model: Optional[SentenceTransformer] = None
+    _batcher: Optional[EmbeddingBatcher] = None
+    _cache: Optional[EmbeddingCache] = None
 
     def __new__(cls) -> "EmbeddingService":
         if cls._instance is None:
@@ -33,18 +124,39 @@ class EmbeddingService:
         logger.info(f"Loading embedding model: {settings.embedding_model}")
         try:
             self._model = SentenceTransformer(settings.embedding_model)
+            if settings.embedding_cache_enabled:
+                self._cache = EmbeddingCache(model_name=settings.embedding_model)
+            self._batcher = EmbeddingBatcher(
+                encode=self._encode,
+                max_batch_size=settings.embedding_batch_size,
+                max_wait_seconds=settings.embedding_batch_max_wait_ms / 1000,
+            )
             logger.info("Embedding model loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load embedding model: {e}")
             raise
 
+    def _encode(self, texts: List[str]) -> List[List[float]]:
+        """Encode a batch of texts (runs on the batcher thread)"""
+        if self._cache is None:
+            return self._model.encode(texts, convert_to_numpy=True).tolist()
+
+        vectors = self._cache.get_many(texts)
+        missing = list(dict.fromkeys(t for t in texts if t not in vectors))
+        if missing:
+            embeddings = self._model.encode(missing, convert_to_numpy=True).tolist()
+            encoded = dict(zip(missing, embeddings))
+            self._cache.set_many(encoded)
+            vectors.update(encoded)
+
+        return [vectors[t] for t in texts]
+
     def embed_text(self, text: str) -> List[float]:
         """Generate embedding for a single text"""
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
 
-        embedding = self._model.encode(text, convert_to_numpy=True)
-        return embedding.tolist()
+        return self._batcher.submit([text]).result()[0]
 
     def embed_texts(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings for multiple texts"""
@@ -56,8 +168,26 @@ class EmbeddingService:
         if not valid_texts:
             raise ValueError("All texts are empty")
 
-        embeddings = self._model.encode(valid_texts, convert_to_numpy=True)
-        return embeddings.tolist()
+        return self._batcher.submit(valid_texts).result()
+
+    async def aembed_text(self, text: str) -> List[float]:
+        """Generate embedding for a single text without blocking the event loop"""
+        if not text or not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        embeddings = await asyncio.wrap_future(self._batcher.submit([text]))
+        return embeddings[0]
+
+    async def aembed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for multiple texts without blocking the event loop"""
+        if not texts:
+            return []
+
+        valid_texts = [t for t in texts if t and t.strip()]
+        if not valid_texts:
+            raise ValueError("All texts are empty")
+
+        return await asyncio.wrap_future(self._batcher.submit(valid_texts))
 
     @property
     def embedding_dimension(self) -> int:
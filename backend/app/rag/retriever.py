@@ -33,6 +33,21 @@ class VocRetriever:
             filter_problem_type=filter_problem_type,
         )
 
+    async def aretrieve_similar_cases(
+        self,
+        query: str,
+        top_k: Optional[int] = None,
+        min_similarity: Optional[float] = None,
+        filter_problem_type: Optional[str] = None,
+    ) -> List[SearchResult]:
+        """Retrieve similar VOC cases without blocking the event loop"""
+        return await self._vector_store.asearch(
+            query=query,
+            top_k=top_k,
+            min_similarity=min_similarity,
+            filter_problem_type=filter_problem_type,
+        )
+
     def get_context_for_agent(
         self,
         voc_text: str,
@@ -50,6 +65,11 @@ class VocRetriever:
         self._vector_store.add_document(document)
         logger.info(f"Added resolved case to knowledge base: {document.ticket_id}")
 
+    async def aadd_resolved_case(self, document: VocDocument) -> None:
+        """Add a resolved VOC case without blocking the event loop"""
+        await self._vector_store.aadd_document(document)
+        logger.info(f"Added resolved case to knowledge base: {document.ticket_id}")
+
     def add_resolved_cases(self, documents: List[VocDocument]) -> None:
         """Add multiple resolved VOC cases to the knowledge base"""
         self._vector_store.add_documents(documents)
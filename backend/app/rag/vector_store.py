@@ -2,9 +2,10 @@
 ChromaDB Vector Store for VOC documents
 """
 
+import asyncio
 import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import chromadb
 from chromadb.config import Settings as ChromaSettings
@@ -61,8 +62,33 @@ class VocVectorStore:
         )
         logger.info(f"Added document: {document.ticket_id}")
 
-    def add_documents(self, documents: List[VocDocument]) -> None:
-        """Add multiple VOC documents to the vector store"""
+    async def aadd_document(self, document: VocDocument) -> None:
+        """Add a single VOC document without blocking the event loop"""
+        text = document.to_text()
+        embedding = await self._embedding_service.aembed_text(text)
+        metadata = document.to_metadata()
+
+        await asyncio.to_thread(
+            self._collection.upsert,
+            ids=[document.ticket_id],
+            embeddings=[embedding],
+            documents=[text],
+            metadatas=[metadata]
+        )
+        logger.info(f"Added document: {document.ticket_id}")
+
+    def add_documents(
+        self,
+        documents: List[VocDocument],
+        extra_metadata: Optional[List[dict]] = None,
+    ) -> None:
+        """
+        Add (upsert) multiple VOC documents to the vector store
+
+        Args:
+            documents: Documents to embed and store
+            extra_metadata: Additional metadata per document (e.g. a content hash)
+        """
         if not documents:
             return
 
@@ -70,6 +96,8 @@ class VocVectorStore:
         texts = [doc.to_text() for doc in documents]
         embeddings = self._embedding_service.embed_texts(texts)
         metadatas = [doc.to_metadata() for doc in documents]
+        if extra_metadata:
+            metadatas = [{**metadata, **extra} for metadata, extra in zip(metadatas, extra_metadata)]
 
         self._collection.upsert(
             ids=ids,
@@ -90,6 +118,37 @@ class VocVectorStore:
         if not query or not query.strip():
             return []
 
+        # Generate query embedding
+        query_embedding = self._embedding_service.embed_text(query)
+
+        return self._query(query, query_embedding, top_k, min_similarity, filter_problem_type)
+
+    async def asearch(
+        self,
+        query: str,
+        top_k: Optional[int] = None,
+        min_similarity: Optional[float] = None,
+        filter_problem_type: Optional[str] = None,
+    ) -> List[SearchResult]:
+        """Search for similar VOC documents without blocking the event loop"""
+        if not query or not query.strip():
+            return []
+
+        query_embedding = await self._embedding_service.aembed_text(query)
+
+        return await asyncio.to_thread(
+            self._query, query, query_embedding, top_k, min_similarity, filter_problem_type
+        )
+
+    def _query(
+        self,
+        query: str,
+        query_embedding: List[float],
+        top_k: Optional[int],
+        min_similarity: Optional[float],
+        filter_problem_type: Optional[str],
+    ) -> List[SearchResult]:
+        """Run the similarity query for a precomputed embedding"""
         top_k = top_k or settings.similarity_top_k
         min_similarity = min_similarity or settings.similarity_threshold
 
@@ -98,9 +157,6 @@ class VocVectorStore:
         if filter_problem_type:
             where_filter = {"problem_type_primary": filter_problem_type}
 
-        # Generate query embedding
-        query_embedding = self._embedding_service.embed_text(query)
-
         # Search
         results = self._collection.query(
             query_embeddings=[query_embedding],
@@ -144,6 +200,19 @@ class VocVectorStore:
         self._collection.delete(ids=[ticket_id])
         logger.info(f"Deleted document: {ticket_id}")
 
+    def delete_documents(self, ticket_ids: List[str]) -> None:
+        """Delete documents from the vector store"""
+        if ticket_ids:
+            self._collection.delete(ids=ticket_ids)
+            logger.info(f"Deleted {len(ticket_ids)} documents")
+
+    def get_metadatas(self, ticket_ids: List[str]) -> Dict[str, dict]:
+        """Stored metadata of the given documents (missing ids are omitted)"""
+        if not ticket_ids:
+            return {}
+        result = self._collection.get(ids=ticket_ids, include=["metadatas"])
+        return dict(zip(result["ids"], result["metadatas"]))
+
     def get_document_count(self) -> int:
         """Get total document count"""
         return self._collection.count()
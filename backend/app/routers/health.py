@@ -6,13 +6,14 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
-from app.database import get_db
+from app.database import get_read_db
+from app.services.llm_service import get_llm_service
 
 router = APIRouter(tags=["health"])
 
 
 @router.get("/health")
-async def health_check(db: AsyncSession = Depends(get_db)):
+async def health_check(db: AsyncSession = Depends(get_read_db)):
     """Health check endpoint"""
     try:
         # Test database connection
@@ -27,3 +28,12 @@ async def health_check(db: AsyncSession = Depends(get_db)):
             "database": db_status,
         }
     }
+
+
+@router.get("/health/llm")
+async def llm_queue_metrics():
+    """LLM admission queue and response cache metrics"""
+    llm_service = get_llm_service()
+    metrics = llm_service.admission.get_metrics()
+    metrics["cache"] = llm_service.cache.get_stats() if llm_service.cache else None
+    return metrics
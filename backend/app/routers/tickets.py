@@ -2,29 +2,145 @@
 Ticket management endpoints
 """
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import asyncio
+import hashlib
+from datetime import date, datetime, timezone
+from typing import AsyncIterator, List, Literal, Optional, Set, Union
+from fastapi import APIRouter, Depends, Header, HTTPException, status, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 import math
 
-from app.database import get_db
+from app.config import settings
+from app.database import get_db, get_read_db
 from app.schemas.ticket import (
     TicketDetail, TicketListResponse, TicketSummary,
-    TicketConfirm, TicketReject, TicketComplete
+    TicketConfirm, TicketReject, TicketComplete,
+    TicketBulkRequest, TicketBulkResponse, TicketStatsResponse,
+    TICKET_FIELDS, TICKET_SUMMARY_FIELDS,
 )
 from app.services.ticket_service import TicketService
+from app.services.job_queue import get_job_queue
+from app.services.ticket_transitions import TicketTransitionError
+from app.services.ticket_stats import get_ticket_stats
+from app.services.ticket_export import (
+    EXPORT_MEDIA_TYPES, encode_csv, encode_ndjson, gzip_stream,
+)
+from app.services.ticket_events import (
+    TicketEventSubscription, get_event_bus, RESET_SSE,
+)
 from app.models.ticket import TicketStatus
 
 router = APIRouter(prefix="/tickets", tags=["tickets"])
 
 
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Parse a `fields=a,b,c` sparse fieldset (ticket_id is always included)"""
+    if fields is None:
+        return None
+
+    selected = ["ticket_id"]
+    for field in fields.split(","):
+        field = field.strip()
+        if not field or field in selected:
+            continue
+        if field not in TICKET_FIELDS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown field: {field}. Allowed: {', '.join(TICKET_FIELDS)}"
+            )
+        selected.append(field)
+    return selected
+
+
+def _digest(*parts) -> str:
+    return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:20]
+
+
+def _make_etag(*parts) -> str:
+    """Weak ETag over the given version parts"""
+    return f'W/"{_digest(*parts)}"'
+
+
+def _if_none_match(request: Request) -> List[str]:
+    """Opaque tags of If-None-Match, without W/ prefix and quotes"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return []
+    return [tag.strip().removeprefix("W/").strip('"') for tag in header.split(",")]
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of If-None-Match against an ETag"""
+    opaque = etag.removeprefix("W/").strip('"')
+    return any(tag in ("*", opaque) for tag in _if_none_match(request))
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
+async def _event_stream(
+    request: Request,
+    subscription: TicketEventSubscription,
+    statuses: Optional[Set[str]],
+    urgency: Optional[str],
+    heartbeat_seconds: float,
+) -> AsyncIterator[str]:
+    """Render a subscription as SSE, with comment heartbeats while idle"""
+    # The pending get outlives heartbeat timeouts so no event is dropped
+    next_event: Optional[asyncio.Future] = None
+    try:
+        yield "retry: 3000\n\n"
+        while not await request.is_disconnected():
+            if next_event is None:
+                next_event = asyncio.ensure_future(subscription.get())
+            done, _ = await asyncio.wait({next_event}, timeout=heartbeat_seconds)
+            if not done:
+                # Keeps proxies from closing an idle connection
+                yield ": keep-alive\n\n"
+                continue
+            ticket_event, next_event = next_event.result(), None
+            if ticket_event is None:
+                yield RESET_SSE
+            elif ticket_event.matches(statuses, urgency):
+                yield ticket_event.to_sse()
+    finally:
+        if next_event is not None:
+            next_event.cancel()
+        get_event_bus().unsubscribe(subscription)
+
+
+def _as_utc(value: Union[datetime, date, None]) -> Optional[datetime]:
+    """Naive UTC datetime for comparison with stored timestamps (dates are midnight UTC)"""
+    if value is None:
+        return None
+    if not isinstance(value, datetime):
+        return datetime(value.year, value.month, value.day)
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _pick_fields(ticket, fields: List[str]) -> dict:
+    """Serialize only the selected (loaded) columns of a ticket"""
+    return jsonable_encoder({field: getattr(ticket, field) for field in fields})
+
+
 @router.get("", response_model=TicketListResponse)
 async def list_tickets(
+    request: Request,
+    response: Response,
     status: Optional[List[TicketStatus]] = Query(None),
     urgency: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = Query(None),
+    include_total: Optional[bool] = Query(None),
+    fields: Optional[str] = Query(None),
+    q: Optional[str] = Query(None, max_length=200),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     List tickets with optional filtering
@@ -33,39 +149,316 @@ async def list_tickets(
     - **urgency**: Filter by urgency (low/medium/high)
     - **page**: Page number (default: 1)
     - **limit**: Items per page (default: 20, max: 100)
+    - **cursor**: Keyset cursor (next_cursor/prev_cursor of a previous
+      response; empty for the first page). Takes precedence over page.
+    - **include_total**: Compute total_count (default: true with page,
+      false with cursor)
+    - **fields**: Comma-separated ticket fields to return (default: the
+      summary fields). Only these columns are read from the database.
+    - **q**: Full-text search over raw_voc/summary/manual_resolution.
+      Results are ranked by relevance and carry a `snippet` with matches
+      wrapped in `<mark>`. Uses page pagination.
+
+    Responses carry a weak ETag `<version>.<page>`: a digest of the
+    table-wide ticket change counter, then a digest of the returned rows.
+    If-None-Match gets 304 without loading tickets while no ticket has
+    changed, and after loading the page when its rows are unchanged.
+    """
+    selected = _parse_fields(fields)
+    load_fields = selected or TICKET_SUMMARY_FIELDS
+    if "updated_at" not in load_fields:
+        # Needed for the page digest
+        load_fields = [*load_fields, "updated_at"]
+    service = TicketService(db)
+
+    query_key = (sorted(status or []), urgency, page, limit, cursor, include_total, selected, q)
+    version_tag = _digest(await service.get_list_version(), query_key)
+    client_tags = _if_none_match(request)
+    for tag in client_tags:
+        if tag.partition(".")[0] == version_tag:
+            return _not_modified(f'W/"{tag}"')
+
+    snippets = {}
+    if q is not None:
+        if cursor is not None:
+            raise HTTPException(
+                status_code=400,
+                detail="cursor pagination is not supported with q"
+            )
+        try:
+            tickets, snippets, total_count = await service.search_tickets(
+                q,
+                status=status,
+                urgency=urgency,
+                page=page,
+                limit=limit,
+                include_total=include_total is not False,
+                fields=load_fields,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        result = TicketListResponse(
+            tickets=[],
+            total_count=total_count,
+            page=page,
+            limit=limit,
+            total_pages=math.ceil(total_count / limit) if total_count is not None else None
+        )
+    elif cursor is not None:
+        try:
+            tickets, next_cursor, prev_cursor, total_count = await service.list_tickets_by_cursor(
+                status=status,
+                urgency=urgency,
+                cursor=cursor,
+                limit=limit,
+                include_total=bool(include_total),
+                fields=load_fields,
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=400,  # `status` is shadowed by the filter parameter
+                detail=str(e)
+            )
+
+        result = TicketListResponse(
+            tickets=[],
+            total_count=total_count,
+            limit=limit,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+        )
+    else:
+        tickets, total_count = await service.list_tickets(
+            status=status,
+            urgency=urgency,
+            page=page,
+            limit=limit,
+            include_total=include_total is not False,
+            fields=load_fields,
+        )
+
+        result = TicketListResponse(
+            tickets=[],
+            total_count=total_count,
+            page=page,
+            limit=limit,
+            total_pages=math.ceil(total_count / limit) if total_count is not None else None
+        )
+
+    page_tag = _digest(
+        query_key,
+        result.model_dump(mode="json", exclude={"tickets"}),
+        [(t.ticket_id, t.updated_at) for t in tickets],
+    )
+    etag = f'W/"{version_tag}.{page_tag}"'
+    if any(tag == "*" or tag.partition(".")[2] == page_tag for tag in client_tags):
+        return _not_modified(etag)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if selected is None:
+        result.tickets = [
+            TicketSummary.model_validate(t).model_copy(
+                update={"snippet": snippets.get(t.ticket_id)}
+            )
+            for t in tickets
+        ]
+        response.headers.update(headers)
+        return result
+
+    content = result.model_dump(mode="json")
+    content["tickets"] = [_pick_fields(t, selected) for t in tickets]
+    if q is not None:
+        for item in content["tickets"]:
+            item["snippet"] = snippets.get(item["ticket_id"])
+    return JSONResponse(content=content, headers=headers)
+
+
+@router.post("/bulk", response_model=TicketBulkResponse)
+async def bulk_ticket_action(
+    data: TicketBulkRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Apply confirm/reject/complete to many tickets in one transaction
+
+    Each item is `{ticket_id, action, payload}`; the payload has the same
+    fields as the single-ticket endpoint. `confirm_filter` additionally
+    confirms every WAITING_CONFIRM ticket with
+    `decision_confidence >= min_confidence`. Items that cannot be applied
+    (not found, wrong state, invalid payload) are reported per ticket and
+    do not affect the rest.
     """
+    if not data.items and data.confirm_filter is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No items or confirm_filter given"
+        )
+    if len(data.items) > settings.ticket_bulk_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Bulk request exceeds {settings.ticket_bulk_max_items} items"
+        )
+
     service = TicketService(db)
-    tickets, total_count = await service.list_tickets(
+    results = await service.bulk_action(data.items, data.confirm_filter)
+    succeeded = sum(1 for r in results if r.success)
+
+    return TicketBulkResponse(
+        results=results,
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+    )
+
+
+@router.get("/stats", response_model=TicketStatsResponse)
+async def ticket_stats(
+    days: int = Query(30, ge=1, le=366),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Ticket counters for dashboards
+
+    Served from the incrementally maintained ticket_stats table rather
+    than counting tickets.
+
+    - **days**: Number of recent creation days in the daily breakdown
+    """
+    return TicketStatsResponse(**await get_ticket_stats(db, days=days))
+
+
+@router.get("/export")
+async def export_tickets(
+    request: Request,
+    export_format: Literal["csv", "ndjson"] = Query("csv", alias="format"),
+    status: Optional[List[TicketStatus]] = Query(None),
+    urgency: Optional[str] = Query(None),
+    created_from: Union[datetime, date, None] = Query(None),
+    created_to: Union[datetime, date, None] = Query(None),
+    fields: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Export tickets as a streamed CSV or NDJSON download
+
+    Rows are read from a server-side cursor in batches and written out as
+    they arrive, oldest first, so the export size is not bounded by memory.
+    The response is gzip-compressed when the client sends
+    `Accept-Encoding: gzip`.
+
+    - **format**: csv (default, UTF-8 with BOM) or ndjson
+    - **status**: Filter by status (can specify multiple)
+    - **urgency**: Filter by urgency (low/medium/high)
+    - **created_from**: Tickets created at or after this time or date
+    - **created_to**: Tickets created before this time or date (exclusive)
+    - **fields**: Comma-separated ticket fields to export (default: all)
+    """
+    created_from, created_to = _as_utc(created_from), _as_utc(created_to)
+    if created_from and created_to and created_from >= created_to:
+        raise HTTPException(
+            status_code=400,
+            detail="created_from must be before created_to"
+        )
+    selected = _parse_fields(fields) or list(TICKET_FIELDS)
+
+    batches = TicketService(db).export_tickets(
+        selected,
         status=status,
         urgency=urgency,
-        page=page,
-        limit=limit
+        created_from=created_from,
+        created_to=created_to,
     )
+    encode = encode_csv if export_format == "csv" else encode_ndjson
+    body = encode(batches, selected)
+
+    filename = f"tickets-{datetime.utcnow():%Y%m%d-%H%M%S}.{export_format}"
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Vary": "Accept-Encoding",
+    }
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        body = gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(
+        body, media_type=EXPORT_MEDIA_TYPES[export_format], headers=headers
+    )
+
 
-    return TicketListResponse(
-        tickets=[TicketSummary.model_validate(t) for t in tickets],
-        total_count=total_count,
-        page=page,
-        limit=limit,
-        total_pages=math.ceil(total_count / limit) if total_count > 0 else 0
+@router.get("/events")
+async def ticket_events(
+    request: Request,
+    status: Optional[List[TicketStatus]] = Query(None),
+    urgency: Optional[str] = Query(None),
+    last_event_id: Optional[str] = Header(None),
+):
+    """
+    Stream ticket status changes as Server-Sent Events
+
+    Each committed status change (including ticket creation) is sent as an
+    `event: status` message whose data holds ticket_id, status,
+    previous_status, urgency and occurred_at.
+
+    - **status**: Only changes into or out of these statuses
+    - **urgency**: Only tickets with this urgency
+    - **Last-Event-ID**: Resume after this event. Missed events are replayed
+      from a bounded buffer; when they are no longer available an
+      `event: reset` is sent and the client should refetch the list.
+    """
+    subscription = get_event_bus().subscribe(last_event_id)
+    return StreamingResponse(
+        _event_stream(
+            request,
+            subscription,
+            {s.value for s in status} if status else None,
+            urgency,
+            settings.ticket_events_heartbeat_seconds,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
 @router.get("/{ticket_id}", response_model=TicketDetail)
 async def get_ticket(
     ticket_id: str,
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get ticket details by ID"""
+    """
+    Get ticket details by ID
+
+    - **fields**: Comma-separated ticket fields to return (default: all)
+
+    Responses carry a weak ETag derived from updated_at; a matching
+    If-None-Match gets 304 without loading the ticket.
+    """
+    selected = _parse_fields(fields)
     service = TicketService(db)
-    ticket = await service.get_ticket(ticket_id)
 
+    version = await service.get_ticket_version(ticket_id)
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Ticket {ticket_id} not found"
+        )
+    etag = _make_etag(ticket_id, version, selected)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    ticket = await service.get_ticket(ticket_id, fields=selected)
     if not ticket:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Ticket {ticket_id} not found"
         )
 
+    if selected is not None:
+        return JSONResponse(content=_pick_fields(ticket, selected), headers=headers)
+    response.headers.update(headers)
     return TicketDetail.model_validate(ticket)
 
 
@@ -86,6 +479,11 @@ async def confirm_ticket(
                 detail=f"Ticket {ticket_id} not found"
             )
         return TicketDetail.model_validate(ticket)
+    except TicketTransitionError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -112,6 +510,11 @@ async def reject_ticket(
                 detail=f"Ticket {ticket_id} not found"
             )
         return TicketDetail.model_validate(ticket)
+    except TicketTransitionError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -128,13 +531,23 @@ async def retry_ticket(
     service = TicketService(db)
 
     try:
-        ticket = await service.retry_ticket(ticket_id)
+        ticket = await service.retry_ticket(ticket_id, commit=False)
         if not ticket:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Ticket {ticket_id} not found"
             )
+        # Transition and job commit together: no ANALYZING ticket without a job
+        job_queue = get_job_queue()
+        await job_queue.enqueue_many(db, [ticket.ticket_id], commit=False)
+        await db.commit()
+        job_queue.notify()
         return TicketDetail.model_validate(ticket)
+    except TicketTransitionError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -161,6 +574,11 @@ async def complete_manual_ticket(
                 detail=f"Ticket {ticket_id} not found"
             )
         return TicketDetail.model_validate(ticket)
+    except TicketTransitionError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
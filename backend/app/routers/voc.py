@@ -2,65 +2,27 @@
 VOC input endpoint
 """
 
-import asyncio
+import json
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from typing import Any, AsyncIterator, List, NamedTuple, Tuple, Union
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db, async_session
-from app.schemas.ticket import VOCCreate, TicketCreateResponse
+from app.config import settings
+from app.database import get_db
+from app.schemas.ticket import VOCCreate, TicketCreateResponse, VOCBatchItemResult
 from app.services.ticket_service import TicketService
-from app.services.slack_service import slack_service
-from app.models.ticket import TicketStatus, Urgency
+from app.services.job_queue import get_job_queue
 
 router = APIRouter(prefix="/voc", tags=["voc"])
 logger = logging.getLogger(__name__)
 
 
-async def run_normalization_and_solve(ticket_id: str):
-    """Background task to run normalization and solver"""
-    async with async_session() as db:
-        service = TicketService(db)
-
-        # Step 1: Normalize the ticket
-        ticket = await service.normalize_ticket(ticket_id)
-        if not ticket:
-            return
-
-        # Send Slack notification for urgent tickets after normalization
-        if ticket.urgency == Urgency.HIGH:
-            try:
-                await slack_service.send_urgent_ticket_notification(
-                    ticket_id=ticket.ticket_id,
-                    summary=ticket.summary or ticket.raw_voc[:100],
-                    urgency=ticket.urgency.value,
-                    customer_name=ticket.customer_name,
-                    channel=ticket.channel.value if ticket.channel else None,
-                )
-            except Exception as e:
-                logger.error(f"Slack 알림 전송 실패: {e}")
-
-        # Step 2: If normalization succeeded, run solver
-        if ticket.status == TicketStatus.OPEN:
-            ticket = await service.solve_ticket(ticket_id, max_retries=2)
-
-            # Send Slack notification for analysis completion (urgent tickets only)
-            if ticket and ticket.urgency == Urgency.HIGH and ticket.status == TicketStatus.WAITING_CONFIRM:
-                try:
-                    await slack_service.send_analysis_complete_notification(
-                        ticket_id=ticket.ticket_id,
-                        primary_type=ticket.agent_decision_primary or "",
-                        confidence=ticket.decision_confidence or 0.0,
-                        urgency=ticket.urgency.value,
-                    )
-                except Exception as e:
-                    logger.error(f"Slack 분석 완료 알림 전송 실패: {e}")
-
-
 @router.post("", response_model=TicketCreateResponse, status_code=status.HTTP_201_CREATED)
 async def create_voc(
     voc: VOCCreate,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -77,8 +39,8 @@ async def create_voc(
         # Create ticket
         ticket = await service.create_ticket(voc)
 
-        # Run normalization and solver in background
-        background_tasks.add_task(run_normalization_and_solve, ticket.ticket_id)
+        # Queue normalization and solver on the durable job queue
+        await get_job_queue().enqueue(db, ticket.ticket_id)
 
         return TicketCreateResponse(
             ticket_id=ticket.ticket_id,
@@ -90,3 +52,146 @@ async def create_voc(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create ticket: {str(e)}"
         )
+
+
+class _ItemParseError(NamedTuple):
+    """Batch item that could not be parsed (distinct from any JSON value)"""
+    message: str
+
+
+def _parse_batch_body(body: bytes, content_type: str) -> List[Union[Any, _ItemParseError]]:
+    """
+    Split a batch body into raw items
+
+    Accepts a JSON array or NDJSON (one object per line). Unparseable NDJSON
+    lines are returned as ``_ItemParseError`` so they get their own result line.
+    """
+    try:
+        text = body.decode("utf-8")
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Request body must be UTF-8 encoded"
+        )
+    if "ndjson" in content_type or "jsonl" in content_type:
+        items: List[Union[Any, _ItemParseError]] = []
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                items.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                items.append(_ItemParseError(f"Invalid JSON: {e.msg}"))
+        return items
+
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid JSON body: {e.msg}"
+        )
+    if not isinstance(data, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Request body must be a JSON array or NDJSON"
+        )
+    return data
+
+
+def _validate_batch_items(
+    items: List[Union[Any, _ItemParseError]]
+) -> Tuple[List[Tuple[int, VOCCreate]], List[VOCBatchItemResult]]:
+    """Validate raw items, separating valid VOCs from per-item errors"""
+    valid: List[Tuple[int, VOCCreate]] = []
+    errors: List[VOCBatchItemResult] = []
+    for index, item in enumerate(items):
+        if isinstance(item, _ItemParseError):
+            errors.append(VOCBatchItemResult(index=index, error=item.message))
+            continue
+        if not isinstance(item, dict):
+            errors.append(VOCBatchItemResult(index=index, error="item must be an object"))
+            continue
+        try:
+            valid.append((index, VOCCreate.model_validate(item)))
+        except ValidationError as e:
+            message = "; ".join(
+                f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}"
+                for err in e.errors()
+            )
+            errors.append(VOCBatchItemResult(index=index, error=message))
+    return valid, errors
+
+
+async def _ingest_batch(
+    db: AsyncSession,
+    valid: List[Tuple[int, VOCCreate]],
+    errors: List[VOCBatchItemResult],
+) -> AsyncIterator[str]:
+    """Insert VOCs chunk by chunk and stream one NDJSON line per item"""
+    for result in errors:
+        yield result.model_dump_json() + "\n"
+
+    service = TicketService(db)
+    job_queue = get_job_queue()
+    chunk_size = settings.voc_batch_chunk_size
+
+    for start in range(0, len(valid), chunk_size):
+        chunk = valid[start:start + chunk_size]
+        try:
+            tickets = await service.create_tickets([voc for _, voc in chunk])
+            await job_queue.enqueue_many(
+                db, [ticket.ticket_id for ticket in tickets], commit=False
+            )
+            await db.commit()
+            job_queue.notify()
+            results = [
+                VOCBatchItemResult(index=index, ticket_id=ticket.ticket_id, status=ticket.status)
+                for (index, _), ticket in zip(chunk, tickets)
+            ]
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Batch VOC chunk failed: {e}")
+            results = [
+                VOCBatchItemResult(index=index, error=f"Failed to create ticket: {str(e)}")
+                for index, _ in chunk
+            ]
+
+        for result in results:
+            yield result.model_dump_json() + "\n"
+
+
+@router.post("/batch")
+async def create_voc_batch(
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Create tickets for a batch of VOCs
+
+    The body is a JSON array of VOC objects or NDJSON
+    (`Content-Type: application/x-ndjson`). Tickets are inserted and their
+    analysis jobs enqueued in one transaction per chunk, and one NDJSON
+    result line (`index`, `ticket_id`, `status`, `error`) is streamed back
+    per input item.
+    """
+    body = await request.body()
+    items = _parse_batch_body(body, request.headers.get("content-type", ""))
+
+    if not items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Batch is empty"
+        )
+    if len(items) > settings.voc_batch_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch exceeds {settings.voc_batch_max_items} items"
+        )
+
+    valid, errors = _validate_batch_items(items)
+
+    return StreamingResponse(
+        _ingest_batch(db, valid, errors),
+        media_type="application/x-ndjson",
+    )
@@ -2,8 +2,8 @@
 Ticket schemas for request/response
 """
 
-from datetime import datetime
-from typing import Optional, List
+from datetime import date, datetime
+from typing import Optional, List, Literal, Dict, Any
 from pydantic import BaseModel, Field
 
 from app.models.ticket import TicketStatus, Channel, Urgency
@@ -46,6 +46,7 @@ class TicketSummary(TicketBase):
     urgency: Optional[Urgency] = None
     customer_name: str
     decision_confidence: Optional[float] = None
+    snippet: Optional[str] = None  # Highlighted match (search results only)
 
     class Config:
         from_attributes = True
@@ -85,6 +86,11 @@ class TicketDetail(TicketBase):
         from_attributes = True
 
 
+# Fields selectable with `fields=` (sparse fieldsets)
+TICKET_FIELDS = tuple(TicketDetail.model_fields)
+TICKET_SUMMARY_FIELDS = tuple(f for f in TicketSummary.model_fields if f != "snippet")
+
+
 # Action Schemas
 class TicketConfirm(BaseModel):
     """Schema for confirming a ticket"""
@@ -103,6 +109,25 @@ class TicketComplete(BaseModel):
     assignee: Optional[str] = None
 
 
+class TicketBulkActionItem(BaseModel):
+    """One action of a bulk admin request"""
+    ticket_id: str
+    action: Literal["confirm", "reject", "complete"]
+    payload: Dict[str, Any] = Field(default_factory=dict)
+
+
+class TicketBulkConfirmFilter(BaseModel):
+    """Confirm every WAITING_CONFIRM ticket at or above a confidence"""
+    min_confidence: float = Field(..., ge=0.0, le=1.0)
+    assignee: Optional[str] = None
+
+
+class TicketBulkRequest(BaseModel):
+    """Schema for bulk admin actions"""
+    items: List[TicketBulkActionItem] = Field(default_factory=list)
+    confirm_filter: Optional[TicketBulkConfirmFilter] = None
+
+
 # Response Schemas
 class TicketCreateResponse(BaseModel):
     """Response after creating a ticket"""
@@ -111,10 +136,51 @@ class TicketCreateResponse(BaseModel):
     message: str
 
 
+class VOCBatchItemResult(BaseModel):
+    """Per-item result of a batch VOC ingestion (one NDJSON line)"""
+    index: int
+    ticket_id: Optional[str] = None
+    status: Optional[TicketStatus] = None
+    error: Optional[str] = None
+
+
+class TicketBulkItemResult(BaseModel):
+    """Per-ticket result of a bulk admin request"""
+    ticket_id: str
+    action: str
+    success: bool
+    status: Optional[TicketStatus] = None
+    error: Optional[str] = None
+
+
+class TicketBulkResponse(BaseModel):
+    """Response for bulk admin actions"""
+    results: List[TicketBulkItemResult]
+    succeeded: int
+    failed: int
+
+
+class TicketDailyStats(BaseModel):
+    """Tickets created on one day, by current status"""
+    day: date
+    total: int
+    by_status: Dict[str, int]
+
+
+class TicketStatsResponse(BaseModel):
+    """Dashboard ticket counters"""
+    total: int
+    by_status: Dict[str, int]
+    by_urgency: Dict[str, int]
+    daily: List[TicketDailyStats]
+
+
 class TicketListResponse(BaseModel):
     """Response for ticket list"""
     tickets: List[TicketSummary]
-    total_count: int
-    page: int
+    total_count: Optional[int] = None
+    page: Optional[int] = None
     limit: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
@@ -0,0 +1,60 @@
+"""
+Analysis pipeline - normalization followed by the solver agent
+"""
+
+import logging
+
+from app.database import async_session
+from app.models.ticket import TicketStatus, Urgency
+from app.services.ticket_service import TicketService
+from app.services.slack_service import slack_service
+
+logger = logging.getLogger(__name__)
+
+# Statuses from which the pipeline may (re)start
+RUNNABLE_STATUSES = (TicketStatus.OPEN, TicketStatus.ANALYZING)
+
+
+async def run_normalization_and_solve(ticket_id: str):
+    """Run normalization and solver for a ticket"""
+    async with async_session() as db:
+        service = TicketService(db)
+
+        # A re-delivered job must not re-analyze a ticket that already moved on
+        ticket = await service.get_ticket(ticket_id)
+        if not ticket or ticket.status not in RUNNABLE_STATUSES:
+            return
+
+        # Step 1: Normalize the ticket
+        ticket = await service.normalize_ticket(ticket_id)
+        if not ticket:
+            return
+
+        # Send Slack notification for urgent tickets after normalization
+        if ticket.urgency == Urgency.HIGH:
+            try:
+                await slack_service.send_urgent_ticket_notification(
+                    ticket_id=ticket.ticket_id,
+                    summary=ticket.summary or ticket.raw_voc[:100],
+                    urgency=ticket.urgency.value,
+                    customer_name=ticket.customer_name,
+                    channel=ticket.channel.value if ticket.channel else None,
+                )
+            except Exception as e:
+                logger.error(f"Slack 알림 전송 실패: {e}")
+
+        # Step 2: If normalization succeeded, run solver
+        if ticket.status == TicketStatus.OPEN:
+            ticket = await service.solve_ticket(ticket_id, max_retries=2)
+
+            # Send Slack notification for analysis completion (urgent tickets only)
+            if ticket and ticket.urgency == Urgency.HIGH and ticket.status == TicketStatus.WAITING_CONFIRM:
+                try:
+                    await slack_service.send_analysis_complete_notification(
+                        ticket_id=ticket.ticket_id,
+                        primary_type=ticket.agent_decision_primary or "",
+                        confidence=ticket.decision_confidence or 0.0,
+                        urgency=ticket.urgency.value,
+                    )
+                except Exception as e:
+                    logger.error(f"Slack 분석 완료 알림 전송 실패: {e}")
@@ -0,0 +1,190 @@
+"""
+Hot reload of mock log scenarios and RAG seed data
+
+A background task polls the scenario and seed directories. Files whose
+mtime or size changed are re-read, and only their delta is applied:
+
+- scenario files: logs not loaded before are appended to the service's
+  log store (``MockLogService.load_scenario_file``); removed logs or files
+  rebuild that service's in-memory store
+- seed files: documents whose content hash changed are upserted into the
+  vector store (``sync_seed_documents``), removed entries are deleted
+
+A content hash backs up the mtime check, so touching a file without changing
+it costs one hash and no reload. Operators can add incident logs or seed
+cases to a running server; the next poll picks them up.
+"""
+
+import asyncio
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from app.config import settings
+from app.mock.log_service import MockLogService, get_mock_log_service
+from app.rag.vector_store import VocVectorStore, get_vector_store
+from app.services.rag_service import SEED_DATA_PATH, seed_document_hash, sync_seed_documents
+
+logger = logging.getLogger(__name__)
+
+# File signature checked before hashing: (mtime_ns, size)
+Signature = Tuple[int, int]
+
+
+def _scan(directory: Path) -> Dict[Path, Signature]:
+    if not directory.exists():
+        return {}
+    signatures = {}
+    for path in sorted(directory.glob("*.json")):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        signatures[path] = (stat.st_mtime_ns, stat.st_size)
+    return signatures
+
+
+class HotReloadWatcher:
+    """Polls scenario and seed directories and applies changes"""
+
+    def __init__(
+        self,
+        log_service: Optional[MockLogService] = None,
+        seed_dir: Optional[Path] = None,
+        vector_store: Optional[VocVectorStore] = None,
+        interval_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            log_service: Mock log service (default: the shared instance); its
+                scenarios directory is watched
+            seed_dir: Seed JSON directory (default: bundled seed data)
+            vector_store: Vector store for seed documents (default: shared)
+            interval_seconds: Poll interval (default: settings.hot_reload_interval_seconds)
+        """
+        self._log_service = log_service
+        self.seed_dir = seed_dir or SEED_DATA_PATH.parent
+        self._vector_store = vector_store
+        self.interval_seconds = interval_seconds or settings.hot_reload_interval_seconds
+        self._scenario_signatures: Dict[Path, Signature] = {}
+        self._seed_signatures: Dict[Path, Signature] = {}
+        # seed file -> {ticket_id: content hash} as last synced
+        self._seed_documents: Dict[Path, Dict[str, str]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def log_service(self) -> MockLogService:
+        return self._log_service or get_mock_log_service()
+
+    @property
+    def vector_store(self) -> VocVectorStore:
+        return self._vector_store or get_vector_store()
+
+    def poll(self) -> Dict[str, int]:
+        """
+        Apply changes since the last poll (blocking; run off the event loop)
+
+        Returns:
+            Number of appended logs, upserted and deleted seed documents
+        """
+        summary = {"logs": 0, "seeds_upserted": 0, "seeds_deleted": 0}
+
+        scenarios = _scan(self.log_service.scenarios_dir)
+        for path, signature in scenarios.items():
+            if self._scenario_signatures.get(path) == signature:
+                continue
+            try:
+                added = self.log_service.load_scenario_file(path)
+            except Exception as e:
+                # Possibly caught mid-write; retried on the next poll
+                logger.error(f"Failed to reload scenario {path.name}: {e}")
+                continue
+            self._scenario_signatures[path] = signature
+            if added:
+                summary["logs"] += added
+                logger.info(f"Reloaded scenario {path.name}: {added} logs added")
+        for path in set(self._scenario_signatures) - set(scenarios):
+            del self._scenario_signatures[path]
+            self.log_service.remove_scenario_file(path)
+            logger.info(f"Scenario removed: {path.name}")
+
+        seeds = _scan(self.seed_dir)
+        for path, signature in seeds.items():
+            if self._seed_signatures.get(path) == signature:
+                continue
+            try:
+                upserted, deleted = self._sync_seed_file(path)
+            except Exception as e:
+                logger.error(f"Failed to reload seed data {path.name}: {e}")
+                continue
+            self._seed_signatures[path] = signature
+            summary["seeds_upserted"] += upserted
+            summary["seeds_deleted"] += deleted
+        for path in set(self._seed_signatures) - set(seeds):
+            del self._seed_signatures[path]
+            summary["seeds_deleted"] += self._delete_seed_documents(
+                set(self._seed_documents.pop(path, {}))
+            )
+            logger.info(f"Seed file removed: {path.name}")
+
+        return summary
+
+    def _sync_seed_file(self, path: Path) -> Tuple[int, int]:
+        with open(path, "r", encoding="utf-8") as f:
+            items = json.load(f)
+        hashes = {item["ticket_id"]: seed_document_hash(item) for item in items}
+        previous = self._seed_documents.get(path)
+        if previous == hashes:
+            return 0, 0
+
+        if previous is None:
+            # First sight: compare against what the vector store holds
+            changed = items
+        else:
+            changed = [item for item in items if previous.get(item["ticket_id"]) != hashes[item["ticket_id"]]]
+        upserted = sync_seed_documents(changed, self.vector_store) if changed else 0
+        self._seed_documents[path] = hashes
+        deleted = self._delete_seed_documents(set(previous or {}) - set(hashes))
+        if upserted or deleted:
+            logger.info(f"Reloaded seed data {path.name}: {upserted} upserted, {deleted} deleted")
+        return upserted, deleted
+
+    def _delete_seed_documents(self, ticket_ids: Set[str]) -> int:
+        """Delete documents no longer in any seed file (ids may move between files)"""
+        kept = set().union(*self._seed_documents.values())
+        removed = sorted(ticket_ids - kept)
+        if removed:
+            self.vector_store.delete_documents(removed)
+        return len(removed)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.poll)
+            except Exception as e:
+                logger.error(f"Hot reload poll failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    async def start(self) -> None:
+        """Start polling in the background"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"Hot reload watching every {self.interval_seconds}s")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+_hot_reload_watcher: Optional[HotReloadWatcher] = None
+
+
+def get_hot_reload_watcher() -> HotReloadWatcher:
+    """Get singleton hot reload watcher"""
+    global _hot_reload_watcher
+    if _hot_reload_watcher is None:
+        _hot_reload_watcher = HotReloadWatcher()
+    return _hot_reload_watcher
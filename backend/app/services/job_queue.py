@@ -0,0 +1,397 @@
+"""
+Durable analysis job queue
+
+Jobs are persisted in the ``analysis_jobs`` table so queued and in-flight
+analyses survive a process restart. A pool of async workers claims jobs with
+a time-limited lease, renews the lease while the job runs and retries failed
+jobs with exponential backoff.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List, Optional
+
+from sqlalchemy import select, update, and_, or_, exists
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.database import async_session
+from app.models.job import AnalysisJob, JobStatus
+from app.models.ticket import Ticket, TicketStatus
+from app.services import ticket_stats  # noqa: F401 - registers ticket counter maintenance
+from app.services import ticket_events  # noqa: F401 - registers ticket event publishing
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[str], Awaitable[None]]
+
+# Ticket statuses that still need an analysis run
+PENDING_TICKET_STATUSES = (TicketStatus.OPEN, TicketStatus.ANALYZING)
+
+# Upper bound for the retry backoff
+MAX_BACKOFF_SECONDS = 600.0
+
+
+def _claimable_condition(now: datetime):
+    """Jobs that are due, or whose worker lost its lease"""
+    return or_(
+        and_(
+            AnalysisJob.status == JobStatus.PENDING,
+            AnalysisJob.available_at <= now,
+        ),
+        and_(
+            AnalysisJob.status == JobStatus.RUNNING,
+            AnalysisJob.lease_expires_at < now,
+        ),
+    )
+
+
+class AnalysisJobQueue:
+    """Persistent job queue with a pool of async workers"""
+
+    def __init__(
+        self,
+        handler: Optional[JobHandler] = None,
+        session_factory: Optional[async_sessionmaker] = None,
+        worker_count: Optional[int] = None,
+        lease_seconds: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        retry_backoff_seconds: Optional[float] = None,
+        poll_interval_seconds: Optional[float] = None,
+    ):
+        self._handler = handler
+        self._session_factory = session_factory or async_session
+        self.worker_count = worker_count or settings.analysis_worker_count
+        self.lease_seconds = lease_seconds or settings.analysis_job_lease_seconds
+        self.max_attempts = max_attempts or settings.analysis_job_max_attempts
+        self.retry_backoff_seconds = (
+            retry_backoff_seconds or settings.analysis_job_retry_backoff_seconds
+        )
+        self.poll_interval_seconds = (
+            poll_interval_seconds or settings.analysis_job_poll_interval_seconds
+        )
+
+        self._worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+        self._workers: List[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+
+    @property
+    def handler(self) -> JobHandler:
+        """Job handler (defaults to the normalization + solver pipeline)"""
+        if self._handler is None:
+            from app.services.analysis_service import run_normalization_and_solve
+            self._handler = run_normalization_and_solve
+        return self._handler
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    async def enqueue(self, db: AsyncSession, ticket_id: str) -> AnalysisJob:
+        """Persist an analysis job for a ticket and wake up the workers"""
+        jobs = await self.enqueue_many(db, [ticket_id])
+        return jobs[0]
+
+    async def enqueue_many(
+        self, db: AsyncSession, ticket_ids: List[str], commit: bool = True
+    ) -> List[AnalysisJob]:
+        """Persist analysis jobs for several tickets in one transaction"""
+        now = datetime.utcnow()
+        jobs = [
+            AnalysisJob(
+                ticket_id=ticket_id,
+                status=JobStatus.PENDING,
+                attempts=0,
+                max_attempts=self.max_attempts,
+                available_at=now,
+            )
+            for ticket_id in ticket_ids
+        ]
+        db.add_all(jobs)
+        if commit:
+            await db.commit()
+            self.notify()
+        else:
+            await db.flush()
+        return jobs
+
+    def notify(self) -> None:
+        """Wake up idle workers"""
+        self._wakeup.set()
+
+    # ------------------------------------------------------------------
+    # Consumer side
+    # ------------------------------------------------------------------
+
+    async def claim(self, worker_id: str) -> Optional[AnalysisJob]:
+        """
+        Claim the next due job
+
+        The claim is a conditional UPDATE, so two workers racing for the same
+        row cannot both win it.
+
+        Returns:
+            Claimed job or None if nothing is due
+        """
+        async with self._session_factory() as db:
+            while True:
+                now = datetime.utcnow()
+                result = await db.execute(
+                    select(AnalysisJob.id)
+                    .where(_claimable_condition(now))
+                    .order_by(AnalysisJob.available_at, AnalysisJob.id)
+                    .limit(1)
+                )
+                job_id = result.scalar_one_or_none()
+                if job_id is None:
+                    return None
+
+                result = await db.execute(
+                    update(AnalysisJob)
+                    .where(AnalysisJob.id == job_id, _claimable_condition(now))
+                    .values(
+                        status=JobStatus.RUNNING,
+                        locked_by=worker_id,
+                        lease_expires_at=now + timedelta(seconds=self.lease_seconds),
+                        attempts=AnalysisJob.attempts + 1,
+                    )
+                )
+                await db.commit()
+                if result.rowcount == 1:
+                    return await db.get(AnalysisJob, job_id)
+                # Lost the race to another worker - look for the next job
+
+    async def renew_lease(self, job_id: int, worker_id: str) -> bool:
+        """Extend the lease of a running job owned by this worker"""
+        async with self._session_factory() as db:
+            result = await db.execute(
+                update(AnalysisJob)
+                .where(
+                    AnalysisJob.id == job_id,
+                    AnalysisJob.status == JobStatus.RUNNING,
+                    AnalysisJob.locked_by == worker_id,
+                )
+                .values(
+                    lease_expires_at=datetime.utcnow() + timedelta(seconds=self.lease_seconds)
+                )
+            )
+            await db.commit()
+            return result.rowcount == 1
+
+    @staticmethod
+    def _owned_by(job_id: int, worker_id: str):
+        """Condition matching a running job whose lease this worker still holds"""
+        return and_(
+            AnalysisJob.id == job_id,
+            AnalysisJob.status == JobStatus.RUNNING,
+            AnalysisJob.locked_by == worker_id,
+        )
+
+    async def complete(self, job_id: int, worker_id: str) -> bool:
+        """
+        Mark a job as done
+
+        Returns:
+            False if the worker no longer holds the lease (nothing is changed)
+        """
+        async with self._session_factory() as db:
+            result = await db.execute(
+                update(AnalysisJob)
+                .where(self._owned_by(job_id, worker_id))
+                .values(status=JobStatus.DONE, locked_by=None, lease_expires_at=None)
+            )
+            await db.commit()
+            return result.rowcount == 1
+
+    async def fail(self, job_id: int, worker_id: str, error: str) -> Optional[AnalysisJob]:
+        """
+        Record a failed attempt
+
+        The job is rescheduled with exponential backoff until it runs out of
+        attempts; the ticket is then handed over for manual processing.
+
+        Returns:
+            Updated job, or None if the worker no longer holds the lease
+            (nothing is changed)
+        """
+        async with self._session_factory() as db:
+            job = await db.get(AnalysisJob, job_id)
+            if job is None:
+                return None
+
+            values = {"last_error": error, "locked_by": None, "lease_expires_at": None}
+            exhausted = job.attempts >= job.max_attempts
+            if exhausted:
+                values["status"] = JobStatus.FAILED
+            else:
+                backoff = min(
+                    self.retry_backoff_seconds * (2 ** (job.attempts - 1)),
+                    MAX_BACKOFF_SECONDS,
+                )
+                values["status"] = JobStatus.PENDING
+                values["available_at"] = datetime.utcnow() + timedelta(seconds=backoff)
+
+            # attempts only changes on claim, which also changes locked_by, so
+            # the values above stay valid if the conditional update matches
+            result = await db.execute(
+                update(AnalysisJob)
+                .where(self._owned_by(job_id, worker_id))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount != 1:
+                await db.rollback()
+                return None
+
+            if exhausted:
+                ticket = await db.get(Ticket, job.ticket_id)
+                if ticket and ticket.status in PENDING_TICKET_STATUSES:
+                    ticket.status = TicketStatus.MANUAL_REQUIRED
+                    ticket.reject_reason = f"[분석 실패] {error}"
+                logger.error(f"Analysis job {job.id} for {job.ticket_id} failed permanently: {error}")
+            else:
+                logger.warning(
+                    f"Analysis job {job.id} for {job.ticket_id} failed "
+                    f"(attempt {job.attempts}/{job.max_attempts}), retrying in {backoff:.0f}s: {error}"
+                )
+
+            await db.commit()
+            await db.refresh(job)
+            return job
+
+    async def recover(self) -> int:
+        """
+        Re-enqueue tickets orphaned by a previous process
+
+        Tickets left in OPEN/ANALYZING without a pending or running job get a
+        fresh job. Running jobs of a dead worker are picked up by ``claim``
+        once their lease expires.
+
+        Returns:
+            Number of jobs created
+        """
+        async with self._session_factory() as db:
+            active_job = exists().where(
+                AnalysisJob.ticket_id == Ticket.ticket_id,
+                AnalysisJob.status.in_([JobStatus.PENDING, JobStatus.RUNNING]),
+            )
+            result = await db.execute(
+                select(Ticket.ticket_id)
+                .where(Ticket.status.in_(PENDING_TICKET_STATUSES), ~active_job)
+                .order_by(Ticket.created_at)
+            )
+            ticket_ids = list(result.scalars().all())
+            if ticket_ids:
+                await self.enqueue_many(db, ticket_ids)
+                logger.info(f"Recovered {len(ticket_ids)} orphaned tickets")
+            return len(ticket_ids)
+
+    async def run_next(self, worker_id: str) -> bool:
+        """
+        Claim and run a single job
+
+        Returns:
+            True if a job was processed
+        """
+        job = await self.claim(worker_id)
+        if job is None:
+            return False
+
+        handler = asyncio.create_task(self.handler(job.ticket_id))
+        lease_lost = asyncio.Event()
+        heartbeat = asyncio.create_task(self._heartbeat(job.id, worker_id, handler, lease_lost))
+        try:
+            await handler
+        except asyncio.CancelledError:
+            if not lease_lost.is_set():
+                raise
+            # Another worker may own the job now; leave its state alone
+            logger.warning(f"Abandoned analysis job {job.id} for {job.ticket_id}: lease lost")
+        except Exception as e:
+            logger.error(f"Analysis job {job.id} for {job.ticket_id} raised: {e}")
+            if await self.fail(job.id, worker_id, str(e)) is None:
+                logger.warning(f"Lost lease on analysis job {job.id}; failure not recorded")
+        else:
+            if not await self.complete(job.id, worker_id):
+                logger.warning(f"Lost lease on analysis job {job.id}; completion not recorded")
+        finally:
+            heartbeat.cancel()
+        return True
+
+    async def _heartbeat(
+        self, job_id: int, worker_id: str, handler: asyncio.Task, lease_lost: asyncio.Event
+    ) -> None:
+        """Keep renewing the lease while the handler runs; cancel it if the lease is lost"""
+        interval = max(self.lease_seconds / 3, 1.0)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                renewed = await self.renew_lease(job_id, worker_id)
+            except Exception as e:
+                logger.error(f"Failed to renew lease on analysis job {job_id}: {e}")
+                continue
+            if not renewed:
+                logger.warning(f"Lost lease on analysis job {job_id}; cancelling its handler")
+                lease_lost.set()
+                handler.cancel()
+                return
+
+    async def _worker_loop(self, worker_id: str) -> None:
+        """Worker main loop"""
+        logger.info(f"Analysis worker started: {worker_id}")
+        while not self._stopping:
+            try:
+                if await self.run_next(worker_id):
+                    continue
+            except Exception as e:
+                logger.error(f"Analysis worker {worker_id} error: {e}")
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Recover orphaned tickets and start the worker pool"""
+        if self._workers:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        try:
+            await self.recover()
+        except Exception as e:
+            logger.error(f"Failed to recover orphaned tickets: {e}")
+
+        for i in range(self.worker_count):
+            worker_id = f"{self._worker_prefix}:{i}"
+            self._workers.append(asyncio.create_task(self._worker_loop(worker_id)))
+        logger.info(f"Started {self.worker_count} analysis workers")
+
+    async def stop(self) -> None:
+        """Stop the worker pool; in-flight jobs are re-claimed after restart"""
+        self._stopping = True
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        logger.info("Analysis workers stopped")
+
+
+_job_queue: Optional[AnalysisJobQueue] = None
+
+
+def get_job_queue() -> AnalysisJobQueue:
+    """Get singleton analysis job queue"""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = AnalysisJobQueue()
+    return _job_queue
@@ -0,0 +1,102 @@
+"""
+Incremental JSON scanner for streamed LLM output
+"""
+
+from typing import List, Optional
+
+# Closing bracket expected for each opening bracket
+_CLOSING = {"{": "}", "[": "]"}
+
+
+class IncrementalJSONScanner:
+    """
+    Track the first top-level JSON object in a stream of text chunks
+
+    The scanner skips any prelude before the first ``{`` (markdown fences,
+    short chatter) and reports ``complete`` as soon as that object's closing
+    brace arrives, so the caller can stop generation right there. It reports
+    ``failed`` when the output clearly cannot contain a valid object: the
+    prelude grows past ``max_prefix_chars`` or brackets are mismatched.
+    """
+
+    def __init__(self, max_prefix_chars: int = 2000):
+        self.max_prefix_chars = max_prefix_chars
+        self.complete = False
+        self.failed = False
+        self.error: Optional[str] = None
+
+        self._buffer: List[str] = []
+        self._length = 0
+        self._start: Optional[int] = None
+        self._end: Optional[int] = None
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+
+    @property
+    def done(self) -> bool:
+        """Whether more input can change the outcome"""
+        return self.complete or self.failed
+
+    @property
+    def text(self) -> str:
+        """All text fed so far"""
+        return "".join(self._buffer)
+
+    @property
+    def json_text(self) -> Optional[str]:
+        """The complete top-level object, once closed"""
+        if not self.complete:
+            return None
+        return self.text[self._start:self._end]
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Consume a chunk of streamed output
+
+        Returns:
+            True once the scanner is done (complete or failed)
+        """
+        if self.done or not chunk:
+            return self.done
+
+        offset = self._length
+        self._buffer.append(chunk)
+        self._length += len(chunk)
+
+        for i, char in enumerate(chunk):
+            if self._start is None:
+                if char == "{":
+                    self._start = offset + i
+                    self._stack.append("}")
+                elif offset + i >= self.max_prefix_chars:
+                    return self._fail("no JSON object within output prefix")
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in _CLOSING:
+                self._stack.append(_CLOSING[char])
+            elif char in "}]":
+                if self._stack.pop() != char:
+                    return self._fail(f"mismatched '{char}' at offset {offset + i}")
+                if not self._stack:
+                    self._end = offset + i + 1
+                    self.complete = True
+                    return True
+
+        return False
+
+    def _fail(self, error: str) -> bool:
+        self.failed = True
+        self.error = error
+        return True
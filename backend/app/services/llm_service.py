@@ -2,28 +2,195 @@
 LLM Service - Provider abstraction layer
 """
 
-from typing import Optional, Dict, Any
+import asyncio
+import enum
+import heapq
+import itertools
+import json
+import logging
+import re
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator, Callable
+import httpx
 from langchain_community.llms import Ollama
 from langchain.schema import BaseMessage, HumanMessage, SystemMessage
 from app.config import settings
+from app.services.llm_cache import LLMResponseCache
+from app.services.json_stream import IncrementalJSONScanner
+
+logger = logging.getLogger(__name__)
+
+
+class LLMPriority(enum.IntEnum):
+    """LLM call priority class (lower value is served first)"""
+    HIGH = 0        # normalization, high-urgency analysis
+    NORMAL = 1      # medium-urgency analysis
+    LOW = 2         # low-urgency analysis
+    BACKFILL = 3    # re-analysis, batch/backfill work
+
+
+class LLMAdmissionController:
+    """
+    Bounded in-flight limiter with priority classes and aging
+
+    At most ``max_in_flight`` calls reach the model at once; the rest wait in
+    a priority queue. Waiting requests age linearly: each priority class is
+    worth ``aging_seconds`` of waiting, so a BACKFILL call that has waited
+    long enough is served before a freshly queued HIGH call.
+    """
+
+    def __init__(self, max_in_flight: int, aging_seconds: float):
+        self.max_in_flight = max_in_flight
+        self.aging_seconds = aging_seconds
+        self._in_flight = 0
+        self._waiters: List[Tuple[float, int, LLMPriority, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._queued: Dict[LLMPriority, int] = {p: 0 for p in LLMPriority}
+        self._stats: Dict[LLMPriority, Dict[str, float]] = {
+            p: {"requests": 0, "total_wait": 0.0, "max_wait": 0.0} for p in LLMPriority
+        }
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently holding a slot"""
+        return self._in_flight
+
+    @asynccontextmanager
+    async def slot(self, priority: LLMPriority = LLMPriority.NORMAL):
+        """Hold an admission slot for the duration of an LLM call"""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, priority: LLMPriority = LLMPriority.NORMAL) -> float:
+        """
+        Wait for an admission slot
+
+        Returns:
+            Seconds spent waiting in the queue
+        """
+        loop = asyncio.get_running_loop()
+        enqueued_at = loop.time()
+
+        # Drop abandoned waiters so they cannot block the fast path
+        self._dispatch()
+        if self._in_flight < self.max_in_flight and not self._waiters:
+            self._in_flight += 1
+            self._record_wait(priority, 0.0)
+            return 0.0
+
+        future = loop.create_future()
+        sort_key = enqueued_at + int(priority) * self.aging_seconds
+        heapq.heappush(self._waiters, (sort_key, next(self._seq), priority, future))
+        self._queued[priority] += 1
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was granted just before the caller gave up - pass it on
+                self.release()
+            else:
+                self._queued[priority] -= 1
+            raise
+
+        waited = loop.time() - enqueued_at
+        self._record_wait(priority, waited)
+        return waited
+
+    def release(self) -> None:
+        """Return a slot and admit the next waiter"""
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._waiters and self._in_flight < self.max_in_flight:
+            _, _, priority, future = heapq.heappop(self._waiters)
+            if future.cancelled():
+                continue
+            self._queued[priority] -= 1
+            self._in_flight += 1
+            future.set_result(None)
+
+    def _record_wait(self, priority: LLMPriority, waited: float) -> None:
+        stats = self._stats[priority]
+        stats["requests"] += 1
+        stats["total_wait"] += waited
+        stats["max_wait"] = max(stats["max_wait"], waited)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Queue depth and queue-wait metrics per priority class"""
+        priorities = {}
+        for priority, stats in self._stats.items():
+            requests = int(stats["requests"])
+            priorities[priority.name.lower()] = {
+                "requests": requests,
+                "queued": self._queued[priority],
+                "avg_wait_seconds": stats["total_wait"] / requests if requests else 0.0,
+                "max_wait_seconds": stats["max_wait"],
+            }
+        return {
+            "in_flight": self._in_flight,
+            "max_in_flight": self.max_in_flight,
+            "queued": sum(self._queued.values()),
+            "priorities": priorities,
+        }
+
+
+def _is_json_response(response: str) -> bool:
+    """Whether a response contains a parseable JSON object"""
+    match = re.search(r"\{[\s\S]*\}", response or "")
+    if not match:
+        return False
+    try:
+        json.loads(match.group(0))
+        return True
+    except json.JSONDecodeError:
+        return False
 
 
 class LLMService:
     """LLM service abstraction layer"""
 
-    def __init__(self):
-        """Initialize LLM service with Ollama"""
+    def __init__(
+        self,
+        cache: Optional[LLMResponseCache] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialize LLM service with Ollama
+
+        Args:
+            cache: Response cache (default: shared file cache if enabled)
+            transport: Custom transport for streaming calls (e.g. httpx.MockTransport in tests)
+        """
         self.llm = Ollama(
             base_url=settings.ollama_base_url,
             model=settings.ollama_model,
             temperature=0.1,  # Low temperature for consistent outputs
         )
+        self.admission = LLMAdmissionController(
+            max_in_flight=settings.llm_max_in_flight,
+            aging_seconds=settings.llm_priority_aging_seconds,
+        )
+        if cache is None and settings.llm_cache_enabled:
+            cache = LLMResponseCache()
+        self.cache = cache
+        # Streaming talks to Ollama directly: Ollama.astream in the pinned
+        # langchain-community (0.0.10) passes its arguments in the wrong order
+        self._http = httpx.AsyncClient(
+            base_url=settings.ollama_base_url, timeout=None, transport=transport
+        )
 
     async def generate(
         self,
         system_prompt: str,
         user_prompt: str,
         temperature: Optional[float] = None,
+        priority: LLMPriority = LLMPriority.NORMAL,
+        timeout: Optional[float] = None,
     ) -> str:
         """
         Generate text using LLM
@@ -32,6 +199,8 @@ class LLMService:
             system_prompt: System instruction
             user_prompt: User input
             temperature: Override default temperature
+            priority: Admission priority class
+            timeout: Timeout in seconds for the model call (queue wait excluded)
 
         Returns:
             Generated text
@@ -39,33 +208,164 @@ class LLMService:
         # Combine system and user prompts
         full_prompt = f"{system_prompt}\n\n{user_prompt}"
 
-        # Override temperature if provided
-        if temperature is not None:
-            self.llm.temperature = temperature
-
-        # Generate
-        response = await self.llm.ainvoke(full_prompt)
+        # Per-call options: self.llm is shared by concurrent calls
+        options = {} if temperature is None else {"temperature": temperature}
+        async with self.admission.slot(priority):
+            response = await asyncio.wait_for(self.llm.ainvoke(full_prompt, **options), timeout)
 
         return response
 
+    async def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: Optional[float] = None,
+        priority: LLMPriority = LLMPriority.NORMAL,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream generated tokens
+
+        The admission slot is held until the stream is exhausted or closed;
+        closing the iterator early aborts the request to the model.
+
+        Args:
+            system_prompt: System instruction
+            user_prompt: User input
+            temperature: Override default temperature
+            priority: Admission priority class
+            timeout: Timeout in seconds for the whole generation (queue wait excluded)
+
+        Yields:
+            Generated text chunks
+        """
+        full_prompt = f"{system_prompt}\n\n{user_prompt}"
+
+        temperature = self._temperature(temperature)
+        async with self.admission.slot(priority):
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout if timeout is not None else None
+            chunks = self._stream_generate(full_prompt, temperature)
+            try:
+                while True:
+                    remaining = None if deadline is None else max(deadline - loop.time(), 0)
+                    try:
+                        chunk = await asyncio.wait_for(chunks.__anext__(), remaining)
+                    except StopAsyncIteration:
+                        break
+                    yield chunk
+            finally:
+                await chunks.aclose()
+
+    def _temperature(self, temperature: Optional[float]) -> float:
+        """Temperature of a call (the model default unless overridden)"""
+        return temperature if temperature is not None else self.llm.temperature
+
+    async def _stream_generate(self, prompt: str, temperature: float) -> AsyncIterator[str]:
+        """Stream Ollama's /api/generate; closing the iterator closes the connection"""
+        payload = {
+            "model": self.llm.model,
+            "prompt": prompt,
+            "stream": True,
+            "options": {"temperature": temperature},
+        }
+        async with self._http.stream("POST", "/api/generate", json=payload) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                data = json.loads(line)
+                if data.get("error"):
+                    raise ValueError(f"Ollama error: {data['error']}")
+                if data.get("response"):
+                    yield data["response"]
+                if data.get("done"):
+                    return
+
+    async def _generate_json_streaming(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: Optional[float],
+        priority: LLMPriority,
+        timeout: Optional[float],
+    ) -> str:
+        """Stream a JSON answer and stop as soon as the top-level object closes"""
+        scanner = IncrementalJSONScanner(settings.llm_stream_max_prefix_chars)
+        chunks = self.stream(system_prompt, user_prompt, temperature, priority, timeout)
+        try:
+            async for chunk in chunks:
+                if scanner.feed(chunk):
+                    break
+        finally:
+            await chunks.aclose()
+
+        if scanner.failed:
+            logger.warning(f"Aborted LLM stream early: {scanner.error}")
+        return scanner.json_text or scanner.text
+
     async def generate_json(
         self,
         system_prompt: str,
         user_prompt: str,
         temperature: Optional[float] = None,
+        priority: LLMPriority = LLMPriority.NORMAL,
+        timeout: Optional[float] = None,
+        use_cache: bool = True,
+        stream: Optional[bool] = None,
+        validate: Optional[Callable[[str], bool]] = None,
     ) -> str:
         """
         Generate JSON output using LLM
 
+        Low-temperature calls are served from the response cache when an
+        identical prompt was answered before. Only responses that pass
+        ``validate`` are cached, so a retry after an unusable answer asks the
+        model again. Cache reads and writes run off the event loop.
+
         Args:
             system_prompt: System instruction (should specify JSON format)
             user_prompt: User input
             temperature: Override default temperature
+            priority: Admission priority class
+            timeout: Timeout in seconds for the model call (queue wait excluded)
+            use_cache: Set False to bypass the response cache for this call
+            stream: Stream and stop at the end of the JSON object
+                (defaults to settings.llm_streaming)
+            validate: Whether a response is usable by the caller, e.g. passes
+                its schema (default: contains a parseable JSON object)
 
         Returns:
             Generated JSON string (needs parsing)
         """
-        response = await self.generate(system_prompt, user_prompt, temperature)
+        cache_key = None
+        effective_temperature = self._temperature(temperature)
+        if (
+            use_cache
+            and self.cache is not None
+            and effective_temperature <= settings.llm_cache_max_temperature
+        ):
+            cache_key = self.cache.make_key(
+                self.llm.model, system_prompt, user_prompt, effective_temperature
+            )
+            cached = await asyncio.to_thread(self.cache.get, cache_key)
+            if cached is not None:
+                return cached
+
+        if stream is None:
+            stream = settings.llm_streaming
+        if stream:
+            response = await self._generate_json_streaming(
+                system_prompt, user_prompt, temperature, priority, timeout
+            )
+        else:
+            response = await self.generate(
+                system_prompt, user_prompt, temperature, priority, timeout
+            )
+
+        if cache_key is not None and (validate or _is_json_response)(response):
+            await asyncio.to_thread(self.cache.set, cache_key, response)
+
         return response
 
 
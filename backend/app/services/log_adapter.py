@@ -0,0 +1,184 @@
+"""
+Log adapters: async access to a log backend for the Solver Agent tools
+
+The tools (get_logs, analyze_service_error_patterns) only talk to a
+``LogAdapter``; which backend serves them is configuration
+(``LOG_ADAPTER``), so a real log system plugs in by adding an adapter
+rather than by changing the agent.
+
+- ``FileLogAdapter``: the local mock log service (scenario files or the
+  on-disk log archive), queried on a bounded thread pool
+- ``HttpLogAdapter``: any server exposing the mock log API
+  (``app.mock.log_server``), over one pooled HTTP client
+
+Logs are paged with opaque cursors; ``search_many`` fetches several queries
+concurrently within the adapter's pool.
+"""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+import httpx
+
+from app.config import settings
+from app.mock.log_service import MockLogService, get_mock_log_service
+from app.mock.schemas import ErrorPatternStats, LogEntry, LogQueryParams, LogQueryResult
+
+logger = logging.getLogger(__name__)
+
+
+class LogAdapter(ABC):
+    """Log backend interface"""
+
+    @abstractmethod
+    async def search_logs(self, params: LogQueryParams, cursor: Optional[str] = None) -> LogQueryResult:
+        """
+        One page of logs matching the query, oldest first
+
+        Args:
+            params: Query parameters (limit is the page size)
+            cursor: next_cursor of the previous page (None for the first page)
+
+        Returns:
+            Page of logs with the total match count and the next cursor
+        """
+
+    @abstractmethod
+    async def analyze_error_patterns(self, params: LogQueryParams) -> ErrorPatternStats:
+        """Error pattern summary over every log matching the query"""
+
+    async def search_many(self, queries: Sequence[LogQueryParams]) -> List[LogQueryResult]:
+        """First page of several queries, fetched concurrently"""
+        return list(await asyncio.gather(*(self.search_logs(params) for params in queries)))
+
+    async def iter_logs(self, params: LogQueryParams, max_pages: Optional[int] = None) -> AsyncIterator[LogEntry]:
+        """Follow cursors through all (or the first ``max_pages``) pages"""
+        cursor = None
+        pages = 0
+        while max_pages is None or pages < max_pages:
+            result = await self.search_logs(params, cursor)
+            pages += 1
+            for log in result.logs:
+                yield log
+            cursor = result.next_cursor
+            if not cursor:
+                return
+
+    async def close(self) -> None:
+        """Release pooled resources"""
+
+
+class FileLogAdapter(LogAdapter):
+    """Local mock log service (scenario files or log archive)"""
+
+    def __init__(self, log_service: Optional[MockLogService] = None, max_workers: int = 4):
+        """
+        Args:
+            log_service: Mock log service (default: the shared instance)
+            max_workers: Queries running at once (size of the thread pool)
+        """
+        self._log_service = log_service
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="log-adapter")
+
+    @property
+    def log_service(self) -> MockLogService:
+        if self._log_service is None:
+            self._log_service = get_mock_log_service()
+        return self._log_service
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def search_logs(self, params: LogQueryParams, cursor: Optional[str] = None) -> LogQueryResult:
+        return await self._run(self.log_service.query_logs, params, cursor)
+
+    async def analyze_error_patterns(self, params: LogQueryParams) -> ErrorPatternStats:
+        return await self._run(self.log_service.analyze_error_patterns, params)
+
+    async def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+class HttpLogAdapter(LogAdapter):
+    """Log API over HTTP with a shared connection pool"""
+
+    def __init__(
+        self,
+        base_url: str,
+        max_connections: int = 10,
+        timeout: float = 10.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Args:
+            base_url: Log API base URL (e.g. a local app.mock.log_server)
+            max_connections: Connection pool size (bounds concurrent requests)
+            timeout: Request timeout in seconds
+            transport: Custom transport (e.g. httpx.ASGITransport in tests)
+        """
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            transport=transport,
+        )
+
+    @staticmethod
+    def _query(params: LogQueryParams, **extra: Any) -> Dict[str, Any]:
+        query = params.model_dump(mode="json", exclude_none=True)
+        query.update({key: value for key, value in extra.items() if value is not None})
+        return query
+
+    async def search_logs(self, params: LogQueryParams, cursor: Optional[str] = None) -> LogQueryResult:
+        response = await self._client.get("/logs", params=self._query(params, cursor=cursor))
+        response.raise_for_status()
+        return LogQueryResult.model_validate(response.json())
+
+    async def analyze_error_patterns(self, params: LogQueryParams) -> ErrorPatternStats:
+        response = await self._client.get("/logs/error-patterns", params=self._query(params))
+        response.raise_for_status()
+        return ErrorPatternStats.model_validate(response.json())
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+_log_adapter_instance: Optional[LogAdapter] = None
+
+
+def create_log_adapter(kind: Optional[str] = None) -> LogAdapter:
+    """
+    Create a log adapter
+
+    Args:
+        kind: "file" or "http" (default: settings.log_adapter)
+    """
+    kind = kind or settings.log_adapter
+    if kind == "file":
+        return FileLogAdapter(max_workers=settings.log_adapter_max_workers)
+    if kind == "http":
+        return HttpLogAdapter(
+            settings.log_adapter_url,
+            max_connections=settings.log_adapter_max_connections,
+            timeout=settings.log_adapter_timeout_seconds,
+        )
+    raise ValueError(f"Unknown log adapter: {kind}")
+
+
+def get_log_adapter() -> LogAdapter:
+    """Get singleton log adapter instance"""
+    global _log_adapter_instance
+    if _log_adapter_instance is None:
+        _log_adapter_instance = create_log_adapter()
+    return _log_adapter_instance
+
+
+async def close_log_adapter() -> None:
+    """Close the singleton log adapter (application shutdown)"""
+    global _log_adapter_instance
+    if _log_adapter_instance is not None:
+        await _log_adapter_instance.close()
+        _log_adapter_instance = None
@@ -2,20 +2,24 @@
 RAG Service for VOC similarity search and knowledge management
 """
 
+import hashlib
 import json
 import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from app.rag import VocRetriever, VocDocument, SearchResult, SimilarCasesContext
 from app.rag.retriever import get_retriever
-from app.rag.vector_store import get_vector_store
+from app.rag.vector_store import VocVectorStore, get_vector_store
 
 logger = logging.getLogger(__name__)
 
 # Seed data path
 SEED_DATA_PATH = Path(__file__).parent.parent / "data" / "seed" / "sample_vocs.json"
 
+# Metadata key holding the content hash of a seed document
+SEED_HASH_KEY = "seed_hash"
+
 
 class RagService:
     """Service for RAG operations"""
@@ -36,6 +40,19 @@ class RagService:
             min_similarity=min_similarity,
         )
 
+    async def asearch_similar_vocs(
+        self,
+        query: str,
+        top_k: int = 5,
+        min_similarity: float = 0.5,
+    ) -> List[SearchResult]:
+        """Search for similar VOC cases without blocking the event loop"""
+        return await self._retriever.aretrieve_similar_cases(
+            query=query,
+            top_k=top_k,
+            min_similarity=min_similarity,
+        )
+
     def get_agent_context(self, voc_text: str, top_k: int = 3) -> str:
         """Get context string for agent prompt"""
         context = self._retriever.get_context_for_agent(voc_text, top_k=top_k)
@@ -45,6 +62,10 @@ class RagService:
         """Add a VOC case document to the knowledge base"""
         self._retriever.add_resolved_case(document)
 
+    async def aadd_voc_case(self, document: VocDocument) -> None:
+        """Add a VOC case document without blocking the event loop"""
+        await self._retriever.aadd_resolved_case(document)
+
     def add_resolved_ticket(
         self,
         ticket_id: str,
@@ -74,18 +95,40 @@ class RagService:
         return get_vector_store().get_document_count()
 
 
-def load_seed_data() -> int:
-    """Load seed VOC data into vector store"""
-    if not SEED_DATA_PATH.exists():
-        logger.warning(f"Seed data file not found: {SEED_DATA_PATH}")
-        return 0
-
-    with open(SEED_DATA_PATH, "r", encoding="utf-8") as f:
-        seed_data = json.load(f)
-
-    documents = []
-    for item in seed_data:
-        doc = VocDocument(
+def seed_document_hash(item: Dict[str, Any]) -> str:
+    """Content hash of a seed document"""
+    return hashlib.sha256(
+        json.dumps(item, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+
+def sync_seed_documents(
+    items: List[Dict[str, Any]],
+    vector_store: Optional[VocVectorStore] = None,
+) -> int:
+    """
+    Upsert seed documents whose content changed
+
+    Each stored seed document carries the hash of its seed entry, so
+    unchanged documents are skipped without re-embedding them.
+
+    Args:
+        items: Seed entries (sample_vocs.json format)
+        vector_store: Vector store (default: the shared instance)
+
+    Returns:
+        Number of documents upserted
+    """
+    vector_store = vector_store or get_vector_store()
+    hashes = {item["ticket_id"]: seed_document_hash(item) for item in items}
+    stored = vector_store.get_metadatas(list(hashes))
+    changed = [
+        item for item in items
+        if stored.get(item["ticket_id"], {}).get(SEED_HASH_KEY) != hashes[item["ticket_id"]]
+    ]
+
+    documents = [
+        VocDocument(
             ticket_id=item["ticket_id"],
             raw_voc=item["raw_voc"],
             summary=item.get("summary"),
@@ -95,16 +138,44 @@ def load_seed_data() -> int:
             resolution=item.get("resolution"),
             confidence=item.get("confidence"),
         )
-        documents.append(doc)
-
+        for item in changed
+    ]
     if documents:
-        retriever = get_retriever()
-        retriever.add_resolved_cases(documents)
-        logger.info(f"Loaded {len(documents)} seed documents")
-
+        vector_store.add_documents(
+            documents, extra_metadata=[{SEED_HASH_KEY: hashes[doc.ticket_id]} for doc in documents]
+        )
+        logger.info(f"Upserted {len(documents)} of {len(items)} seed documents")
     return len(documents)
 
 
+def load_seed_data(path: Optional[Path] = None) -> int:
+    """
+    Load seed VOC data into vector store
+
+    Documents already stored with the same content are not re-embedded.
+
+    Args:
+        path: Seed JSON file (default: bundled sample VOCs), e.g. vocs.json
+            of a generated workload (app.mock.workload)
+
+    Returns:
+        Number of seed documents in the file
+    """
+    path = path or SEED_DATA_PATH
+    if not path.exists():
+        logger.warning(f"Seed data file not found: {path}")
+        return 0
+
+    with open(path, "r", encoding="utf-8") as f:
+        seed_data = json.load(f)
+
+    if seed_data:
+        sync_seed_documents(seed_data)
+        logger.info(f"Loaded {len(seed_data)} seed documents")
+
+    return len(seed_data)
+
+
 _rag_service_instance: Optional[RagService] = None
 
 
@@ -0,0 +1,250 @@
+"""
+In-process ticket event bus
+
+Every ticket status change is published to subscribers once the
+transaction that made it commits:
+
+- ORM changes (create, normalize, solve, job failure) are collected by an
+  ``after_flush`` hook.
+- Conditional UPDATE ... RETURNING transitions, which bypass the unit of
+  work, call ``record_transition_events`` explicitly.
+
+Collected events are kept in ``Session.info`` until ``after_commit``, so
+rolled back changes are never published. The bus keeps a bounded replay
+buffer so a reconnecting SSE client can resume from its Last-Event-ID.
+
+The bus lives in the API process; it must only be used from the event
+loop thread.
+"""
+
+import asyncio
+import json
+from collections import deque
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Any, Deque, Iterable, List, Optional, Set
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.ticket import Ticket, TicketStatus
+
+# Session.info key holding events of the current transaction
+_PENDING_KEY = "ticket_events"
+
+
+def _value(enum_value: Any) -> Optional[str]:
+    return getattr(enum_value, "value", enum_value)
+
+
+@dataclass(frozen=True)
+class TicketEvent:
+    """Status change of one ticket"""
+    ticket_id: str
+    status: str
+    previous_status: Optional[str]  # None for a newly created ticket
+    urgency: Optional[str]
+    occurred_at: str
+    id: int = 0  # Assigned by the bus on publish
+
+    def matches(self, status: Optional[Set[str]], urgency: Optional[str]) -> bool:
+        """Whether the event concerns the given filters
+
+        A status filter matches tickets entering or leaving those statuses,
+        so a filtered view learns about tickets it has to drop as well.
+        """
+        if status and self.status not in status and self.previous_status not in status:
+            return False
+        if urgency and self.urgency != urgency:
+            return False
+        return True
+
+    def to_sse(self) -> str:
+        """Format as a Server-Sent Events message"""
+        data = json.dumps({
+            "ticket_id": self.ticket_id,
+            "status": self.status,
+            "previous_status": self.previous_status,
+            "urgency": self.urgency,
+            "occurred_at": self.occurred_at,
+        }, ensure_ascii=False)
+        return f"id: {self.id}\nevent: status\ndata: {data}\n\n"
+
+
+# Sent when events were lost (replay gap or slow consumer); clients refetch
+RESET_SSE = "event: reset\ndata: {}\n\n"
+
+
+class TicketEventSubscription:
+    """Queue of events for one subscriber
+
+    A None in the queue marks lost events (replay gap or slow consumer).
+    """
+
+    def __init__(self, replay: Iterable[TicketEvent], reset: bool, max_queue_size: int):
+        self._replay: Deque[TicketEvent] = deque(replay)
+        self._queue: asyncio.Queue = asyncio.Queue(max_queue_size)
+        if reset:
+            self._queue.put_nowait(None)
+
+    def put(self, ticket_event: TicketEvent) -> None:
+        try:
+            self._queue.put_nowait(ticket_event)
+        except asyncio.QueueFull:
+            # Slow consumer: drop its backlog and tell it to refetch
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(None)
+
+    async def get(self) -> Optional[TicketEvent]:
+        """
+        Next event for this subscriber
+
+        Returns:
+            The next event, or None when the subscriber missed events and
+            should resynchronise
+        """
+        if self._replay:
+            return self._replay.popleft()
+        return await self._queue.get()
+
+
+class TicketEventBus:
+    """Fan-out of ticket events with a bounded replay buffer"""
+
+    def __init__(
+        self,
+        buffer_size: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+    ):
+        self.buffer_size = buffer_size or settings.ticket_events_buffer_size
+        self.max_queue_size = max_queue_size or settings.ticket_events_queue_size
+        self._buffer: Deque[TicketEvent] = deque(maxlen=self.buffer_size)
+        self._subscribers: Set[TicketEventSubscription] = set()
+        self._last_id = 0
+
+    @property
+    def last_event_id(self) -> int:
+        return self._last_id
+
+    def publish(self, ticket_events: Iterable[TicketEvent]) -> None:
+        """Assign ids to events, buffer them and fan them out"""
+        for ticket_event in ticket_events:
+            self._last_id += 1
+            ticket_event = replace(ticket_event, id=self._last_id)
+            self._buffer.append(ticket_event)
+            for subscription in self._subscribers:
+                subscription.put(ticket_event)
+
+    def subscribe(self, last_event_id: Optional[str] = None) -> TicketEventSubscription:
+        """
+        Register a subscriber
+
+        Args:
+            last_event_id: Last-Event-ID of a reconnecting client. Events
+                after it are replayed from the buffer; if they are no longer
+                buffered (or the id is from another process lifetime) the
+                subscription starts with a reset.
+
+        Returns:
+            Subscription to read events from (unsubscribe when done)
+        """
+        replay: List[TicketEvent] = []
+        reset = False
+        if last_event_id is not None:
+            try:
+                after = int(last_event_id)
+            except ValueError:
+                after = -1
+            oldest = self._buffer[0].id if self._buffer else self._last_id + 1
+            if after < oldest - 1 or after > self._last_id:
+                reset = True
+            else:
+                replay = [e for e in self._buffer if e.id > after]
+
+        subscription = TicketEventSubscription(replay, reset, self.max_queue_size)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: TicketEventSubscription) -> None:
+        self._subscribers.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+
+# Singleton instance
+_event_bus: Optional[TicketEventBus] = None
+
+
+def get_event_bus() -> TicketEventBus:
+    """Get singleton ticket event bus"""
+    global _event_bus
+    if _event_bus is None:
+        _event_bus = TicketEventBus()
+    return _event_bus
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat()
+
+
+def _pending(session: Session) -> List[TicketEvent]:
+    return session.info.setdefault(_PENDING_KEY, [])
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_ticket_events(session: Session, flush_context) -> None:
+    for obj in session.new:
+        if isinstance(obj, Ticket):
+            _pending(session).append(TicketEvent(
+                obj.ticket_id, _value(obj.status), None, _value(obj.urgency), _now()
+            ))
+
+    for obj in session.dirty:
+        if not isinstance(obj, Ticket):
+            continue
+        history = inspect(obj).attrs.status.history
+        if not history.deleted or not history.added or history.deleted[0] == history.added[0]:
+            continue
+        _pending(session).append(TicketEvent(
+            obj.ticket_id, _value(obj.status), _value(history.deleted[0]),
+            _value(obj.urgency), _now(),
+        ))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_ticket_events(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        get_event_bus().publish(pending)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_ticket_events(session: Session, transaction) -> None:
+    # Runs after after_commit; anything left belongs to a rolled back transaction
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+def record_transition_events(
+    db: AsyncSession, tickets: Iterable[Ticket], source: TicketStatus
+) -> None:
+    """
+    Queue events for tickets moved out of ``source`` by a Core UPDATE
+
+    The events are published when the session commits.
+
+    Args:
+        db: Session whose transaction performed the UPDATE
+        tickets: Updated tickets (as returned by RETURNING)
+        source: Status the tickets had before the UPDATE
+    """
+    now = _now()
+    _pending(db.sync_session).extend(
+        TicketEvent(t.ticket_id, _value(t.status), _value(source), _value(t.urgency), now)
+        for t in tickets
+    )
@@ -0,0 +1,82 @@
+"""
+Ticket export encoders
+
+Turn batches of ticket rows (see ``TicketService.export_tickets``) into CSV
+or NDJSON text, optionally gzip-compressed on the fly. Every stage works one
+batch at a time, so an export of any size is streamed with constant memory.
+"""
+
+import csv
+import enum
+import io
+import json
+import zlib
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Sequence
+
+from sqlalchemy import Row
+
+Batches = AsyncIterator[Sequence[Row]]
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+# Lets spreadsheet applications detect UTF-8 (Korean text)
+_UTF8_BOM = "\ufeff"
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+async def encode_csv(batches: Batches, fields: Sequence[str]) -> AsyncIterator[bytes]:
+    """Encode row batches as CSV with a header line"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write(_UTF8_BOM)
+    writer.writerow(fields)
+    async for rows in batches:
+        writer.writerows([_csv_value(v) for v in row] for row in rows)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        # Header only (no matching tickets)
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def encode_ndjson(batches: Batches, fields: Sequence[str]) -> AsyncIterator[bytes]:
+    """Encode row batches as one JSON object per line"""
+    async for rows in batches:
+        yield "".join(
+            json.dumps(dict(zip(fields, row)), ensure_ascii=False, default=_json_default) + "\n"
+            for row in rows
+        ).encode("utf-8")
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes], level: int = 6) -> AsyncIterator[bytes]:
+    """Compress a byte stream into a single gzip member"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
@@ -3,18 +3,33 @@ Ticket business logic service
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+import base64
+import json
 import random
-from sqlalchemy import select, func, desc
+from sqlalchemy import (
+    select, func, desc, asc, tuple_, type_coerce, literal, literal_column, bindparam,
+    or_, table, column, String, Row,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.models.ticket import Ticket, TicketStatus, Urgency
-from app.schemas.ticket import VOCCreate
+from sqlalchemy.orm import load_only
+from pydantic import ValidationError
+
+from app.config import settings
+from app.models.ticket import Ticket, TicketStatus, Urgency, ACTIVE_STATUSES
+from app.schemas.ticket import (
+    VOCCreate, TicketBulkActionItem, TicketBulkConfirmFilter, TicketBulkItemResult,
+    TicketConfirm, TicketReject, TicketComplete,
+)
 from app.agents.normalizer.agent import NormalizerAgent
 from app.agents.normalizer.schemas import NormalizerInput
 from app.agents.solver import get_solver_agent, SolverAgentInput
 from app.rag.schemas import VocDocument
 from app.services.rag_service import get_rag_service
+from app.services.ticket_transitions import (
+    apply_transition, apply_bulk_transition, TicketAction, TicketTransitionError,
+)
+from app.services.ticket_stats import get_change_version
 
 
 def generate_ticket_id() -> str:
@@ -28,6 +43,69 @@ def generate_ticket_id() -> str:
     return f"VOC-{date_str}-{seq}"
 
 
+# Payload schema of each bulk admin action
+BULK_PAYLOAD_SCHEMAS = {
+    TicketAction.CONFIRM: TicketConfirm,
+    TicketAction.REJECT: TicketReject,
+    TicketAction.COMPLETE: TicketComplete,
+}
+
+
+# FTS5 virtual table maintained by triggers (see app/models/ticket.py)
+ticket_fts = table("ticket_fts", column("ticket_id"))
+_FTS = literal_column("ticket_fts")
+
+# Trigram index cannot match terms shorter than this
+FTS_MIN_TERM_LENGTH = 3
+
+
+def build_search_terms(q: str) -> Tuple[Optional[str], List[str]]:
+    """
+    Split a search string into an FTS5 MATCH expression and short terms
+
+    Every whitespace-separated term must match (AND). Terms are quoted so
+    FTS5 operators in user input are taken literally. Terms too short for
+    the trigram index are returned separately for a LIKE fallback.
+
+    Returns:
+        (match expression or None, short terms)
+    """
+    long_terms, short_terms = [], []
+    for term in q.split():
+        (long_terms if len(term) >= FTS_MIN_TERM_LENGTH else short_terms).append(term)
+    match = " AND ".join('"{}"'.format(t.replace('"', '""')) for t in long_terms)
+    return match or None, short_terms
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def encode_cursor(created_at: str, ticket_id: str, direction: str) -> str:
+    """Encode a keyset position as an opaque URL-safe cursor"""
+    payload = json.dumps([created_at, ticket_id, direction], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str, str]:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, ticket_id, direction = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if direction not in ("next", "prev") or not isinstance(created_at, str) \
+            or not isinstance(ticket_id, str):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return created_at, ticket_id, direction
+
+
 class TicketService:
     """Ticket service for business logic"""
 
@@ -51,6 +129,49 @@ class TicketService:
 
         return ticket
 
+    async def create_tickets(self, vocs: List[VOCCreate]) -> List[Ticket]:
+        """
+        Create tickets for several VOCs without committing
+
+        The caller owns the transaction, so a whole batch is written with a
+        single commit.
+        """
+        ticket_ids = await self._allocate_ticket_ids(len(vocs))
+        tickets = [
+            Ticket(
+                ticket_id=ticket_id,
+                status=TicketStatus.OPEN,
+                raw_voc=voc.raw_voc,
+                customer_name=voc.customer_name,
+                channel=voc.channel,
+                received_at=voc.received_at,
+            )
+            for ticket_id, voc in zip(ticket_ids, vocs)
+        ]
+
+        self.db.add_all(tickets)
+        await self.db.flush()
+
+        return tickets
+
+    async def _allocate_ticket_ids(self, count: int) -> List[str]:
+        """Generate ticket IDs unique within the batch and the table"""
+        allocated: List[str] = []
+        while len(allocated) < count:
+            candidates = set()
+            while len(candidates) < count - len(allocated):
+                ticket_id = generate_ticket_id()
+                if ticket_id not in allocated:
+                    candidates.add(ticket_id)
+
+            result = await self.db.execute(
+                select(Ticket.ticket_id).where(Ticket.ticket_id.in_(candidates))
+            )
+            taken = set(result.scalars().all())
+            allocated.extend(candidates - taken)
+
+        return allocated
+
     async def normalize_ticket(self, ticket_id: str) -> Optional[Ticket]:
         """
         Run normalization on a ticket
@@ -132,6 +253,9 @@ class TicketService:
                     ticket_id=ticket.ticket_id,
                     raw_voc=ticket.raw_voc,
                     received_at=ticket.received_at,
+                    urgency=ticket.urgency.value if ticket.urgency else None,
+                    # Retries of a failed attempt yield to first-time analyses
+                    backfill=attempt > 0,
                 )
 
                 result = await solver.solve(solver_input)
@@ -227,43 +351,105 @@ class TicketService:
 
             # Add to vector database
             rag_service = get_rag_service()
-            rag_service.add_voc_case(voc_doc)
+            await rag_service.aadd_voc_case(voc_doc)
 
         except Exception as e:
             # Log error but don't fail the ticket update
             print(f"Failed to save ticket {ticket.ticket_id} to RAG: {e}")
 
-    async def get_ticket(self, ticket_id: str) -> Optional[Ticket]:
-        """Get ticket by ID"""
+    async def get_ticket(
+        self, ticket_id: str, fields: Optional[Sequence[str]] = None
+    ) -> Optional[Ticket]:
+        """
+        Get ticket by ID
+
+        Args:
+            ticket_id: Ticket ID
+            fields: Only load these columns (others stay unloaded)
+        """
+        query = select(Ticket).where(Ticket.ticket_id == ticket_id)
+        if fields:
+            query = query.options(self._load_only(fields))
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_ticket_version(self, ticket_id: str) -> Optional[str]:
+        """
+        Cheap change marker for one ticket (its stored updated_at)
+
+        Returns:
+            Version string, or None if the ticket does not exist
+        """
         result = await self.db.execute(
-            select(Ticket).where(Ticket.ticket_id == ticket_id)
+            select(type_coerce(Ticket.updated_at, String))
+            .where(Ticket.ticket_id == ticket_id)
         )
         return result.scalar_one_or_none()
 
+    async def get_list_version(self) -> int:
+        """
+        Cheap change marker for ticket lists
+
+        A one-row read of the table-wide change counter, which every ticket
+        insert, update and delete bumps (see ticket_stats).
+        """
+        return await get_change_version(self.db)
+
+    @staticmethod
+    def _load_only(fields: Sequence[str]):
+        """Loader option restricting a ticket query to the given columns"""
+        return load_only(*(getattr(Ticket, field) for field in fields))
+
+    def _filtered_query(
+        self,
+        status: Optional[List[TicketStatus]],
+        urgency: Optional[str],
+        *columns,
+        fields: Optional[Sequence[str]] = None,
+    ):
+        """Base ticket query with list filters applied"""
+        query = select(Ticket, *columns)
+        if fields:
+            query = query.options(self._load_only(fields))
+        if status and set(status) == set(ACTIVE_STATUSES):
+            # Inline the values so SQLite can match the partial index predicate
+            query = query.where(Ticket.status.in_(
+                bindparam("active_statuses", list(ACTIVE_STATUSES), expanding=True, literal_execute=True)
+            ))
+        elif status:
+            query = query.where(Ticket.status.in_(status))
+        if urgency:
+            query = query.where(Ticket.urgency == urgency)
+        return query
+
+    async def _count(self, query) -> int:
+        """Exact row count of a filtered query"""
+        count_query = select(func.count()).select_from(query.subquery())
+        total_result = await self.db.execute(count_query)
+        return total_result.scalar_one()
+
     async def list_tickets(
         self,
         status: Optional[List[TicketStatus]] = None,
         urgency: Optional[str] = None,
         page: int = 1,
         limit: int = 20,
-    ) -> tuple[List[Ticket], int]:
-        """List tickets with filtering and pagination"""
-        # Build query
-        query = select(Ticket)
+        include_total: bool = True,
+        fields: Optional[Sequence[str]] = None,
+    ) -> tuple[List[Ticket], Optional[int]]:
+        """
+        List tickets with filtering and offset pagination
 
-        # Apply filters
-        if status:
-            query = query.where(Ticket.status.in_(status))
-        if urgency:
-            query = query.where(Ticket.urgency == urgency)
+        Pass ``fields`` to load only those columns; list views never need
+        raw_voc or the analysis JSON.
+        """
+        query = self._filtered_query(status, urgency, fields=fields)
 
         # Count total
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.db.execute(count_query)
-        total_count = total_result.scalar_one()
+        total_count = await self._count(query) if include_total else None
 
         # Apply pagination and ordering
-        query = query.order_by(desc(Ticket.created_at))
+        query = query.order_by(desc(Ticket.created_at), desc(Ticket.ticket_id))
         query = query.offset((page - 1) * limit).limit(limit)
 
         # Execute
@@ -272,95 +458,313 @@ class TicketService:
 
         return tickets, total_count
 
-    async def confirm_ticket(
-        self, ticket_id: str, assignee: Optional[str] = None
-    ) -> Optional[Ticket]:
-        """Confirm a ticket (WAITING_CONFIRM -> DONE)"""
-        ticket = await self.get_ticket(ticket_id)
-        if not ticket:
-            return None
+    async def search_tickets(
+        self,
+        q: str,
+        status: Optional[List[TicketStatus]] = None,
+        urgency: Optional[str] = None,
+        page: int = 1,
+        limit: int = 20,
+        include_total: bool = True,
+        fields: Optional[Sequence[str]] = None,
+    ) -> tuple[List[Ticket], dict, Optional[int]]:
+        """
+        Full-text search over raw_voc, summary and manual_resolution
+
+        Results are ranked by BM25 (summary weighted double) and come with
+        a snippet of the best matching column, matches wrapped in
+        ``<mark>...</mark>``. Terms shorter than three characters cannot use
+        the trigram index and are matched with LIKE instead.
 
-        if ticket.status != TicketStatus.WAITING_CONFIRM:
-            raise ValueError(
-                f"Cannot confirm ticket in status {ticket.status}. "
-                f"Expected {TicketStatus.WAITING_CONFIRM}"
+        Returns:
+            (tickets, {ticket_id: snippet}, total_count)
+
+        Raises:
+            ValueError: If q contains no search terms
+        """
+        match, short_terms = build_search_terms(q)
+        if match is None and not short_terms:
+            raise ValueError("Search query is empty")
+
+        query = self._filtered_query(status, urgency, fields=fields)
+        for term in short_terms:
+            pattern = _like_pattern(term)
+            query = query.where(or_(
+                Ticket.raw_voc.like(pattern, escape="\\"),
+                Ticket.summary.like(pattern, escape="\\"),
+                Ticket.manual_resolution.like(pattern, escape="\\"),
+            ))
+
+        if match is not None:
+            query = query.join(ticket_fts, ticket_fts.c.ticket_id == Ticket.ticket_id)
+            query = query.where(_FTS.op("MATCH")(match))
+
+        total_count = await self._count(query) if include_total else None
+
+        if match is not None:
+            query = query.add_columns(
+                func.snippet(_FTS, -1, "<mark>", "</mark>", "…", 16).label("snippet")
+            ).order_by(
+                # Columns: ticket_id (unindexed), raw_voc, summary, manual_resolution
+                func.bm25(_FTS, 0.0, 1.0, 2.0, 1.0),
+                desc(Ticket.created_at),
+            )
+        else:
+            query = query.add_columns(literal(None).label("snippet")).order_by(
+                desc(Ticket.created_at), desc(Ticket.ticket_id)
             )
 
-        ticket.status = TicketStatus.DONE
-        ticket.confirmed_at = datetime.utcnow()
-        if assignee:
-            ticket.assignee = assignee
+        result = await self.db.execute(query.offset((page - 1) * limit).limit(limit))
+        rows = result.all()
+        tickets = [row[0] for row in rows]
+        snippets = {row[0].ticket_id: row[1] for row in rows if row[1]}
+        return tickets, snippets, total_count
 
-        await self.db.commit()
-        await self.db.refresh(ticket)
+    async def export_tickets(
+        self,
+        fields: Sequence[str],
+        status: Optional[List[TicketStatus]] = None,
+        urgency: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        batch_size: Optional[int] = None,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Stream filtered ticket rows from a server-side cursor
 
-        return ticket
+        Rows are plain column tuples (no ORM objects) fetched ``batch_size``
+        at a time, oldest first, so memory stays flat however many tickets
+        match. The caller keeps the session open until iteration ends.
 
-    async def reject_ticket(
-        self, ticket_id: str, reject_reason: str, assignee: Optional[str] = None
-    ) -> Optional[Ticket]:
-        """Reject a ticket (WAITING_CONFIRM -> REJECTED)"""
-        ticket = await self.get_ticket(ticket_id)
-        if not ticket:
-            return None
+        Args:
+            fields: Columns to select, in output order
+            status: Filter by status
+            urgency: Filter by urgency
+            created_from: Only tickets created at or after this time (UTC)
+            created_to: Only tickets created before this time (UTC)
+            batch_size: Rows per fetch (default: settings.ticket_export_batch_size)
+
+        Yields:
+            Batches of rows
+        """
+        query = self._filtered_query(status, urgency).with_only_columns(
+            *(getattr(Ticket, field) for field in fields)
+        )
+        if created_from is not None:
+            query = query.where(Ticket.created_at >= created_from)
+        if created_to is not None:
+            query = query.where(Ticket.created_at < created_to)
+        query = query.order_by(asc(Ticket.created_at), asc(Ticket.ticket_id)).execution_options(
+            yield_per=batch_size or settings.ticket_export_batch_size
+        )
 
-        if ticket.status != TicketStatus.WAITING_CONFIRM:
-            raise ValueError(
-                f"Cannot reject ticket in status {ticket.status}. "
-                f"Expected {TicketStatus.WAITING_CONFIRM}"
-            )
+        result = await self.db.stream(query)
+        try:
+            async for partition in result.partitions():
+                yield partition
+        finally:
+            await result.close()
 
-        ticket.status = TicketStatus.REJECTED
-        ticket.reject_reason = reject_reason
-        ticket.confirmed_at = datetime.utcnow()
-        if assignee:
-            ticket.assignee = assignee
+    async def list_tickets_by_cursor(
+        self,
+        status: Optional[List[TicketStatus]] = None,
+        urgency: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+        include_total: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> tuple[List[Ticket], Optional[str], Optional[str], Optional[int]]:
+        """
+        List tickets with keyset pagination on (created_at, ticket_id)
 
-        await self.db.commit()
-        await self.db.refresh(ticket)
+        Each page is a single index range scan of ``limit + 1`` rows, so the
+        cost does not grow with the page depth.
 
-        return ticket
+        Args:
+            status: Filter by status
+            urgency: Filter by urgency
+            cursor: Cursor from a previous page (None for the first page)
+            limit: Page size
+            include_total: Also run the (full scan) COUNT query
+            fields: Only load these columns
 
-    async def retry_ticket(self, ticket_id: str) -> Optional[Ticket]:
-        """Retry ticket analysis (WAITING_CONFIRM -> ANALYZING)"""
-        ticket = await self.get_ticket(ticket_id)
-        if not ticket:
-            return None
+        Returns:
+            (tickets, next_cursor, prev_cursor, total_count)
 
-        if ticket.status != TicketStatus.WAITING_CONFIRM:
-            raise ValueError(
-                f"Cannot retry ticket in status {ticket.status}. "
-                f"Expected {TicketStatus.WAITING_CONFIRM}"
-            )
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        # Compare against the stored representation so that server-side
+        # timestamps without fractional seconds order consistently
+        raw_created_at = type_coerce(Ticket.created_at, String).label("created_at_raw")
+        query = self._filtered_query(status, urgency, raw_created_at, fields=fields)
+        total_count = await self._count(self._filtered_query(status, urgency)) \
+            if include_total else None
+
+        key = tuple_(Ticket.created_at, Ticket.ticket_id)
+        direction = "next"
+        if cursor:
+            created_at, ticket_id, direction = decode_cursor(cursor)
+            position = tuple_(literal(created_at, String), literal(ticket_id, String))
+            query = query.where(key < position if direction == "next" else key > position)
+
+        order = desc if direction == "next" else asc
+        query = query.order_by(order(Ticket.created_at), order(Ticket.ticket_id))
+        result = await self.db.execute(query.limit(limit + 1))
+        rows = list(result.all())
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if direction == "prev":
+            rows.reverse()
+
+        next_cursor = prev_cursor = None
+        if rows:
+            first, last = rows[0], rows[-1]
+            if direction == "prev" or has_more:
+                next_cursor = encode_cursor(last[1], last[0].ticket_id, "next")
+            if (direction == "next" and cursor) or (direction == "prev" and has_more):
+                prev_cursor = encode_cursor(first[1], first[0].ticket_id, "prev")
+
+        return [row[0] for row in rows], next_cursor, prev_cursor, total_count
 
-        ticket.status = TicketStatus.ANALYZING
+    async def confirm_ticket(
+        self, ticket_id: str, assignee: Optional[str] = None
+    ) -> Optional[Ticket]:
+        """Confirm a ticket (WAITING_CONFIRM -> DONE)"""
+        return await apply_transition(
+            self.db, ticket_id, TicketAction.CONFIRM, assignee=assignee
+        )
 
-        await self.db.commit()
-        await self.db.refresh(ticket)
+    async def reject_ticket(
+        self, ticket_id: str, reject_reason: str, assignee: Optional[str] = None
+    ) -> Optional[Ticket]:
+        """Reject a ticket (WAITING_CONFIRM -> REJECTED)"""
+        return await apply_transition(
+            self.db, ticket_id, TicketAction.REJECT,
+            reject_reason=reject_reason, assignee=assignee,
+        )
 
-        return ticket
+    async def retry_ticket(self, ticket_id: str, commit: bool = True) -> Optional[Ticket]:
+        """
+        Retry ticket analysis (WAITING_CONFIRM -> ANALYZING)
+
+        Args:
+            ticket_id: Ticket ID
+            commit: False to leave the transition in the open transaction
+                (committed together with the analysis job)
+        """
+        return await apply_transition(self.db, ticket_id, TicketAction.RETRY, commit=commit)
 
     async def complete_manual_ticket(
         self, ticket_id: str, manual_resolution: str, assignee: Optional[str] = None
     ) -> Optional[Ticket]:
         """Complete manual ticket (MANUAL_REQUIRED -> DONE)"""
-        ticket = await self.get_ticket(ticket_id)
-        if not ticket:
-            return None
+        return await apply_transition(
+            self.db, ticket_id, TicketAction.COMPLETE,
+            manual_resolution=manual_resolution, assignee=assignee,
+        )
 
-        if ticket.status != TicketStatus.MANUAL_REQUIRED:
-            raise ValueError(
-                f"Cannot complete ticket in status {ticket.status}. "
-                f"Expected {TicketStatus.MANUAL_REQUIRED}"
-            )
+    async def bulk_action(
+        self,
+        items: List[TicketBulkActionItem],
+        confirm_filter: Optional[TicketBulkConfirmFilter] = None,
+    ) -> List[TicketBulkItemResult]:
+        """
+        Apply many admin actions in a single transaction
 
-        ticket.status = TicketStatus.DONE
-        ticket.manual_resolution = manual_resolution
-        ticket.confirmed_at = datetime.utcnow()
-        if assignee:
-            ticket.assignee = assignee
+        Items with the same action and payload are applied together with one
+        conditional UPDATE. Items whose ticket is missing or not in the
+        required state are reported as failed without affecting the others.
 
-        await self.db.commit()
-        await self.db.refresh(ticket)
+        Args:
+            items: Per-ticket actions
+            confirm_filter: Also confirm every WAITING_CONFIRM ticket at or
+                above the given confidence
 
-        return ticket
+        Returns:
+            One result per item (in request order), followed by one result
+            per ticket confirmed by the filter
+        """
+        results: dict[int, TicketBulkItemResult] = {}
+        groups: dict[tuple, List[tuple[int, str]]] = {}
+        seen = set()
+
+        for index, item in enumerate(items):
+            if item.ticket_id in seen:
+                results[index] = TicketBulkItemResult(
+                    ticket_id=item.ticket_id, action=item.action, success=False,
+                    error="Duplicate ticket_id in request",
+                )
+                continue
+            seen.add(item.ticket_id)
+
+            action = TicketAction(item.action)
+            try:
+                payload = BULK_PAYLOAD_SCHEMAS[action].model_validate(item.payload)
+            except ValidationError as e:
+                error = e.errors()[0]
+                results[index] = TicketBulkItemResult(
+                    ticket_id=item.ticket_id, action=item.action, success=False,
+                    error=f"Invalid payload: {'.'.join(map(str, error['loc']))} {error['msg']}",
+                )
+                continue
+
+            key = (action, tuple(sorted(payload.model_dump().items())))
+            groups.setdefault(key, []).append((index, item.ticket_id))
+
+        for (action, values), members in groups.items():
+            ticket_ids = [ticket_id for _, ticket_id in members]
+            updated = {
+                t.ticket_id: t
+                for t in await apply_bulk_transition(
+                    self.db, action, Ticket.ticket_id.in_(ticket_ids), **dict(values)
+                )
+            }
+
+            current = {}
+            missing = [ticket_id for ticket_id in ticket_ids if ticket_id not in updated]
+            if missing:
+                rows = await self.db.execute(
+                    select(Ticket.ticket_id, Ticket.status).where(Ticket.ticket_id.in_(missing))
+                )
+                current = dict(rows.all())
+
+            for index, ticket_id in members:
+                if ticket_id in updated:
+                    result = TicketBulkItemResult(
+                        ticket_id=ticket_id, action=action.value, success=True,
+                        status=updated[ticket_id].status,
+                    )
+                elif ticket_id in current:
+                    result = TicketBulkItemResult(
+                        ticket_id=ticket_id, action=action.value, success=False,
+                        status=current[ticket_id],
+                        error=str(TicketTransitionError(ticket_id, action, current[ticket_id])),
+                    )
+                else:
+                    result = TicketBulkItemResult(
+                        ticket_id=ticket_id, action=action.value, success=False,
+                        error=f"Ticket {ticket_id} not found",
+                    )
+                results[index] = result
+
+        ordered = [results[index] for index in range(len(items))]
+
+        if confirm_filter is not None:
+            confirmed = await apply_bulk_transition(
+                self.db,
+                TicketAction.CONFIRM,
+                Ticket.decision_confidence >= confirm_filter.min_confidence,
+                assignee=confirm_filter.assignee,
+            )
+            ordered.extend(
+                TicketBulkItemResult(
+                    ticket_id=t.ticket_id, action=TicketAction.CONFIRM.value,
+                    success=True, status=t.status,
+                )
+                for t in sorted(confirmed, key=lambda t: t.ticket_id)
+            )
+
+        await self.db.commit()
+        return ordered
@@ -0,0 +1,215 @@
+"""
+Incrementally maintained ticket counters
+
+ticket_stats holds the number of tickets per (creation day, status,
+urgency). Counters are adjusted in the same transaction as the ticket
+change itself:
+
+- ORM changes (create, normalize, solve, job failure) are picked up by an
+  ``after_flush`` hook that diffs the status/urgency history of flushed
+  tickets.
+- Conditional UPDATE ... RETURNING transitions, which bypass the unit of
+  work, call ``record_transitions`` explicitly.
+
+Reading the stats is then a scan of a table bounded by days x statuses x
+urgencies instead of a COUNT over tickets.
+
+The same two paths bump ticket_changes, a table-wide counter that the list
+endpoint reads as its ETag version.
+"""
+
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, Tuple
+
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.base import NO_VALUE
+
+from app.models.stats import TICKET_CHANGES_ID, TicketChanges, TicketStat, URGENCY_UNSET
+from app.models.ticket import Ticket, TicketStatus
+
+Bucket = Tuple[date, TicketStatus, str]
+
+
+def _urgency_key(urgency: Any) -> str:
+    if urgency is None:
+        return URGENCY_UNSET
+    return getattr(urgency, "value", urgency)
+
+
+def _day(created_at: Any) -> date:
+    if created_at is None:
+        # Server default CURRENT_TIMESTAMP is UTC
+        return datetime.utcnow().date()
+    if isinstance(created_at, str):
+        created_at = datetime.fromisoformat(created_at)
+    return created_at.date()
+
+
+def _apply_deltas(connection, deltas: Counter) -> None:
+    """Upsert counter deltas (runs inside the caller's transaction)"""
+    rows = [
+        {"day": day, "status": status, "urgency": urgency, "count": delta}
+        for (day, status, urgency), delta in deltas.items()
+        if delta
+    ]
+    if not rows:
+        return
+    stmt = sqlite_insert(TicketStat)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TicketStat.day, TicketStat.status, TicketStat.urgency],
+        set_={"count": TicketStat.count + stmt.excluded.count},
+    )
+    connection.execute(stmt, rows)
+
+
+def _bump_version(connection) -> None:
+    """Increment the ticket change counter (runs inside the caller's transaction)"""
+    stmt = sqlite_insert(TicketChanges).values(id=TICKET_CHANGES_ID, version=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TicketChanges.id],
+        set_={"version": TicketChanges.version + 1},
+    )
+    connection.execute(stmt)
+
+
+def _previous(state, key: str) -> Any:
+    """Value of an attribute before the pending change"""
+    history = state.attrs[key].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(state.obj(), key)
+
+
+def _created_at(session: Session, state) -> Any:
+    created_at = state.attrs.created_at.loaded_value
+    if created_at is NO_VALUE:
+        created_at = session.connection().execute(
+            select(Ticket.created_at).where(Ticket.ticket_id == state.obj().ticket_id)
+        ).scalar_one_or_none()
+    return created_at
+
+
+@event.listens_for(Session, "after_flush")
+def _track_ticket_changes(session: Session, flush_context) -> None:
+    deltas: Counter = Counter()
+    changed = False
+
+    for obj in session.new:
+        if isinstance(obj, Ticket):
+            changed = True
+            deltas[(_day(obj.created_at), obj.status, _urgency_key(obj.urgency))] += 1
+
+    for obj in session.dirty:
+        if not isinstance(obj, Ticket) or not session.is_modified(obj):
+            continue
+        changed = True
+        state = inspect(obj)
+        if not (state.attrs.status.history.has_changes()
+                or state.attrs.urgency.history.has_changes()):
+            continue
+        day = _day(_created_at(session, state))
+        deltas[(day, _previous(state, "status"), _urgency_key(_previous(state, "urgency")))] -= 1
+        deltas[(day, obj.status, _urgency_key(obj.urgency))] += 1
+
+    for obj in session.deleted:
+        if isinstance(obj, Ticket):
+            changed = True
+            state = inspect(obj)
+            deltas[(
+                _day(_created_at(session, state)),
+                _previous(state, "status"),
+                _urgency_key(_previous(state, "urgency")),
+            )] -= 1
+
+    if deltas:
+        _apply_deltas(session.connection(), deltas)
+    if changed:
+        _bump_version(session.connection())
+
+
+async def record_transitions(
+    db: AsyncSession, tickets: Iterable[Ticket], source: TicketStatus
+) -> None:
+    """
+    Adjust counters for tickets moved out of ``source`` by a Core UPDATE
+
+    Args:
+        db: Session whose transaction performed the UPDATE
+        tickets: Updated tickets (as returned by RETURNING)
+        source: Status the tickets had before the UPDATE
+    """
+    deltas: Counter = Counter()
+    for ticket in tickets:
+        day = _day(ticket.created_at)
+        urgency = _urgency_key(ticket.urgency)
+        deltas[(day, source, urgency)] -= 1
+        deltas[(day, ticket.status, urgency)] += 1
+    if deltas:
+        await db.run_sync(lambda session: _apply_deltas(session.connection(), deltas))
+        await db.run_sync(lambda session: _bump_version(session.connection()))
+
+
+async def get_change_version(db: AsyncSession) -> int:
+    """
+    Read the table-wide ticket change counter
+
+    Args:
+        db: Database session
+
+    Returns:
+        Counter value; it grows on every ticket insert, update and delete
+    """
+    result = await db.execute(
+        select(TicketChanges.version).where(TicketChanges.id == TICKET_CHANGES_ID)
+    )
+    return result.scalar_one_or_none() or 0
+
+
+async def get_ticket_stats(db: AsyncSession, days: int = 30) -> Dict[str, Any]:
+    """
+    Read dashboard counters
+
+    Args:
+        db: Database session
+        days: Number of most recent creation days in the daily series
+
+    Returns:
+        Totals by status and urgency, plus a per-day status breakdown
+    """
+    result = await db.execute(
+        select(TicketStat.status, TicketStat.urgency, func.sum(TicketStat.count))
+        .group_by(TicketStat.status, TicketStat.urgency)
+    )
+    by_status: Dict[str, int] = {s.value: 0 for s in TicketStatus}
+    by_urgency: Dict[str, int] = {}
+    total = 0
+    for status, urgency, count in result.all():
+        by_status[status.value] += count
+        by_urgency[urgency] = by_urgency.get(urgency, 0) + count
+        total += count
+
+    since = datetime.utcnow().date() - timedelta(days=days - 1)
+    result = await db.execute(
+        select(TicketStat.day, TicketStat.status, func.sum(TicketStat.count))
+        .where(TicketStat.day >= since)
+        .group_by(TicketStat.day, TicketStat.status)
+        .order_by(TicketStat.day)
+    )
+    daily: Dict[date, Dict[str, int]] = {}
+    for day, status, count in result.all():
+        if count:
+            daily.setdefault(day, {})[status.value] = count
+
+    return {
+        "total": total,
+        "by_status": by_status,
+        "by_urgency": {k: v for k, v in by_urgency.items() if v},
+        "daily": [
+            {"day": day, "total": sum(counts.values()), "by_status": counts}
+            for day, counts in daily.items()
+        ],
+    }
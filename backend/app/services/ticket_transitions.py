@@ -0,0 +1,154 @@
+"""
+Ticket state transitions for admin actions
+
+Each admin action is one edge of the ticket state diagram. A transition is
+applied with a single conditional statement
+
+    UPDATE tickets SET status = :to, ... WHERE ticket_id = :id AND status = :from
+    RETURNING *
+
+so the precondition check and the write are atomic: when two admins act on
+the same ticket at once, exactly one UPDATE matches and the other gets a
+TicketTransitionError.
+"""
+
+import enum
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.ticket import Ticket, TicketStatus
+from app.services.ticket_events import record_transition_events
+from app.services.ticket_stats import record_transitions
+
+
+class TicketAction(str, enum.Enum):
+    """Admin actions on a ticket"""
+    CONFIRM = "confirm"
+    REJECT = "reject"
+    RETRY = "retry"
+    COMPLETE = "complete"
+
+
+class Transition(NamedTuple):
+    """Edge of the ticket state diagram"""
+    source: TicketStatus
+    target: TicketStatus
+    stamps_confirmed_at: bool
+
+
+TRANSITIONS: Dict[TicketAction, Transition] = {
+    TicketAction.CONFIRM: Transition(TicketStatus.WAITING_CONFIRM, TicketStatus.DONE, True),
+    TicketAction.REJECT: Transition(TicketStatus.WAITING_CONFIRM, TicketStatus.REJECTED, True),
+    TicketAction.RETRY: Transition(TicketStatus.WAITING_CONFIRM, TicketStatus.ANALYZING, False),
+    TicketAction.COMPLETE: Transition(TicketStatus.MANUAL_REQUIRED, TicketStatus.DONE, True),
+}
+
+
+class TicketTransitionError(ValueError):
+    """The ticket is not in the state the action requires"""
+
+    def __init__(self, ticket_id: str, action: TicketAction, current: TicketStatus):
+        self.ticket_id = ticket_id
+        self.action = action
+        self.current = current
+        self.expected = TRANSITIONS[action].source
+        super().__init__(
+            f"Cannot {action.value} ticket in status {current}. "
+            f"Expected {self.expected}"
+        )
+
+
+def _transition_values(action: TicketAction, values: Dict[str, Any]) -> Dict[str, Any]:
+    transition = TRANSITIONS[action]
+    update_values = {"status": transition.target}
+    if transition.stamps_confirmed_at:
+        update_values["confirmed_at"] = datetime.utcnow()
+    # Optional fields (e.g. assignee) are only written when given
+    update_values.update({k: v for k, v in values.items() if v is not None})
+    return update_values
+
+
+async def apply_transition(
+    db: AsyncSession,
+    ticket_id: str,
+    action: TicketAction,
+    commit: bool = True,
+    **values: Any,
+) -> Optional[Ticket]:
+    """
+    Apply an admin action to one ticket in a single UPDATE ... RETURNING
+
+    Args:
+        db: Database session
+        ticket_id: Ticket ID
+        action: Admin action (selects the state diagram edge)
+        commit: Commit the transaction after a successful transition
+        **values: Extra columns to set (None values are skipped)
+
+    Returns:
+        Updated ticket, or None if the ticket does not exist
+
+    Raises:
+        TicketTransitionError: If the ticket is not in the source state
+    """
+    transition = TRANSITIONS[action]
+    stmt = (
+        update(Ticket)
+        .where(Ticket.ticket_id == ticket_id, Ticket.status == transition.source)
+        .values(**_transition_values(action, values))
+        .returning(Ticket)
+        .execution_options(populate_existing=True)
+    )
+    ticket = (await db.execute(stmt)).scalar_one_or_none()
+
+    if ticket is None:
+        # Only the failure path pays for a second query
+        current = (await db.execute(
+            select(Ticket.status).where(Ticket.ticket_id == ticket_id)
+        )).scalar_one_or_none()
+        if current is None:
+            return None
+        raise TicketTransitionError(ticket_id, action, current)
+
+    await record_transitions(db, [ticket], transition.source)
+    record_transition_events(db, [ticket], transition.source)
+    if commit:
+        await db.commit()
+    return ticket
+
+
+async def apply_bulk_transition(
+    db: AsyncSession,
+    action: TicketAction,
+    *criteria: Any,
+    **values: Any,
+) -> List[Ticket]:
+    """
+    Apply an admin action to every matching ticket in the source state
+
+    Tickets in any other state are left untouched. Does not commit.
+
+    Args:
+        db: Database session
+        action: Admin action (selects the state diagram edge)
+        *criteria: Extra WHERE clauses selecting the tickets
+        **values: Extra columns to set (None values are skipped)
+
+    Returns:
+        Tickets that were transitioned
+    """
+    transition = TRANSITIONS[action]
+    stmt = (
+        update(Ticket)
+        .where(Ticket.status == transition.source, *criteria)
+        .values(**_transition_values(action, values))
+        .returning(Ticket)
+        .execution_options(populate_existing=True)
+    )
+    tickets = list((await db.execute(stmt)).scalars().all())
+    await record_transitions(db, tickets, transition.source)
+    record_transition_events(db, tickets, transition.source)
+    return tickets
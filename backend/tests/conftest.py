@@ -9,7 +9,8 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sess
 from httpx import AsyncClient
 from datetime import datetime
 
-from app.database import Base, get_db
+from app.config import settings
+from app.database import Base, get_db, get_read_db
 from app.main import app
 from app.models.ticket import Channel
 
@@ -26,6 +27,13 @@ def event_loop() -> Generator:
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path, monkeypatch):
+    """Keep LLM and embedding caches out of the working tree and between tests"""
+    monkeypatch.setattr(settings, "llm_cache_path", str(tmp_path / "llm_cache.sqlite3"))
+    monkeypatch.setattr(settings, "embedding_cache_path", str(tmp_path / "embedding_cache.sqlite3"))
+
+
 @pytest.fixture(scope="function")
 async def test_db() -> AsyncGenerator[AsyncSession, None]:
     """Create a test database session"""
@@ -66,6 +74,7 @@ async def client(test_db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield test_db
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
     async with AsyncClient(app=app, base_url="http://test") as ac:
         yield ac
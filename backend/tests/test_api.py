@@ -2,9 +2,16 @@
 API endpoint tests
 """
 
+import csv
+import io
+import json
+from datetime import datetime
 import pytest
 from httpx import AsyncClient
-from app.models.ticket import TicketStatus
+from sqlalchemy import select
+from app.models.job import AnalysisJob
+from app.models.ticket import Ticket, TicketStatus
+from app.services.job_queue import AnalysisJobQueue
 
 
 @pytest.mark.integration
@@ -55,6 +62,78 @@ class TestVOCEndpoint:
         assert response.status_code == 422
 
 
+@pytest.mark.integration
+class TestVOCBatchEndpoint:
+    """Batch VOC ingestion endpoint tests"""
+
+    async def test_create_voc_batch_json_array(self, client: AsyncClient, sample_voc_data):
+        """Test batch creation from a JSON array"""
+        response = await client.post("/api/v1/voc/batch", json=[sample_voc_data] * 3)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        results = [json.loads(line) for line in response.text.splitlines()]
+        assert [r["index"] for r in results] == [0, 1, 2]
+        assert all(r["status"] == TicketStatus.OPEN.value for r in results)
+        assert len({r["ticket_id"] for r in results}) == 3
+
+        response = await client.get("/api/v1/tickets")
+        assert response.json()["total_count"] == 3
+
+    async def test_create_voc_batch_ndjson_partial_failure(
+        self, client: AsyncClient, sample_voc_data
+    ):
+        """Test NDJSON batch where some items are invalid"""
+        invalid = dict(sample_voc_data, raw_voc="")
+        body = "\n".join([
+            json.dumps(sample_voc_data),
+            json.dumps(invalid),
+            "{not json",
+            json.dumps(sample_voc_data),
+        ])
+        response = await client.post(
+            "/api/v1/voc/batch",
+            content=body,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+
+        results = {r["index"]: r for r in map(json.loads, response.text.splitlines())}
+        assert results[0]["ticket_id"] is not None
+        assert results[3]["ticket_id"] is not None
+        assert "raw_voc" in results[1]["error"]
+        assert results[2]["error"].startswith("Invalid JSON")
+
+    async def test_create_voc_batch_rejects_non_array(self, client: AsyncClient, sample_voc_data):
+        """Test batch creation with a JSON object body"""
+        response = await client.post("/api/v1/voc/batch", json=sample_voc_data)
+        assert response.status_code == 400
+
+        response = await client.post("/api/v1/voc/batch", json=[])
+        assert response.status_code == 400
+
+    async def test_create_voc_batch_non_object_items(self, client: AsyncClient, sample_voc_data):
+        """Test string and scalar items are reported as non-objects"""
+        response = await client.post(
+            "/api/v1/voc/batch", json=["Invalid JSON: looks like an error", 42, sample_voc_data]
+        )
+        assert response.status_code == 200
+
+        results = {r["index"]: r for r in map(json.loads, response.text.splitlines())}
+        assert results[0]["error"] == "item must be an object"
+        assert results[1]["error"] == "item must be an object"
+        assert results[2]["ticket_id"] is not None
+
+    async def test_create_voc_batch_rejects_non_utf8(self, client: AsyncClient):
+        """Test a body that is not UTF-8 returns 400"""
+        response = await client.post(
+            "/api/v1/voc/batch",
+            content="[{\"raw_voc\": \"결제 오류\"}]".encode("euc-kr"),
+            headers={"Content-Type": "application/json"},
+        )
+        assert response.status_code == 400
+
+
 @pytest.mark.integration
 class TestTicketEndpoints:
     """Ticket management endpoint tests"""
@@ -119,6 +198,71 @@ class TestTicketEndpoints:
         assert data["limit"] == 2
         assert data["total_pages"] == 3
 
+    async def test_list_tickets_cursor(self, client: AsyncClient, sample_voc_data):
+        """Test keyset pagination through the list endpoint"""
+        for i in range(3):
+            await client.post("/api/v1/voc", json=sample_voc_data)
+
+        response = await client.get("/api/v1/tickets?cursor=&limit=2")
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["tickets"]) == 2
+        assert data["total_count"] is None
+        assert data["prev_cursor"] is None
+        assert data["next_cursor"]
+
+        response = await client.get(
+            "/api/v1/tickets", params={"cursor": data["next_cursor"], "limit": 2}
+        )
+        data = response.json()
+        assert len(data["tickets"]) == 1
+        assert data["next_cursor"] is None
+        assert data["prev_cursor"]
+
+        response = await client.get("/api/v1/tickets?cursor=bogus")
+        assert response.status_code == 400
+
+    async def test_confirm_wrong_status_conflict(self, client: AsyncClient, sample_voc_data):
+        """Test an action whose precondition fails returns 409"""
+        response = await client.post("/api/v1/voc", json=sample_voc_data)
+        ticket_id = response.json()["ticket_id"]
+
+        response = await client.post(f"/api/v1/tickets/{ticket_id}/confirm", json={})
+        assert response.status_code == 409
+
+        response = await client.post("/api/v1/tickets/VOC-99999999-9999/confirm", json={})
+        assert response.status_code == 404
+
+    async def test_retry_commits_transition_with_job(
+        self, client: AsyncClient, test_db, sample_voc_data, monkeypatch
+    ):
+        """Test a failed enqueue leaves the ticket untouched"""
+        response = await client.post("/api/v1/voc", json=sample_voc_data)
+        ticket_id = response.json()["ticket_id"]
+        ticket = await test_db.get(Ticket, ticket_id)
+        ticket.status = TicketStatus.WAITING_CONFIRM
+        await test_db.commit()
+
+        async def failing_enqueue(*args, **kwargs):
+            raise RuntimeError("queue unavailable")
+
+        monkeypatch.setattr(AnalysisJobQueue, "enqueue_many", failing_enqueue)
+        with pytest.raises(RuntimeError):
+            await client.post(f"/api/v1/tickets/{ticket_id}/retry")
+        # get_db rolls the request's transaction back
+        await test_db.rollback()
+        ticket = await test_db.get(Ticket, ticket_id, populate_existing=True)
+        assert ticket.status == TicketStatus.WAITING_CONFIRM
+
+        monkeypatch.undo()
+        response = await client.post(f"/api/v1/tickets/{ticket_id}/retry")
+        assert response.status_code == 200
+        assert response.json()["status"] == TicketStatus.ANALYZING.value
+        jobs = (await test_db.execute(
+            select(AnalysisJob).where(AnalysisJob.ticket_id == ticket_id)
+        )).scalars().all()
+        assert len(jobs) == 2
+
     async def test_list_tickets_filter_by_status(
         self, client: AsyncClient, sample_voc_data
     ):
@@ -138,3 +282,392 @@ class TestTicketEndpoints:
         assert response.status_code == 200
         data = response.json()
         assert len(data["tickets"]) == 0
+
+
+@pytest.mark.integration
+class TestTicketBulkEndpoint:
+    """Bulk admin action endpoint tests"""
+
+    async def create_tickets(self, client, test_db, sample_voc_data, statuses, confidences=None):
+        """Create tickets and force their status/confidence"""
+        ticket_ids = []
+        for i, ticket_status in enumerate(statuses):
+            response = await client.post("/api/v1/voc", json=sample_voc_data)
+            ticket_id = response.json()["ticket_id"]
+            ticket = await test_db.get(Ticket, ticket_id)
+            ticket.status = ticket_status
+            if confidences:
+                ticket.decision_confidence = confidences[i]
+            ticket_ids.append(ticket_id)
+        await test_db.commit()
+        return ticket_ids
+
+    async def test_bulk_actions_per_item_results(
+        self, client: AsyncClient, test_db, sample_voc_data
+    ):
+        """Test mixed bulk actions report per-ticket outcomes"""
+        waiting_1, waiting_2, manual, done = await self.create_tickets(
+            client, test_db, sample_voc_data,
+            [TicketStatus.WAITING_CONFIRM, TicketStatus.WAITING_CONFIRM,
+             TicketStatus.MANUAL_REQUIRED, TicketStatus.DONE],
+        )
+
+        response = await client.post("/api/v1/tickets/bulk", json={"items": [
+            {"ticket_id": waiting_1, "action": "confirm", "payload": {"assignee": "admin"}},
+            {"ticket_id": waiting_2, "action": "reject", "payload": {"reject_reason": "오분류"}},
+            {"ticket_id": manual, "action": "complete", "payload": {"manual_resolution": "처리"}},
+            {"ticket_id": done, "action": "confirm"},
+            {"ticket_id": "VOC-99999999-9999", "action": "confirm"},
+            {"ticket_id": waiting_1, "action": "reject", "payload": {"reject_reason": "중복"}},
+        ]})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["succeeded"] == 3
+        assert data["failed"] == 3
+
+        results = data["results"]
+        assert [r["success"] for r in results] == [True, True, True, False, False, False]
+        assert results[0]["status"] == "DONE"
+        assert results[1]["status"] == "REJECTED"
+        assert results[2]["status"] == "DONE"
+        assert "Expected" in results[3]["error"]
+        assert "not found" in results[4]["error"]
+        assert "Duplicate" in results[5]["error"]
+
+    async def test_bulk_invalid_payload(self, client: AsyncClient, test_db, sample_voc_data):
+        """Test a reject without reason fails only that item"""
+        (waiting,) = await self.create_tickets(
+            client, test_db, sample_voc_data, [TicketStatus.WAITING_CONFIRM]
+        )
+
+        response = await client.post("/api/v1/tickets/bulk", json={"items": [
+            {"ticket_id": waiting, "action": "reject", "payload": {}},
+        ]})
+        data = response.json()
+        assert data["failed"] == 1
+        assert "reject_reason" in data["results"][0]["error"]
+
+    async def test_bulk_confirm_filter(self, client: AsyncClient, test_db, sample_voc_data):
+        """Test confirming every WAITING_CONFIRM ticket above a confidence"""
+        high, low, manual = await self.create_tickets(
+            client, test_db, sample_voc_data,
+            [TicketStatus.WAITING_CONFIRM, TicketStatus.WAITING_CONFIRM,
+             TicketStatus.MANUAL_REQUIRED],
+            confidences=[0.95, 0.6, 0.99],
+        )
+
+        response = await client.post("/api/v1/tickets/bulk", json={
+            "confirm_filter": {"min_confidence": 0.9, "assignee": "triage"},
+        })
+        data = response.json()
+        assert [r["ticket_id"] for r in data["results"]] == [high]
+
+        response = await client.get(f"/api/v1/tickets/{high}")
+        assert response.json()["assignee"] == "triage"
+        response = await client.get(f"/api/v1/tickets/{low}")
+        assert response.json()["status"] == "WAITING_CONFIRM"
+
+    async def test_bulk_empty_request(self, client: AsyncClient):
+        """Test an empty bulk request is rejected"""
+        response = await client.post("/api/v1/tickets/bulk", json={})
+        assert response.status_code == 400
+
+
+@pytest.mark.integration
+class TestTicketStatsEndpoint:
+    """Dashboard stats endpoint tests"""
+
+    async def test_stats(self, client: AsyncClient, sample_voc_data):
+        """Test stats reflect created tickets (including batch ingestion)"""
+        await client.post("/api/v1/voc", json=sample_voc_data)
+        await client.post("/api/v1/voc/batch", json=[sample_voc_data, sample_voc_data])
+
+        response = await client.get("/api/v1/tickets/stats")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        assert data["by_status"]["OPEN"] == 3
+        assert data["daily"][0]["by_status"] == {"OPEN": 3}
+
+
+@pytest.mark.integration
+class TestSparseFieldsets:
+    """`fields=` sparse fieldset tests"""
+
+    async def test_list_with_fields(self, client: AsyncClient, sample_voc_data):
+        """Test the list returns only the requested fields"""
+        await client.post("/api/v1/voc", json=sample_voc_data)
+
+        response = await client.get("/api/v1/tickets?fields=status,raw_voc")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_count"] == 1
+        assert data["tickets"] == [{
+            "ticket_id": data["tickets"][0]["ticket_id"],
+            "status": "OPEN",
+            "raw_voc": sample_voc_data["raw_voc"],
+        }]
+
+        response = await client.get("/api/v1/tickets?cursor=&fields=customer_name")
+        assert set(response.json()["tickets"][0]) == {"ticket_id", "customer_name"}
+
+    async def test_detail_with_fields(self, client: AsyncClient, sample_voc_data):
+        """Test the detail endpoint honours fields"""
+        response = await client.post("/api/v1/voc", json=sample_voc_data)
+        ticket_id = response.json()["ticket_id"]
+
+        response = await client.get(f"/api/v1/tickets/{ticket_id}?fields=status,decision_reason")
+        assert response.status_code == 200
+        assert response.json() == {
+            "ticket_id": ticket_id, "status": "OPEN", "decision_reason": None,
+        }
+
+    async def test_unknown_field(self, client: AsyncClient):
+        """Test unknown fields are rejected"""
+        response = await client.get("/api/v1/tickets?fields=password")
+        assert response.status_code == 400
+
+
+@pytest.mark.integration
+class TestConditionalGet:
+    """ETag / If-None-Match tests"""
+
+    async def test_detail_not_modified(self, client: AsyncClient, test_db, sample_voc_data):
+        """Test detail polling returns 304 until the ticket changes"""
+        response = await client.post("/api/v1/voc", json=sample_voc_data)
+        ticket_id = response.json()["ticket_id"]
+
+        response = await client.get(f"/api/v1/tickets/{ticket_id}")
+        etag = response.headers["etag"]
+        assert etag.startswith('W/"')
+
+        response = await client.get(
+            f"/api/v1/tickets/{ticket_id}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+
+        # A different representation has a different ETag
+        response = await client.get(
+            f"/api/v1/tickets/{ticket_id}?fields=status", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+
+        ticket = await test_db.get(Ticket, ticket_id)
+        ticket.summary = "변경됨"
+        await test_db.commit()
+
+        response = await client.get(
+            f"/api/v1/tickets/{ticket_id}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    async def test_list_not_modified(self, client: AsyncClient, test_db, sample_voc_data):
+        """Test list polling returns 304 until the filtered set changes"""
+        response = await client.post("/api/v1/voc", json=sample_voc_data)
+        ticket_id = response.json()["ticket_id"]
+
+        response = await client.get("/api/v1/tickets?status=OPEN")
+        etag = response.headers["etag"]
+        response = await client.get(
+            "/api/v1/tickets?status=OPEN", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+
+        # Ticket leaves the filtered set
+        ticket = await test_db.get(Ticket, ticket_id)
+        ticket.status = TicketStatus.ANALYZING
+        await test_db.commit()
+
+        response = await client.get(
+            "/api/v1/tickets?status=OPEN", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.json()["tickets"] == []
+
+    async def test_list_page_unchanged_by_other_tickets(
+        self, client: AsyncClient, test_db, sample_voc_data
+    ):
+        """Test a change outside the page still gets 304 once the page is checked"""
+        first = (await client.post("/api/v1/voc", json=sample_voc_data)).json()["ticket_id"]
+        await client.post("/api/v1/voc", json=sample_voc_data)
+
+        url = "/api/v1/tickets?status=OPEN&limit=1&include_total=false"
+        response = await client.get(url)
+        etag = response.headers["etag"]
+        assert [t["ticket_id"] for t in response.json()["tickets"]] != [first]
+
+        ticket = await test_db.get(Ticket, first)
+        ticket.summary = "변경됨"
+        await test_db.commit()
+
+        response = await client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        new_etag = response.headers["etag"]
+        assert new_etag != etag
+        # Same page digest, new version digest
+        assert new_etag.split(".")[1] == etag.split(".")[1]
+
+        response = await client.get(url, headers={"If-None-Match": new_etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == new_etag
+
+    async def test_detail_not_found(self, client: AsyncClient):
+        """Test unknown tickets still return 404"""
+        response = await client.get(
+            "/api/v1/tickets/VOC-99999999-9999", headers={"If-None-Match": "*"}
+        )
+        assert response.status_code == 404
+
+
+@pytest.mark.integration
+class TestTicketSearch:
+    """`q=` full-text search tests"""
+
+    async def _create(self, client: AsyncClient, sample_voc_data, raw_voc: str) -> str:
+        response = await client.post("/api/v1/voc", json={**sample_voc_data, "raw_voc": raw_voc})
+        return response.json()["ticket_id"]
+
+    async def test_search_ranks_and_highlights(self, client: AsyncClient, test_db, sample_voc_data):
+        """Test matches are ranked and snippets highlight the term"""
+        login = await self._create(client, sample_voc_data, "로그인이 안됩니다. 비밀번호 오류가 발생합니다.")
+        await self._create(client, sample_voc_data, "주문 처리가 지연됩니다. 환불 가능한가요?")
+        ranked = await self._create(client, sample_voc_data, "결제 처리가 이상합니다.")
+
+        ticket = await test_db.get(Ticket, ranked)
+        ticket.summary = "결제 처리가 중복됨"
+        await test_db.commit()
+
+        response = await client.get("/api/v1/tickets?q=처리가")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_count"] == 2
+        # Summary matches are weighted above raw_voc matches
+        assert data["tickets"][0]["ticket_id"] == ranked
+        assert all("<mark>처리가</mark>" in t["snippet"] for t in data["tickets"])
+        assert login not in [t["ticket_id"] for t in data["tickets"]]
+
+        response = await client.get("/api/v1/tickets?q=처리가 환불&fields=status")
+        data = response.json()
+        assert data["total_count"] == 1
+        assert set(data["tickets"][0]) == {"ticket_id", "status", "snippet"}
+
+    async def test_short_terms_and_operators(self, client: AsyncClient, sample_voc_data):
+        """Test short terms fall back to LIKE and FTS syntax is taken literally"""
+        ticket_id = await self._create(client, sample_voc_data, "앱이 자꾸 꺼져요 100% 재현됨")
+
+        response = await client.get("/api/v1/tickets?q=앱이")
+        assert [t["ticket_id"] for t in response.json()["tickets"]] == [ticket_id]
+
+        response = await client.get("/api/v1/tickets", params={"q": '100% "OR'})
+        assert response.status_code == 200
+        assert response.json()["total_count"] == 0
+
+        response = await client.get("/api/v1/tickets", params={"q": "0%"})
+        assert response.json()["total_count"] == 1
+
+    async def test_index_follows_updates(self, client: AsyncClient, test_db, sample_voc_data):
+        """Test the index is kept in sync by triggers"""
+        ticket_id = await self._create(client, sample_voc_data, "배송이 너무 늦어요")
+
+        ticket = await test_db.get(Ticket, ticket_id)
+        ticket.manual_resolution = "택배사에 재배송 요청"
+        await test_db.commit()
+        response = await client.get("/api/v1/tickets?q=재배송")
+        assert response.json()["total_count"] == 1
+
+        await test_db.delete(ticket)
+        await test_db.commit()
+        response = await client.get("/api/v1/tickets?q=배송이")
+        assert response.json()["total_count"] == 0
+
+    async def test_invalid_search(self, client: AsyncClient):
+        """Test blank queries and cursor mode are rejected"""
+        response = await client.get("/api/v1/tickets", params={"q": "   "})
+        assert response.status_code == 400
+
+        response = await client.get("/api/v1/tickets?q=결제함&cursor=")
+        assert response.status_code == 400
+
+
+@pytest.mark.integration
+class TestTicketExport:
+    """Streaming CSV/NDJSON export tests"""
+
+    async def _seed(self, test_db) -> list:
+        tickets = [
+            Ticket(
+                ticket_id=f"VOC-20260901-{i:04d}",
+                status=status,
+                raw_voc=f"결제 오류, \"{i}\"번째\n문의",
+                customer_name="홍길동",
+                channel="EMAIL",
+                received_at=datetime(2026, 9, i + 1),
+                created_at=datetime(2026, 9, i + 1, 9),
+                decision_reason={"summary": "요약"} if i == 0 else None,
+            )
+            for i, status in enumerate([
+                TicketStatus.DONE, TicketStatus.WAITING_CONFIRM, TicketStatus.DONE,
+            ])
+        ]
+        test_db.add_all(tickets)
+        await test_db.commit()
+        return [t.ticket_id for t in tickets]
+
+    async def test_export_csv(self, client: AsyncClient, test_db):
+        """Test CSV export is gzip-encoded, oldest first and round-trips text"""
+        ids = await self._seed(test_db)
+
+        response = await client.get(
+            "/api/v1/tickets/export?fields=status,raw_voc,decision_reason,created_at"
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert response.headers["content-encoding"] == "gzip"
+        assert "attachment" in response.headers["content-disposition"]
+
+        text = response.content.decode("utf-8")
+        assert text.startswith("\ufeff")
+        rows = list(csv.reader(io.StringIO(text.lstrip("\ufeff"))))
+        assert rows[0] == ["ticket_id", "status", "raw_voc", "decision_reason", "created_at"]
+        assert [row[0] for row in rows[1:]] == ids
+        assert rows[1][1:4] == ["DONE", '결제 오류, "0"번째\n문의', '{"summary": "요약"}']
+        assert rows[2][3] == ""
+
+    async def test_export_ndjson_filters(self, client: AsyncClient, test_db):
+        """Test NDJSON export with status and date range filters"""
+        ids = await self._seed(test_db)
+
+        response = await client.get(
+            "/api/v1/tickets/export",
+            params={
+                "format": "ndjson",
+                "status": "DONE",
+                "created_from": "2026-09-01T17:00:00+09:00",
+                "created_to": "2026-09-30",
+                "fields": "status",
+            },
+            headers={"Accept-Encoding": "identity"},
+        )
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        # 17:00 KST is 08:00 UTC, so the first DONE ticket (09:00 UTC) is included
+        assert lines == [
+            {"ticket_id": ids[0], "status": "DONE"},
+            {"ticket_id": ids[2], "status": "DONE"},
+        ]
+
+    async def test_export_empty_and_invalid(self, client: AsyncClient):
+        """Test empty exports and invalid parameters"""
+        response = await client.get("/api/v1/tickets/export?fields=status")
+        assert response.content.decode("utf-8") == "\ufeffticket_id,status\r\n"
+
+        response = await client.get("/api/v1/tickets/export?format=xml")
+        assert response.status_code == 422
+
+        response = await client.get(
+            "/api/v1/tickets/export?created_from=2026-10-01&created_to=2026-09-01"
+        )
+        assert response.status_code == 400
@@ -0,0 +1,52 @@
+"""
+SQLite storage profile tests
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import settings
+from app.database import configure_sqlite
+
+
+@pytest.mark.integration
+class TestSQLiteProfile:
+    """Connection pragmas and the read-only engine"""
+
+    async def test_writer_pragmas(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'voc.db'}")
+        configure_sqlite(engine)
+        try:
+            async with engine.connect() as conn:
+                journal_mode = (await conn.exec_driver_sql("PRAGMA journal_mode")).scalar()
+                synchronous = (await conn.exec_driver_sql("PRAGMA synchronous")).scalar()
+                busy_timeout = (await conn.exec_driver_sql("PRAGMA busy_timeout")).scalar()
+                cache_size = (await conn.exec_driver_sql("PRAGMA cache_size")).scalar()
+        finally:
+            await engine.dispose()
+
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+        assert busy_timeout == settings.sqlite_busy_timeout_ms
+        assert cache_size == -settings.sqlite_cache_size_kib
+
+    async def test_reader_is_read_only(self, tmp_path):
+        url = f"sqlite+aiosqlite:///{tmp_path / 'voc.db'}"
+        writer = create_async_engine(url)
+        reader = create_async_engine(url)
+        configure_sqlite(writer)
+        configure_sqlite(reader, read_only=True)
+        try:
+            async with writer.begin() as conn:
+                await conn.execute(text("CREATE TABLE t (id INTEGER)"))
+                await conn.execute(text("INSERT INTO t VALUES (1)"))
+
+            async with reader.connect() as conn:
+                assert (await conn.execute(text("SELECT COUNT(*) FROM t"))).scalar() == 1
+                with pytest.raises(OperationalError):
+                    await conn.execute(text("INSERT INTO t VALUES (2)"))
+        finally:
+            await writer.dispose()
+            await reader.dispose()
@@ -247,7 +247,7 @@ class TestE2ETicketActions:
 
         # OPEN 상태에서 승인 시도 - 실패해야 함
         response = await client.post(f"{API_V1}/tickets/{ticket_id}/confirm", json={})
-        assert response.status_code == 400
+        assert response.status_code == 409
 
     @pytest.mark.asyncio
     async def test_complete_manual_invalid_status(self, client: AsyncClient):
@@ -270,7 +270,7 @@ class TestE2ETicketActions:
             f"{API_V1}/tickets/{ticket_id}/complete",
             json={"manual_resolution": "수동 처리 완료"}
         )
-        assert response.status_code == 400
+        assert response.status_code == 409
 
     @pytest.mark.asyncio
     async def test_ticket_not_found(self, client: AsyncClient):
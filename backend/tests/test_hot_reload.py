@@ -0,0 +1,232 @@
+"""
+Hot reload tests: incremental scenario and seed data loading
+"""
+
+import json
+import os
+import shutil
+from datetime import timedelta
+
+import pytest
+
+from app.config import settings
+from app.mock.log_service import MockLogService, SCENARIO_STATE_FILE, SCENARIOS_DIR
+from app.mock.schemas import LogQueryParams
+from app.rag.vector_store import VocVectorStore
+from app.services.hot_reload import HotReloadWatcher
+from tests.test_mock_logs import BASE
+
+
+class FakeEmbeddingService:
+    """Deterministic embeddings; records every embedded text"""
+
+    def __init__(self):
+        self.embedded = []
+
+    def embed_texts(self, texts):
+        self.embedded.extend(texts)
+        return [[float(len(text)), 1.0, 0.0] for text in texts]
+
+    def embed_text(self, text):
+        return self.embed_texts([text])[0]
+
+
+def seed_item(ticket_id: str, resolution: str = "Restarted the gateway") -> dict:
+    return {
+        "ticket_id": ticket_id,
+        "raw_voc": f"{ticket_id}: 결제가 실패합니다",
+        "summary": "결제 실패",
+        "problem_type_primary": "integration_error",
+        "affected_system": "PaymentService",
+        "resolution": resolution,
+        "confidence": 0.9,
+    }
+
+
+def write_json(path, data) -> None:
+    """Write a file and bump its mtime so the watcher notices it"""
+    stat = path.stat() if path.exists() else None
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    if stat is not None:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def payment_count(service: MockLogService) -> int:
+    params = LogQueryParams(
+        service="PaymentService", start_time=BASE - timedelta(days=1), end_time=BASE + timedelta(days=1)
+    )
+    return service.query_logs(params).total_count
+
+
+@pytest.fixture
+def scenarios_dir(tmp_path):
+    directory = tmp_path / "scenarios"
+    shutil.copytree(SCENARIOS_DIR, directory)
+    return directory
+
+
+@pytest.fixture
+def embeddings(monkeypatch, tmp_path) -> FakeEmbeddingService:
+    fake = FakeEmbeddingService()
+    monkeypatch.setattr("app.rag.vector_store.get_embedding_service", lambda: fake)
+    monkeypatch.setattr(settings, "chroma_persist_directory", str(tmp_path / "chroma"))
+    return fake
+
+
+@pytest.fixture
+def seed_dir(tmp_path):
+    directory = tmp_path / "seed"
+    directory.mkdir()
+    write_json(directory / "seed.json", [seed_item("VOC-1"), seed_item("VOC-2")])
+    return directory
+
+
+@pytest.mark.unit
+class TestScenarioReload:
+    """Scenario files are reloaded by delta"""
+
+    @pytest.fixture(params=["indexed", "columnar"])
+    def watcher(self, request, scenarios_dir, tmp_path):
+        service = MockLogService(store=request.param, scenarios_dir=scenarios_dir)
+        watcher = HotReloadWatcher(log_service=service, seed_dir=tmp_path / "no-seed")
+        # First poll only records the already loaded files
+        assert watcher.poll()["logs"] == 0
+        return watcher
+
+    def test_unchanged_touch_is_noop(self, watcher, scenarios_dir):
+        path = scenarios_dir / "s1_integration_timeout.json"
+        before = payment_count(watcher.log_service)
+        write_json(path, json.loads(path.read_text(encoding="utf-8")))
+
+        assert watcher.poll()["logs"] == 0
+        assert payment_count(watcher.log_service) == before
+
+    def test_appended_logs_are_added(self, watcher, scenarios_dir):
+        path = scenarios_dir / "s1_integration_timeout.json"
+        before = payment_count(watcher.log_service)
+        data = json.loads(path.read_text(encoding="utf-8"))
+        extra = dict(data["logs"][-1], message="Gateway retry exhausted", timestamp="2024-01-15T19:10:00.000Z")
+        # A duplicate of an existing log counts as a new log
+        data["logs"] += [extra, data["logs"][0]]
+        write_json(path, data)
+
+        assert watcher.poll()["logs"] == 2
+        assert payment_count(watcher.log_service) == before + 2
+        assert watcher.poll()["logs"] == 0
+
+    def test_new_file_is_loaded(self, watcher, scenarios_dir):
+        before = payment_count(watcher.log_service)
+        source = json.loads((scenarios_dir / "s1_integration_timeout.json").read_text(encoding="utf-8"))
+        write_json(scenarios_dir / "s9_new.json", {"service": "PaymentService", "logs": source["logs"][:3]})
+
+        assert watcher.poll()["logs"] == 3
+        assert payment_count(watcher.log_service) == before + 3
+
+    def test_removed_logs_rebuild_service(self, watcher, scenarios_dir):
+        path = scenarios_dir / "s1_integration_timeout.json"
+        before = payment_count(watcher.log_service)
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["logs"] = data["logs"][1:]
+        write_json(path, data)
+
+        watcher.poll()
+        assert payment_count(watcher.log_service) == before - 1
+
+        path.unlink()
+        watcher.poll()
+        assert payment_count(watcher.log_service) == before - len(data["logs"]) - 1
+
+    def test_broken_file_is_retried(self, watcher, scenarios_dir):
+        path = scenarios_dir / "s9_new.json"
+        path.write_text("{ not json", encoding="utf-8")
+        assert watcher.poll()["logs"] == 0
+
+        source = json.loads((scenarios_dir / "s1_integration_timeout.json").read_text(encoding="utf-8"))
+        write_json(path, {"service": "PaymentService", "logs": source["logs"][:2]})
+        assert watcher.poll()["logs"] == 2
+
+
+@pytest.mark.unit
+class TestArchiveScenarioState:
+    """Scenario changes made while the server was down reach the archive"""
+
+    @pytest.fixture
+    def archive_service(self, scenarios_dir, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "mock_log_archive_path", str(tmp_path / "archive"))
+        return lambda: MockLogService(store="archive", scenarios_dir=scenarios_dir)
+
+    def test_restart_imports_offline_changes(self, archive_service, scenarios_dir, tmp_path):
+        first = archive_service()
+        payment = payment_count(first)
+        refund = first.get_log_count_by_service("RefundService")
+
+        path = scenarios_dir / "s1_integration_timeout.json"
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["logs"].append(dict(data["logs"][-1], timestamp="2024-01-15T19:10:00.000Z"))
+        write_json(path, data)
+        write_json(scenarios_dir / "s9_new.json", {"service": "PaymentService", "logs": data["logs"][:3]})
+        (scenarios_dir / "s2_code_npe.json").unlink()
+
+        second = archive_service()
+
+        assert payment_count(second) == payment + 4
+        # The archive is append-only
+        assert second.get_log_count_by_service("RefundService") == refund
+        watcher = HotReloadWatcher(log_service=second, seed_dir=tmp_path / "no-seed")
+        assert watcher.poll()["logs"] == 0
+        assert payment_count(archive_service()) == payment + 4
+
+    def test_archive_without_state_is_not_reimported(self, archive_service, tmp_path):
+        payment = payment_count(archive_service())
+        (tmp_path / "archive" / SCENARIO_STATE_FILE).unlink()
+
+        assert payment_count(archive_service()) == payment
+        assert (tmp_path / "archive" / SCENARIO_STATE_FILE).exists()
+
+
+@pytest.mark.unit
+class TestSeedReload:
+    """Seed documents are re-embedded only when they change"""
+
+    @pytest.fixture
+    def watcher(self, embeddings, seed_dir, tmp_path):
+        service = MockLogService(store="indexed", scenarios_dir=tmp_path / "no-scenarios")
+        return HotReloadWatcher(log_service=service, seed_dir=seed_dir, vector_store=VocVectorStore())
+
+    def test_initial_sync_skips_stored_documents(self, watcher, embeddings, seed_dir):
+        assert watcher.poll()["seeds_upserted"] == 2
+        assert len(embeddings.embedded) == 2
+
+        # A restarted watcher finds the stored hashes and embeds nothing
+        restarted = HotReloadWatcher(
+            log_service=watcher.log_service, seed_dir=seed_dir, vector_store=watcher.vector_store
+        )
+        assert restarted.poll()["seeds_upserted"] == 0
+        assert len(embeddings.embedded) == 2
+
+    def test_changed_and_removed_documents(self, watcher, embeddings, seed_dir):
+        watcher.poll()
+        embeddings.embedded.clear()
+
+        write_json(seed_dir / "seed.json", [seed_item("VOC-1", resolution="Raised the timeout"), seed_item("VOC-3")])
+        summary = watcher.poll()
+
+        assert summary == {"logs": 0, "seeds_upserted": 2, "seeds_deleted": 1}
+        assert len(embeddings.embedded) == 2
+        stored = watcher.vector_store.get_metadatas(["VOC-1", "VOC-2", "VOC-3"])
+        assert set(stored) == {"VOC-1", "VOC-3"}
+
+    def test_document_moved_between_files_is_kept(self, watcher, seed_dir):
+        watcher.poll()
+
+        write_json(seed_dir / "more.json", [seed_item("VOC-2")])
+        (seed_dir / "seed.json").unlink()
+        summary = watcher.poll()
+
+        assert summary["seeds_deleted"] == 1
+        assert set(watcher.vector_store.get_metadatas(["VOC-1", "VOC-2"])) == {"VOC-2"}
+
+    async def test_background_task(self, watcher):
+        await watcher.start()
+        await watcher.stop()
+        assert watcher._task is None
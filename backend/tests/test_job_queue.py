@@ -0,0 +1,205 @@
+"""
+Analysis job queue tests
+"""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.job import AnalysisJob, JobStatus
+from app.models.ticket import TicketStatus, Channel
+from app.schemas.ticket import VOCCreate
+from app.services.job_queue import AnalysisJobQueue
+from app.services.ticket_service import TicketService
+
+
+def make_queue(test_db: AsyncSession, handler=None, **kwargs) -> AnalysisJobQueue:
+    """Create a queue bound to the test database"""
+    session_factory = async_sessionmaker(
+        test_db.bind, class_=AsyncSession, expire_on_commit=False
+    )
+    return AnalysisJobQueue(
+        handler=handler,
+        session_factory=session_factory,
+        worker_count=1,
+        lease_seconds=30,
+        max_attempts=2,
+        retry_backoff_seconds=5,
+        **kwargs,
+    )
+
+
+async def create_ticket(test_db: AsyncSession):
+    service = TicketService(test_db)
+    return await service.create_ticket(VOCCreate(
+        raw_voc="결제가 안 됩니다",
+        customer_name="홍길동",
+        channel=Channel.EMAIL,
+        received_at=datetime.now(),
+    ))
+
+
+@pytest.mark.integration
+class TestAnalysisJobQueue:
+    """Durable job queue tests"""
+
+    async def test_enqueue_and_run(self, test_db: AsyncSession):
+        """Enqueued job is claimed, handled and marked done"""
+        handled = []
+
+        async def handler(ticket_id: str):
+            handled.append(ticket_id)
+
+        queue = make_queue(test_db, handler)
+        ticket = await create_ticket(test_db)
+        job = await queue.enqueue(test_db, ticket.ticket_id)
+        assert job.status == JobStatus.PENDING
+
+        assert await queue.run_next("worker-1") is True
+        assert handled == [ticket.ticket_id]
+
+        await test_db.refresh(job)
+        assert job.status == JobStatus.DONE
+        assert job.attempts == 1
+        assert await queue.run_next("worker-1") is False
+
+    async def test_claim_is_exclusive(self, test_db: AsyncSession):
+        """A claimed job cannot be claimed by another worker while leased"""
+        queue = make_queue(test_db)
+        ticket = await create_ticket(test_db)
+        await queue.enqueue(test_db, ticket.ticket_id)
+
+        job = await queue.claim("worker-1")
+        assert job is not None
+        assert job.locked_by == "worker-1"
+        assert await queue.claim("worker-2") is None
+
+    async def test_expired_lease_is_reclaimed(self, test_db: AsyncSession):
+        """A job whose worker died is picked up after the lease expires"""
+        queue = make_queue(test_db)
+        ticket = await create_ticket(test_db)
+        job = await queue.enqueue(test_db, ticket.ticket_id)
+        await queue.claim("worker-1")
+
+        job = await test_db.get(AnalysisJob, job.id)
+        job.lease_expires_at = datetime.utcnow() - timedelta(seconds=1)
+        await test_db.commit()
+
+        reclaimed = await queue.claim("worker-2")
+        assert reclaimed is not None
+        assert reclaimed.locked_by == "worker-2"
+        assert reclaimed.attempts == 2
+
+    async def test_stale_worker_cannot_finish_reclaimed_job(self, test_db: AsyncSession):
+        """complete/fail by a worker that lost the lease change nothing"""
+        queue = make_queue(test_db)
+        ticket = await create_ticket(test_db)
+        job = await queue.enqueue(test_db, ticket.ticket_id)
+        await queue.claim("worker-1")
+        job = await test_db.get(AnalysisJob, job.id)
+        job.lease_expires_at = datetime.utcnow() - timedelta(seconds=1)
+        await test_db.commit()
+        await queue.claim("worker-2")
+
+        assert await queue.complete(job.id, "worker-1") is False
+        assert await queue.fail(job.id, "worker-1", "stale") is None
+
+        await test_db.refresh(job)
+        await test_db.refresh(ticket)
+        assert job.status == JobStatus.RUNNING
+        assert job.locked_by == "worker-2"
+        assert ticket.status == TicketStatus.OPEN
+
+        assert await queue.complete(job.id, "worker-2") is True
+        await test_db.refresh(job)
+        assert job.status == JobStatus.DONE
+
+    async def test_lost_lease_cancels_handler(self, test_db: AsyncSession, monkeypatch):
+        """The handler is cancelled and the job left alone once the lease is lost"""
+        started, finished = asyncio.Event(), []
+
+        async def handler(ticket_id: str):
+            started.set()
+            await asyncio.sleep(10)
+            finished.append(ticket_id)
+
+        queue = make_queue(test_db, handler)
+        # Heartbeat every second
+        queue.lease_seconds = 3
+        ticket = await create_ticket(test_db)
+        job = await queue.enqueue(test_db, ticket.ticket_id)
+
+        async def lost(job_id, worker_id):
+            return False
+
+        monkeypatch.setattr(queue, "renew_lease", lost)
+        assert await asyncio.wait_for(queue.run_next("worker-1"), timeout=5) is True
+
+        await test_db.refresh(job)
+        assert started.is_set()
+        assert finished == []
+        # Left for whoever re-claims it after the lease expires
+        assert job.status == JobStatus.RUNNING
+
+    async def test_failed_job_retries_with_backoff(self, test_db: AsyncSession):
+        """A failing job is rescheduled and finally hands the ticket over"""
+        async def handler(ticket_id: str):
+            raise RuntimeError("LLM unavailable")
+
+        queue = make_queue(test_db, handler)
+        ticket = await create_ticket(test_db)
+        job = await queue.enqueue(test_db, ticket.ticket_id)
+
+        await queue.run_next("worker-1")
+        await test_db.refresh(job)
+        assert job.status == JobStatus.PENDING
+        assert job.available_at > datetime.utcnow()
+        assert job.last_error == "LLM unavailable"
+
+        # Not due yet
+        assert await queue.run_next("worker-1") is False
+
+        job.available_at = datetime.utcnow() - timedelta(seconds=1)
+        await test_db.commit()
+        await queue.run_next("worker-1")
+
+        await test_db.refresh(job)
+        await test_db.refresh(ticket)
+        assert job.status == JobStatus.FAILED
+        assert ticket.status == TicketStatus.MANUAL_REQUIRED
+        assert "LLM unavailable" in ticket.reject_reason
+
+    async def test_recover_orphaned_tickets(self, test_db: AsyncSession):
+        """Tickets stuck in ANALYZING without a job are re-enqueued"""
+        queue = make_queue(test_db)
+        orphan = await create_ticket(test_db)
+        orphan.status = TicketStatus.ANALYZING
+        queued = await create_ticket(test_db)
+        await queue.enqueue(test_db, queued.ticket_id)
+        done = await create_ticket(test_db)
+        done.status = TicketStatus.DONE
+        await test_db.commit()
+
+        assert await queue.recover() == 1
+
+        result = await test_db.execute(
+            select(AnalysisJob.ticket_id).where(AnalysisJob.status == JobStatus.PENDING)
+        )
+        assert sorted(result.scalars().all()) == sorted([orphan.ticket_id, queued.ticket_id])
+
+        # Recovery is idempotent
+        assert await queue.recover() == 0
+
+    async def test_create_voc_enqueues_job(self, client, test_db: AsyncSession, sample_voc_data):
+        """Creating a VOC persists an analysis job"""
+        response = await client.post("/api/v1/voc", json=sample_voc_data)
+        assert response.status_code == 201
+        ticket_id = response.json()["ticket_id"]
+
+        result = await test_db.execute(
+            select(AnalysisJob).where(AnalysisJob.ticket_id == ticket_id)
+        )
+        job = result.scalar_one()
+        assert job.status == JobStatus.PENDING
@@ -0,0 +1,343 @@
+"""
+LLM service tests
+"""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+from langchain_community.llms import Ollama
+
+from app.services.json_stream import IncrementalJSONScanner
+from app.services.llm_cache import LLMResponseCache
+from app.services.llm_service import LLMAdmissionController, LLMPriority, LLMService
+
+
+@pytest.mark.unit
+class TestLLMAdmissionController:
+    """Priority admission controller tests"""
+
+    async def test_limits_in_flight(self):
+        """No more than max_in_flight calls hold a slot at once"""
+        controller = LLMAdmissionController(max_in_flight=2, aging_seconds=30)
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            async with controller.slot(LLMPriority.NORMAL):
+                peak = max(peak, controller.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(call() for _ in range(6)))
+        assert peak == 2
+        assert controller.in_flight == 0
+        assert controller.get_metrics()["priorities"]["normal"]["requests"] == 6
+
+    async def test_high_priority_served_first(self):
+        """Queued HIGH calls are admitted before earlier LOW calls"""
+        controller = LLMAdmissionController(max_in_flight=1, aging_seconds=30)
+        order = []
+
+        async def call(name, priority):
+            async with controller.slot(priority):
+                order.append(name)
+
+        await controller.acquire(LLMPriority.NORMAL)
+        tasks = [
+            asyncio.create_task(call("backfill", LLMPriority.BACKFILL)),
+            asyncio.create_task(call("low", LLMPriority.LOW)),
+            asyncio.create_task(call("high", LLMPriority.HIGH)),
+        ]
+        await asyncio.sleep(0)
+        assert controller.get_metrics()["queued"] == 3
+
+        controller.release()
+        await asyncio.gather(*tasks)
+        assert order == ["high", "low", "backfill"]
+
+    async def test_aging_prevents_starvation(self):
+        """A long-waiting low priority call overtakes a fresh high priority one"""
+        controller = LLMAdmissionController(max_in_flight=1, aging_seconds=0.01)
+        order = []
+
+        async def call(name, priority):
+            async with controller.slot(priority):
+                order.append(name)
+
+        await controller.acquire(LLMPriority.NORMAL)
+        backfill = asyncio.create_task(call("backfill", LLMPriority.BACKFILL))
+        await asyncio.sleep(0.05)
+        high = asyncio.create_task(call("high", LLMPriority.HIGH))
+        await asyncio.sleep(0)
+
+        controller.release()
+        await asyncio.gather(backfill, high)
+        assert order == ["backfill", "high"]
+
+    async def test_cancelled_waiter_releases_queue(self):
+        """A caller that times out while queued does not leak a slot"""
+        controller = LLMAdmissionController(max_in_flight=1, aging_seconds=30)
+        await controller.acquire(LLMPriority.NORMAL)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(controller.acquire(LLMPriority.LOW), timeout=0.01)
+        assert controller.get_metrics()["queued"] == 0
+
+        controller.release()
+        assert controller.in_flight == 0
+        await asyncio.wait_for(controller.acquire(LLMPriority.HIGH), timeout=0.1)
+        assert controller.in_flight == 1
+
+
+def fake_ollama(*chunks, delay: float = 0.0):
+    """
+    Build a transport serving Ollama's streaming /api/generate
+
+    Records requests and how many chunks the client pulled.
+    """
+    state = {"calls": 0, "pulled": 0, "payloads": []}
+
+    async def body():
+        for chunk in chunks:
+            if delay:
+                await asyncio.sleep(delay)
+            state["pulled"] += 1
+            yield (json.dumps({"response": chunk, "done": False}) + "\n").encode()
+        yield (json.dumps({"response": "", "done": True}) + "\n").encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/generate"
+        state["calls"] += 1
+        state["payloads"].append(json.loads(request.content))
+        return httpx.Response(200, content=body())
+
+    return httpx.MockTransport(handler), state
+
+
+@pytest.mark.unit
+class TestIncrementalJSONScanner:
+    """Incremental JSON scanner tests"""
+
+    def test_completes_at_object_end(self):
+        """Object closing brace completes the scan; prelude and trailer are dropped"""
+        scanner = IncrementalJSONScanner()
+        assert scanner.feed("```json\n{\"a\": {\"b\": [1, 2") is False
+        assert scanner.feed("]}}") is True
+        assert scanner.complete
+        assert scanner.json_text == '{"a": {"b": [1, 2]}}'
+        assert scanner.feed("\n``` trailing chatter") is True
+        assert scanner.json_text == '{"a": {"b": [1, 2]}}'
+
+    def test_braces_inside_strings_are_ignored(self):
+        """Braces and escaped quotes inside strings do not affect nesting"""
+        scanner = IncrementalJSONScanner()
+        scanner.feed('{"msg": "a } \\" { b", ')
+        assert not scanner.done
+        scanner.feed('"x": 1}')
+        assert scanner.complete
+
+    def test_mismatched_bracket_fails(self):
+        """A structural mismatch aborts the scan"""
+        scanner = IncrementalJSONScanner()
+        assert scanner.feed('{"a": [1, 2}') is True
+        assert scanner.failed
+        assert scanner.json_text is None
+
+    def test_long_prelude_fails(self):
+        """Output without an object start within the prefix limit aborts"""
+        scanner = IncrementalJSONScanner(max_prefix_chars=10)
+        assert scanner.feed("I cannot help with that request.") is True
+        assert scanner.failed
+
+
+@pytest.mark.unit
+class TestLLMServiceStreaming:
+    """Streaming generate_json tests"""
+
+    def make_service(self, tmp_path, transport) -> LLMService:
+        cache = LLMResponseCache(path=str(tmp_path / "llm_cache.sqlite3"))
+        return LLMService(cache=cache, transport=transport)
+
+    async def test_streams_from_ollama_api(self, tmp_path):
+        """Chunks come from /api/generate with the model and temperature"""
+        transport, state = fake_ollama("Hel", "lo")
+        service = self.make_service(tmp_path, transport)
+
+        chunks = [chunk async for chunk in service.stream("sys", "user", temperature=0.2)]
+
+        assert chunks == ["Hel", "lo"]
+        payload = state["payloads"][0]
+        assert payload["model"] == service.llm.model
+        assert payload["prompt"] == "sys\n\nuser"
+        assert payload["stream"] is True
+        assert payload["options"]["temperature"] == 0.2
+
+    async def test_temperature_is_per_call(self, tmp_path):
+        """Queued calls keep their own temperature; the shared model is untouched"""
+        transport, state = fake_ollama('{"ok": true}')
+        service = self.make_service(tmp_path, transport)
+        default = service.llm.temperature
+
+        await asyncio.gather(
+            service.generate_json("sys", "a", temperature=0.2, use_cache=False),
+            service.generate_json("sys", "b", temperature=0.7, use_cache=False),
+            service.generate_json("sys", "c", use_cache=False),
+        )
+
+        temperatures = {p["prompt"][-1]: p["options"]["temperature"] for p in state["payloads"]}
+        assert temperatures == {"a": 0.2, "b": 0.7, "c": default}
+        assert service.llm.temperature == default
+
+        with patch.object(Ollama, "ainvoke", AsyncMock(return_value="{}")) as ainvoke:
+            await service.generate("sys", "user", temperature=0.3)
+        assert ainvoke.await_args.kwargs == {"temperature": 0.3}
+        assert service.llm.temperature == default
+
+    async def test_stops_when_object_closes(self, tmp_path):
+        """Generation stops at the closing brace and the slot is released"""
+        transport, state = fake_ollama('{"summary": ', '"x"}', "\nHope this helps!", " More text")
+        service = self.make_service(tmp_path, transport)
+
+        response = await service.generate_json("sys", "user", stream=True)
+
+        assert response == '{"summary": "x"}'
+        assert state["pulled"] == 2
+        assert service.admission.in_flight == 0
+
+    async def test_aborts_on_invalid_output(self, tmp_path):
+        """Clearly invalid output stops the stream early"""
+        transport, state = fake_ollama('{"a": ]', "never", "pulled")
+        service = self.make_service(tmp_path, transport)
+
+        response = await service.generate_json("sys", "user", stream=True)
+
+        assert response == '{"a": ]'
+        assert state["pulled"] == 1
+
+    async def test_http_error_raises(self, tmp_path):
+        """Ollama errors surface instead of yielding an empty stream"""
+        transport = httpx.MockTransport(lambda request: httpx.Response(404, json={"error": "model not found"}))
+        service = self.make_service(tmp_path, transport)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await service.generate_json("sys", "user", stream=True)
+        assert service.admission.in_flight == 0
+
+    async def test_stream_timeout(self, tmp_path):
+        """The timeout applies to the streamed generation"""
+        transport, _ = fake_ollama("{", "}", delay=1)
+        service = self.make_service(tmp_path, transport)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await service.generate_json("sys", "user", stream=True, timeout=0.05)
+        assert service.admission.in_flight == 0
+
+
+@pytest.mark.unit
+class TestLLMResponseCache:
+    """LLM response cache tests"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return LLMResponseCache(path=str(tmp_path / "llm_cache.sqlite3"), max_entries=2, ttl_seconds=3600)
+
+    def test_key_depends_on_all_inputs(self):
+        """Model, prompts and temperature all change the key"""
+        base = LLMResponseCache.make_key("m", "sys", "user", 0.1)
+        assert base == LLMResponseCache.make_key("m", "sys", "user", 0.1)
+        assert base != LLMResponseCache.make_key("m2", "sys", "user", 0.1)
+        assert base != LLMResponseCache.make_key("m", "sys2", "user", 0.1)
+        assert base != LLMResponseCache.make_key("m", "sys", "user2", 0.1)
+        assert base != LLMResponseCache.make_key("m", "sys", "user", 0.2)
+
+    def test_hit_miss_and_persistence(self, cache, tmp_path):
+        """Stored responses survive reopening the cache file"""
+        assert cache.get("k1") is None
+        cache.set("k1", '{"a": 1}')
+        assert cache.get("k1") == '{"a": 1}'
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+        reopened = LLMResponseCache(path=cache.path)
+        assert reopened.get("k1") == '{"a": 1}'
+
+    def test_lru_eviction(self, cache):
+        """Least recently used entry is evicted beyond max_entries"""
+        cache.set("k1", "1")
+        time.sleep(0.01)
+        cache.set("k2", "2")
+        time.sleep(0.01)
+        cache.get("k1")
+        time.sleep(0.01)
+        cache.set("k3", "3")
+
+        assert cache.get("k2") is None
+        assert cache.get("k1") == "1"
+        assert cache.get("k3") == "3"
+        assert cache.get_stats()["entries"] == 2
+
+    def test_ttl_expiry(self, tmp_path):
+        """Entries older than the TTL are treated as misses"""
+        cache = LLMResponseCache(path=str(tmp_path / "ttl.sqlite3"), ttl_seconds=0.01)
+        cache.set("k1", "1")
+        time.sleep(0.02)
+        assert cache.get("k1") is None
+
+
+@pytest.mark.unit
+class TestLLMServiceCache:
+    """generate_json caching behavior"""
+
+    def make_service(self, tmp_path, transport=None) -> LLMService:
+        cache = LLMResponseCache(path=str(tmp_path / "llm_cache.sqlite3"))
+        return LLMService(cache=cache, transport=transport)
+
+    async def test_identical_prompts_hit_cache(self, tmp_path):
+        """Second identical low-temperature call does not reach the model"""
+        transport, state = fake_ollama('{"ok": true}')
+        service = self.make_service(tmp_path, transport)
+
+        first = await service.generate_json("sys", "user", temperature=0.1)
+        second = await service.generate_json("sys", "user", temperature=0.1)
+
+        assert first == second == '{"ok": true}'
+        assert state["calls"] == 1
+
+    async def test_bypass_and_non_json_not_cached(self, tmp_path):
+        """use_cache=False and unparseable responses always call the model"""
+        transport, state = fake_ollama('{"ok": true}')
+        service = self.make_service(tmp_path, transport)
+
+        await service.generate_json("sys", "user", temperature=0.1, use_cache=False)
+        await service.generate_json("sys", "user", temperature=0.1, use_cache=False)
+        assert state["calls"] == 2
+
+        with patch.object(Ollama, "ainvoke", AsyncMock(return_value="not json")) as ainvoke:
+            await service.generate_json("sys", "other", temperature=0.1, stream=False)
+            await service.generate_json("sys", "other", temperature=0.1, stream=False)
+        assert ainvoke.await_count == 2
+
+    async def test_invalid_response_not_cached(self, tmp_path):
+        """JSON that fails the caller's validation is asked for again"""
+        transport, state = fake_ollama('{"unexpected": true}')
+        service = self.make_service(tmp_path, transport)
+
+        def validate(text):
+            return "summary" in json.loads(text)
+
+        await service.generate_json("sys", "user", temperature=0.1, validate=validate)
+        await service.generate_json("sys", "user", temperature=0.1, validate=validate)
+        assert state["calls"] == 2
+        assert service.cache.get_stats()["entries"] == 0
+
+    async def test_high_temperature_not_cached(self, tmp_path):
+        """Sampling calls above llm_cache_max_temperature are not cached"""
+        transport, state = fake_ollama('{"ok": true}')
+        service = self.make_service(tmp_path, transport)
+
+        await service.generate_json("sys", "user", temperature=0.9)
+        await service.generate_json("sys", "user", temperature=0.9)
+        assert state["calls"] == 2
@@ -0,0 +1,162 @@
+"""
+Log adapter tests: cursor pagination, file and HTTP backends
+"""
+
+import time
+from datetime import timedelta
+
+import httpx
+import pytest
+
+from app.agents.solver.tools import analyze_service_error_patterns, get_logs
+from app.mock import log_server
+from app.mock.log_service import MockLogService
+from app.mock.schemas import LogQueryParams
+from app.services.log_adapter import FileLogAdapter, HttpLogAdapter
+from tests.test_mock_logs import BASE, brute_force, make_logs
+
+
+@pytest.fixture
+def log_service(monkeypatch) -> MockLogService:
+    """Scenario logs plus a bulk service with many shared timestamps"""
+    service = MockLogService(store="indexed")
+    service.add_logs("BulkService", make_logs(1000))
+    monkeypatch.setattr("app.mock.log_service._mock_log_service_instance", service)
+    return service
+
+
+@pytest.fixture(params=["file", "http"])
+async def adapter(request, log_service):
+    if request.param == "file":
+        adapter = FileLogAdapter(log_service)
+    else:
+        adapter = HttpLogAdapter("http://logs", transport=httpx.ASGITransport(app=log_server.app))
+    yield adapter
+    await adapter.close()
+
+
+def bulk_query(level=None, limit=7) -> LogQueryParams:
+    return LogQueryParams(
+        service="BulkService",
+        start_time=BASE + timedelta(seconds=50),
+        end_time=BASE + timedelta(seconds=300),
+        level=level,
+        limit=limit,
+    )
+
+
+@pytest.mark.unit
+class TestLogPagination:
+    """Cursor pagination of the mock log service"""
+
+    @pytest.mark.parametrize("level", [None, "ERROR"])
+    def test_cursor_visits_every_log_once(self, log_service, level):
+        params = bulk_query(level)
+        # Same seed as the fixture's logs
+        expected = brute_force(make_logs(1000), params.start_time, params.end_time, level)
+
+        pages, cursor = [], None
+        while True:
+            result = log_service.query_logs(params, cursor)
+            assert result.total_count == len(expected)
+            pages.append(result.logs)
+            cursor = result.next_cursor
+            if not cursor:
+                break
+
+        assert [log for page in pages for log in page] == expected
+        assert all(len(page) == 7 for page in pages[:-1])
+
+    def test_invalid_cursor(self, log_service):
+        with pytest.raises(ValueError):
+            log_service.query_logs(bulk_query(), "not-a-cursor")
+
+
+@pytest.mark.unit
+class TestLogAdapters:
+    """File and HTTP adapters serve identical pages"""
+
+    async def test_iter_logs_follows_cursors(self, adapter):
+        params = bulk_query("WARN")
+        expected = brute_force(make_logs(1000), params.start_time, params.end_time, "WARN")
+
+        logs = [log async for log in adapter.iter_logs(params)]
+        assert logs == expected
+
+        first_two = [log async for log in adapter.iter_logs(params, max_pages=2)]
+        assert first_two == expected[:14]
+
+    async def test_error_patterns(self, adapter, log_service):
+        params = bulk_query("ERROR")
+        assert await adapter.analyze_error_patterns(params) == log_service.analyze_error_patterns(params)
+
+    async def test_search_many(self, adapter, log_service):
+        queries = [bulk_query(level) for level in ["DEBUG", "INFO", "WARN", "ERROR"]]
+
+        results = await adapter.search_many(queries)
+
+        assert [r.total_count for r in results] == [
+            log_service.query_logs(q).total_count for q in queries
+        ]
+
+    async def test_http_errors_raise(self, log_service):
+        adapter = HttpLogAdapter("http://logs", transport=httpx.ASGITransport(app=log_server.app))
+        with pytest.raises(httpx.HTTPStatusError):
+            await adapter.search_logs(bulk_query(), cursor="garbage")
+        await adapter.close()
+
+    async def test_file_adapter_runs_queries_concurrently(self, log_service):
+        """Test queries share a bounded worker pool"""
+        running, peak = 0, 0
+
+        def slow_query(params, cursor=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            time.sleep(0.05)
+            running -= 1
+            return MockLogService.query_logs(log_service, params, cursor)
+
+        log_service.query_logs = slow_query
+        adapter = FileLogAdapter(log_service, max_workers=2)
+
+        await adapter.search_many([bulk_query() for _ in range(6)])
+        await adapter.close()
+
+        assert peak == 2
+
+
+@pytest.mark.unit
+class TestLogTools:
+    """Solver tools served through the adapter"""
+
+    async def test_get_logs_pages(self, adapter):
+        first = await get_logs(
+            service="BulkService",
+            start_time=BASE,
+            end_time=BASE + timedelta(hours=1),
+            limit=100,
+            adapter=adapter,
+        )
+        second = await get_logs(
+            service="BulkService",
+            start_time=BASE,
+            end_time=BASE + timedelta(hours=1),
+            limit=100,
+            cursor=first.next_cursor,
+            adapter=adapter,
+        )
+
+        assert first.total_count == second.total_count == 1000
+        assert len(first.logs) == len(second.logs) == 100
+        assert first.logs[-1]["timestamp"] <= second.logs[0]["timestamp"]
+
+    async def test_analyze_service_error_patterns(self, adapter):
+        result = await analyze_service_error_patterns(
+            service="PaymentService",
+            start_time=BASE,
+            end_time=BASE + timedelta(hours=1),
+            level="ERROR",
+            adapter=adapter,
+        )
+        assert result.total_errors > 0
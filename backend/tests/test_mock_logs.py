@@ -0,0 +1,334 @@
+"""
+Mock log service tests
+"""
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.agents.solver.tools.analyze_patterns import analyze_error_patterns
+from app.config import settings
+from app.mock.columnar_store import ColumnarLogStore
+from app.mock.log_archive import INDEX_DTYPE, LogArchive
+from app.mock.log_index import ServiceLogIndex
+from app.mock.log_service import MockLogService, SCENARIOS_DIR
+from app.mock.schemas import LogEntry, LogQueryParams
+from app.mock.workload import generate_workload
+
+LEVELS = ["DEBUG", "INFO", "WARN", "ERROR"]
+BASE = datetime(2024, 1, 15, 18, 0, tzinfo=timezone.utc)
+
+
+def make_logs(count: int, seed: int = 0) -> list:
+    """Random logs in random order, with some shared timestamps"""
+    rng = random.Random(seed)
+    logs = []
+    for i in range(count):
+        level = rng.choice(LEVELS)
+        failing = level == "ERROR" and rng.random() < 0.8
+        logs.append(LogEntry(
+            timestamp=BASE + timedelta(seconds=rng.randrange(count // 2)),
+            level=level,
+            service="PaymentService",
+            message=rng.choice(["External gateway timeout", "DB error", f"log {i}"]),
+            error_code=rng.choice(["PG_TIMEOUT", "DB_LOCK", "NPE"]) if failing else None,
+            stack_trace=rng.choice(["java.net.Timeout\n at A", "java.lang.NPE\n at B"]) if failing else None,
+            metadata={"gateway": rng.choice(["KCP", "TossPay"])} if rng.random() < 0.5 else None,
+        ))
+    return logs
+
+
+def brute_force(logs, start, end, level=None):
+    """Reference implementation: linear scan, then stable sort by time"""
+    matching = [
+        log for log in logs
+        if start <= log.timestamp <= end and (level is None or log.level == level)
+    ]
+    return sorted(matching, key=lambda log: log.timestamp)
+
+
+@pytest.fixture(params=[ServiceLogIndex, ColumnarLogStore, LogArchive])
+def store_class(request, tmp_path):
+    if request.param is LogArchive:
+        # Small blocks so windows cut through many of them
+        return lambda: LogArchive(tmp_path / "archive", block_size=64).service("PaymentService")
+    return request.param
+
+
+@pytest.mark.unit
+class TestLogStores:
+    """Time-sorted range queries of both log stores"""
+
+    @pytest.mark.parametrize("level", [None, "ERROR", "WARN"])
+    def test_matches_linear_scan(self, store_class, level):
+        logs = make_logs(2000)
+        index = store_class()
+        # Out-of-order batches exercise the re-sort path
+        index.extend(logs[:1500])
+        index.extend(logs[1500:])
+
+        rng = random.Random(1)
+        for _ in range(50):
+            start = BASE + timedelta(seconds=rng.randrange(1000))
+            end = start + timedelta(seconds=rng.randrange(300))
+            expected = brute_force(logs, start, end, level)
+
+            entries, total = index.query(start, end, level=level, limit=25)
+
+            assert total == len(expected)
+            assert entries == expected[:25]
+
+    def test_bounds_are_inclusive(self, store_class):
+        logs = [
+            LogEntry(timestamp=BASE + timedelta(seconds=i), level="INFO", service="S", message=str(i))
+            for i in range(5)
+        ]
+        index = store_class()
+        index.extend(logs)
+
+        entries, total = index.query(BASE + timedelta(seconds=1), BASE + timedelta(seconds=3))
+        assert [e.message for e in entries] == ["1", "2", "3"]
+        assert total == 3
+
+        # Naive bounds are taken as UTC
+        entries, _ = index.query(datetime(2024, 1, 15, 18, 0, 4), datetime(2024, 1, 16))
+        assert [e.message for e in entries] == ["4"]
+
+        assert index.query(BASE, BASE, level="ERROR") == ([], 0)
+
+    @pytest.mark.parametrize("level", [None, "ERROR"])
+    def test_error_patterns_match_log_analysis(self, store_class, level):
+        """Test the in-store summary equals the per-log tool analysis"""
+        logs = make_logs(3000)
+        store = store_class()
+        store.extend(logs)
+        start, end = BASE + timedelta(seconds=100), BASE + timedelta(seconds=900)
+
+        stats = store.error_patterns(start, end, level=level)
+
+        expected = analyze_error_patterns([
+            {**log.model_dump(), "timestamp": log.timestamp.isoformat()}
+            for log in brute_force(logs, start, end, level)
+        ])
+        assert stats.total_errors == expected.total_errors
+        assert stats.total_warnings == expected.total_warnings
+        assert [s.model_dump() for s in stats.error_summary] == [
+            s.model_dump() for s in expected.error_summary
+        ]
+        assert [s.model_dump() for s in stats.external_system_errors] == [
+            s.model_dump() for s in expected.external_system_errors
+        ]
+        assert sorted(stats.stack_trace_patterns) == sorted(expected.stack_trace_patterns)
+
+
+@pytest.mark.unit
+class TestColumnarLogStore:
+    """Columnar encoding"""
+
+    def test_compact_encoding(self):
+        store = ColumnarLogStore()
+        for log in make_logs(10000):
+            store.append(
+                log.timestamp, log.level, log.service, log.message,
+                log.error_code, log.stack_trace, log.metadata,
+            )
+
+        assert len(store) == 10000
+        assert store.nbytes / len(store) < 32
+        # Repeated strings are stored once
+        assert len(store.metadata) == 2
+        assert len(store.error_codes) == 3
+
+
+@pytest.mark.unit
+class TestLogArchive:
+    """Segment files, sparse block index and importers"""
+
+    def test_only_overlapping_blocks_are_decoded(self, tmp_path):
+        logs = [
+            LogEntry(timestamp=BASE + timedelta(seconds=i), level="INFO", service="S", message=str(i))
+            for i in range(1000)
+        ]
+        archive = LogArchive(tmp_path, block_size=100)
+        store = archive.service("S")
+        store.extend(logs)
+
+        # Blocks fully inside the window are counted from the index
+        entries, total = store.query(BASE + timedelta(seconds=150), BASE + timedelta(seconds=849), limit=10)
+        assert total == 700
+        assert [e.message for e in entries] == [str(i) for i in range(150, 160)]
+        assert store.blocks_decoded == 2  # the two edge blocks
+
+        store.blocks_decoded = 0
+        _, total = store.query(BASE + timedelta(seconds=200), BASE + timedelta(seconds=499), limit=5)
+        assert total == 300
+        assert store.blocks_decoded == 1  # first page block only
+
+    def test_reopen_and_segment_rollover(self, tmp_path):
+        logs = make_logs(2000)
+        archive = LogArchive(tmp_path, block_size=100, segment_max_bytes=8 * 1024)
+        archive.service("PaymentService").extend(logs)
+        archive.close()
+
+        store = LogArchive(tmp_path).service("PaymentService")
+        assert len(list((tmp_path / "PaymentService").glob("*.seg"))) > 1
+        assert len(store) == 2000
+        start, end = BASE + timedelta(seconds=100), BASE + timedelta(seconds=400)
+        assert store.query(start, end) == (brute_force(logs, start, end), len(brute_force(logs, start, end)))
+
+    def test_recovers_from_torn_append(self, tmp_path):
+        archive = LogArchive(tmp_path, block_size=100)
+        archive.service("S").extend(make_logs(300))
+        archive.close()
+
+        seg, idx = tmp_path / "S" / "000000.seg", tmp_path / "S" / "000000.idx"
+        seg_size = seg.stat().st_size
+        # Block data written, index record torn mid-write
+        with open(seg, "ab") as f:
+            f.write(b"partial block")
+        with open(idx, "ab") as f:
+            f.write(b"\0" * (INDEX_DTYPE.itemsize // 2))
+
+        store = LogArchive(tmp_path, block_size=100).service("S")
+        assert len(store) == 300
+        assert seg.stat().st_size == seg_size
+        assert idx.stat().st_size == 3 * INDEX_DTYPE.itemsize
+
+        store.extend(make_logs(50, seed=1))
+        assert len(LogArchive(tmp_path).service("S")) == 350
+
+    def test_import_jsonl_and_scenario(self, tmp_path):
+        logs = make_logs(250)
+        path = tmp_path / "logs.jsonl"
+        path.write_text("".join(log.model_dump_json() + "\n" for log in logs), encoding="utf-8")
+        archive = LogArchive(tmp_path / "archive", block_size=100)
+
+        assert archive.import_jsonl(path, service="Bulk") == {"Bulk": 250}
+        assert archive.import_scenario(SCENARIOS_DIR / "s2_code_npe.json") == {
+            "RefundService": len(json.loads(
+                (SCENARIOS_DIR / "s2_code_npe.json").read_text(encoding="utf-8")
+            )["logs"])
+        }
+        assert archive.services() == ["Bulk", "RefundService"]
+
+        entries, total = archive.service("Bulk").query(BASE, BASE + timedelta(days=1))
+        assert total == 250
+        assert entries == brute_force(logs, BASE, BASE + timedelta(days=1))
+
+
+@pytest.mark.unit
+class TestMockLogService:
+    """Scenario-backed log queries"""
+
+    @pytest.mark.parametrize("store", ["indexed", "columnar", "archive"])
+    def test_query_scenario_logs(self, store, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "mock_log_archive_path", str(tmp_path))
+        service = MockLogService(store=store)
+        params = LogQueryParams(
+            service="PaymentService",
+            start_time=datetime(2024, 1, 15, 18, 0),
+            end_time=datetime(2024, 1, 15, 19, 0),
+            level="ERROR",
+        )
+
+        result = service.query_logs(params)
+
+        assert result.total_count > 0
+        assert all(log.level == "ERROR" for log in result.logs)
+        timestamps = [log.timestamp for log in result.logs]
+        assert timestamps == sorted(timestamps)
+
+        stats = service.analyze_error_patterns(params)
+        assert stats.total_errors == result.total_count
+        assert stats.error_summary
+
+    def test_limit_and_unknown_service(self):
+        service = MockLogService()
+        service.add_logs("BulkService", make_logs(500))
+
+        result = service.query_logs(LogQueryParams(
+            service="BulkService",
+            start_time=BASE,
+            end_time=BASE + timedelta(hours=1),
+            limit=10,
+        ))
+        assert result.total_count == 500
+        assert result.filtered_count == 10
+        assert service.get_log_count_by_service("BulkService") == 500
+
+        result = service.query_logs(LogQueryParams(
+            service="Unknown", start_time=BASE, end_time=BASE,
+        ))
+        assert result.total_count == 0
+
+    def test_archive_persists_across_instances(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "mock_log_archive_path", str(tmp_path))
+        first = MockLogService(store="archive")
+        first.add_logs("BulkService", make_logs(500))
+
+        second = MockLogService(store="archive")
+
+        assert second.get_log_count_by_service("BulkService") == 500
+        assert second.get_log_count_by_service("PaymentService") == (
+            first.get_log_count_by_service("PaymentService")
+        )
+
+
+@pytest.mark.unit
+class TestWorkloadGenerator:
+    """Synthetic scale-test dataset"""
+
+    def test_deterministic_by_seed(self, tmp_path):
+        for name, seed in [("a", 7), ("b", 7), ("c", 8)]:
+            generate_workload(tmp_path / name, log_count=2000, voc_count=20, incident_count=5, seed=seed)
+
+        files = ["logs/PaymentService.jsonl", "vocs.json", "incidents.json"]
+        read = lambda name, file: (tmp_path / name / file).read_bytes()
+        assert all(read("a", file) == read("b", file) for file in files)
+        assert read("a", files[0]) != read("c", files[0])
+
+    def test_logs_load_into_log_stores(self, tmp_path):
+        summary = generate_workload(
+            tmp_path, log_count=20000, voc_count=50, incident_count=10, seed=1, log_format="scenario"
+        )
+        incidents = json.loads((tmp_path / "incidents.json").read_text(encoding="utf-8"))
+        assert sum(summary["logs"].values()) == 20000
+
+        service = MockLogService(store="indexed", scenarios_dir=tmp_path / "scenarios")
+        for name, count in summary["logs"].items():
+            assert service.get_log_count_by_service(name) == count
+
+        # Every incident shows up as an error burst in its service's logs
+        for incident in incidents:
+            stats = service.analyze_error_patterns(LogQueryParams(
+                service=incident["service"],
+                start_time=datetime.fromisoformat(incident["start"].replace("Z", "+00:00")),
+                end_time=datetime.fromisoformat(incident["end"].replace("Z", "+00:00")),
+            ))
+            assert stats.total_errors > 0
+
+        generate_workload(tmp_path / "jsonl", log_count=20000, incident_count=10, seed=1)
+        archive = LogArchive(tmp_path / "archive")
+        assert archive.import_jsonl(tmp_path / "jsonl" / "logs" / "PaymentService.jsonl") == {
+            "PaymentService": summary["logs"]["PaymentService"]
+        }
+
+    def test_vocs_follow_incidents(self, tmp_path):
+        generate_workload(tmp_path, log_count=1000, voc_count=200, incident_count=5, seed=2)
+        vocs = json.loads((tmp_path / "vocs.json").read_text(encoding="utf-8"))
+        incidents = {
+            incident["incident_id"]: incident
+            for incident in json.loads((tmp_path / "incidents.json").read_text(encoding="utf-8"))
+        }
+
+        assert len(vocs) == 200
+        assert len({voc["ticket_id"] for voc in vocs}) == 200
+        related = [voc for voc in vocs if voc["incident_id"]]
+        assert 0 < len(related) < 200
+        for voc in related:
+            incident = incidents[voc["incident_id"]]
+            assert voc["service"] == incident["service"]
+            assert incident["start"] <= voc["received_at"]
+            assert voc["problem_type_primary"] in ("integration_error", "code_error")
@@ -2,14 +2,19 @@
 Tests for RAG module
 """
 
+import asyncio
 import pytest
 import tempfile
 import shutil
+import threading
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
+
+import numpy as np
 
 from app.rag.schemas import VocDocument, SearchResult, SimilarCasesContext
-from app.rag.embeddings import EmbeddingService
+from app.rag.embeddings import EmbeddingService, EmbeddingBatcher
+from app.rag.embedding_cache import EmbeddingCache
 from app.rag.vector_store import VocVectorStore
 from app.rag.retriever import VocRetriever
 from app.services.rag_service import RagService, load_seed_data
@@ -123,6 +128,142 @@ class TestEmbeddingService:
         assert dim > 0
 
 
+@pytest.mark.unit
+class TestEmbeddingBatcher:
+    """Tests for EmbeddingBatcher micro-batching"""
+
+    def test_concurrent_requests_share_one_batch(self):
+        """Requests arriving within the wait window are encoded together"""
+        calls = []
+
+        def encode(texts):
+            calls.append(list(texts))
+            return [[float(len(t))] for t in texts]
+
+        batcher = EmbeddingBatcher(encode, max_batch_size=8, max_wait_seconds=0.2)
+        futures = [batcher.submit(["a"]), batcher.submit(["bb", "ccc"]), batcher.submit(["dddd"])]
+
+        assert [f.result(timeout=5) for f in futures] == [[[1.0]], [[2.0], [3.0]], [[4.0]]]
+        assert calls == [["a", "bb", "ccc", "dddd"]]
+        assert batcher.batches == 1
+
+    def test_batch_size_limit(self):
+        """A full batch is encoded without waiting for the window"""
+        calls = []
+
+        def encode(texts):
+            calls.append(len(texts))
+            return [[0.0] for _ in texts]
+
+        batcher = EmbeddingBatcher(encode, max_batch_size=2, max_wait_seconds=0.2)
+        futures = [batcher.submit([str(i)]) for i in range(4)]
+
+        for f in futures:
+            f.result(timeout=5)
+        assert calls == [2, 2]
+
+    def test_encode_error_propagates(self):
+        """An encoding failure is raised to every caller in the batch"""
+        def encode(texts):
+            raise RuntimeError("model failure")
+
+        batcher = EmbeddingBatcher(encode, max_batch_size=8, max_wait_seconds=0.01)
+
+        with pytest.raises(RuntimeError, match="model failure"):
+            batcher.submit(["a"]).result(timeout=5)
+
+    async def test_async_submit(self):
+        """Futures can be awaited from the event loop"""
+        batcher = EmbeddingBatcher(
+            lambda texts: [[1.0] for _ in texts], max_batch_size=8, max_wait_seconds=0.01
+        )
+        result = await asyncio.wrap_future(batcher.submit(["a", "b"]))
+        assert result == [[1.0], [1.0]]
+
+    async def test_cancelled_request_does_not_stop_batcher(self):
+        """Cancelled awaits (queued or encoding) leave the batcher working"""
+        release = threading.Event()
+        calls = []
+
+        def encode(texts):
+            calls.append(list(texts))
+            release.wait(5)
+            return [[1.0] for _ in texts]
+
+        batcher = EmbeddingBatcher(encode, max_batch_size=1, max_wait_seconds=0.01)
+        encoding = asyncio.ensure_future(asyncio.wrap_future(batcher.submit(["encoding"])))
+        while not calls:
+            await asyncio.sleep(0.01)
+        queued = asyncio.ensure_future(asyncio.wrap_future(batcher.submit(["queued"])))
+        await asyncio.sleep(0)
+
+        for task in (encoding, queued):
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        # Let the cancellation propagate to the batcher futures
+        await asyncio.sleep(0)
+        release.set()
+
+        result = await asyncio.wait_for(asyncio.wrap_future(batcher.submit(["after"])), 5)
+        assert result == [[1.0]]
+        assert calls == [["encoding"], ["after"]]
+
+
+@pytest.mark.unit
+class TestEmbeddingCache:
+    """Tests for the persistent embedding cache"""
+
+    def test_roundtrip_as_float32(self, tmp_path):
+        """Stored vectors are returned for the same model and text"""
+        cache = EmbeddingCache("model-a", path=str(tmp_path / "emb.sqlite3"))
+        cache.set_many({"결제 오류": [0.5, -1.25, 2.0]})
+
+        assert cache.get_many(["결제 오류", "배송 지연"]) == {"결제 오류": [0.5, -1.25, 2.0]}
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_lru_eviction(self, tmp_path):
+        """Least recently used vectors are evicted beyond max_entries"""
+        cache = EmbeddingCache("model-a", path=str(tmp_path / "emb.sqlite3"), max_entries=2)
+        cache.set_many({"a": [1.0]})
+        cache.set_many({"b": [2.0]})
+        cache.get_many(["a"])
+        cache.set_many({"c": [3.0]})
+
+        assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+        assert cache.evictions == 1
+
+    def test_model_change_invalidates(self, tmp_path):
+        """Opening the cache with another model drops old vectors"""
+        path = str(tmp_path / "emb.sqlite3")
+        EmbeddingCache("model-a", path=path).set_many({"a": [1.0]})
+
+        cache = EmbeddingCache("model-b", path=path)
+        assert cache.get_many(["a"]) == {}
+        assert cache.get_stats()["entries"] == 0
+
+    def test_service_encodes_each_text_once(self, tmp_path):
+        """EmbeddingService only sends cache misses to the model"""
+        model = MagicMock()
+        model.encode.side_effect = lambda texts, **kwargs: np.ones((len(texts), 3), dtype=np.float32)
+
+        with patch.object(EmbeddingService, "_instance", None), \
+             patch.object(EmbeddingService, "_model", None), \
+             patch.object(EmbeddingService, "_batcher", None), \
+             patch.object(EmbeddingService, "_cache", None), \
+             patch("app.rag.embeddings.SentenceTransformer", return_value=model), \
+             patch("app.rag.embedding_cache.settings.embedding_cache_path",
+                   str(tmp_path / "emb.sqlite3")):
+            service = EmbeddingService()
+            assert service.embed_texts(["a", "b", "a"]) == [[1.0] * 3] * 3
+            assert service.embed_text("b") == [1.0] * 3
+
+        assert model.encode.call_count == 1
+        assert model.encode.call_args.args[0] == ["a", "b"]
+
+
 class TestVocVectorStore:
     """Tests for VocVectorStore"""
 
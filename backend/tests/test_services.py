@@ -4,11 +4,14 @@ Service layer tests
 
 import pytest
 from datetime import datetime
+from sqlalchemy import inspect, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.ticket_service import TicketService, generate_ticket_id
-from app.schemas.ticket import VOCCreate
-from app.models.ticket import TicketStatus, Channel
+from app.services.ticket_transitions import TicketTransitionError
+from app.services.ticket_stats import get_change_version, get_ticket_stats
+from app.schemas.ticket import VOCCreate, TicketBulkActionItem
+from app.models.ticket import Ticket, TicketStatus, Channel, Urgency
 
 
 @pytest.mark.unit
@@ -113,6 +116,58 @@ class TestTicketService:
         assert len(tickets) == 2
         assert total == 5
 
+    async def test_list_tickets_by_cursor(self, test_db: AsyncSession):
+        """Test keyset pagination walks forward and back without gaps"""
+        service = TicketService(test_db)
+
+        for i in range(5):
+            await service.create_ticket(VOCCreate(
+                raw_voc=f"VOC {i}",
+                customer_name=f"Customer {i}",
+                channel=Channel.EMAIL,
+                received_at=datetime.now(),
+            ))
+        expected, _ = await service.list_tickets(limit=5)
+        expected_ids = [t.ticket_id for t in expected]
+
+        # Forward
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            tickets, next_cursor, prev_cursor, total = await service.list_tickets_by_cursor(
+                cursor=cursor, limit=2
+            )
+            assert total is None
+            assert (prev_cursor is None) == (cursor is None)
+            seen.extend(t.ticket_id for t in tickets)
+            pages += 1
+            if next_cursor is None:
+                break
+            cursor = next_cursor
+        assert seen == expected_ids
+        assert pages == 3
+
+        # Back from the last page
+        tickets, next_cursor, prev_cursor, _ = await service.list_tickets_by_cursor(
+            cursor=prev_cursor, limit=2
+        )
+        assert [t.ticket_id for t in tickets] == expected_ids[2:4]
+        assert next_cursor is not None
+
+        tickets, _, prev_cursor, total = await service.list_tickets_by_cursor(
+            cursor=prev_cursor, limit=2, include_total=True
+        )
+        assert [t.ticket_id for t in tickets] == expected_ids[:2]
+        assert prev_cursor is None
+        assert total == 5
+
+    async def test_list_tickets_invalid_cursor(self, test_db: AsyncSession):
+        """Test malformed cursors are rejected"""
+        service = TicketService(test_db)
+        with pytest.raises(ValueError):
+            await service.list_tickets_by_cursor(cursor="not-a-cursor")
+
     async def test_list_tickets_filter_by_status(self, test_db: AsyncSession):
         """Test filtering tickets by status"""
         service = TicketService(test_db)
@@ -177,6 +232,34 @@ class TestTicketService:
         with pytest.raises(ValueError):
             await service.confirm_ticket(ticket.ticket_id)
 
+    async def test_concurrent_actions_only_one_wins(self, test_db: AsyncSession):
+        """Test a second action on an already-decided ticket is rejected"""
+        service = TicketService(test_db)
+        ticket = await service.create_ticket(VOCCreate(
+            raw_voc="Test",
+            customer_name="User",
+            channel=Channel.EMAIL,
+            received_at=datetime.now(),
+        ))
+        ticket.status = TicketStatus.WAITING_CONFIRM
+        await test_db.commit()
+
+        await service.confirm_ticket(ticket.ticket_id, "admin1@test.com")
+
+        with pytest.raises(TicketTransitionError) as exc_info:
+            await service.reject_ticket(ticket.ticket_id, "다른 관리자", "admin2@test.com")
+        assert exc_info.value.current == TicketStatus.DONE
+
+        await test_db.refresh(ticket)
+        assert ticket.status == TicketStatus.DONE
+        assert ticket.assignee == "admin1@test.com"
+        assert ticket.reject_reason is None
+
+    async def test_transition_missing_ticket(self, test_db: AsyncSession):
+        """Test actions on unknown tickets return None"""
+        service = TicketService(test_db)
+        assert await service.confirm_ticket("VOC-99999999-9999") is None
+
     async def test_reject_ticket(self, test_db: AsyncSession):
         """Test rejecting a ticket"""
         service = TicketService(test_db)
@@ -225,6 +308,24 @@ class TestTicketService:
         assert retried is not None
         assert retried.status == TicketStatus.ANALYZING
 
+    async def test_updated_at_format_is_stable(self, test_db: AsyncSession):
+        """Inserted and updated rows store updated_at in the same format"""
+        service = TicketService(test_db)
+        ticket = await service.create_ticket(VOCCreate(
+            raw_voc="Test",
+            customer_name="User",
+            channel=Channel.EMAIL,
+            received_at=datetime.now(),
+        ))
+        created = await service.get_ticket_version(ticket.ticket_id)
+
+        ticket.status = TicketStatus.WAITING_CONFIRM
+        await test_db.commit()
+        updated = await service.get_ticket_version(ticket.ticket_id)
+
+        assert updated > created
+        assert len(created) == len(updated)
+
     async def test_complete_manual_ticket(self, test_db: AsyncSession):
         """Test completing manual ticket"""
         service = TicketService(test_db)
@@ -250,3 +351,135 @@ class TestTicketService:
         assert completed.status == TicketStatus.DONE
         assert completed.manual_resolution == "수동으로 처리 완료"
         assert completed.assignee == "admin@test.com"
+
+
+@pytest.mark.integration
+class TestTicketFieldLoading:
+    """List queries only load the requested columns"""
+
+    async def test_list_loads_only_requested_columns(self, test_db: AsyncSession):
+        service = TicketService(test_db)
+        await service.create_ticket(VOCCreate(
+            raw_voc="Test VOC",
+            customer_name="Test User",
+            channel=Channel.EMAIL,
+            received_at=datetime.now(),
+        ))
+        test_db.expunge_all()
+
+        tickets, _ = await service.list_tickets(fields=["ticket_id", "status", "summary"])
+        unloaded = inspect(tickets[0]).unloaded
+        assert {"raw_voc", "decision_reason", "action_proposal"} <= unloaded
+        assert "status" not in unloaded
+
+
+@pytest.mark.integration
+class TestTicketExport:
+    """Export reads rows from a server-side cursor in batches"""
+
+    async def test_export_streams_batches(self, test_db: AsyncSession):
+        service = TicketService(test_db)
+        created = [
+            await service.create_ticket(VOCCreate(
+                raw_voc=f"VOC {i}",
+                customer_name="User",
+                channel=Channel.EMAIL,
+                received_at=datetime.now(),
+            ))
+            for i in range(5)
+        ]
+
+        batches = [
+            list(rows) async for rows in service.export_tickets(
+                ["ticket_id", "status"], batch_size=2
+            )
+        ]
+
+        assert [len(rows) for rows in batches] == [2, 2, 1]
+        assert sorted(row.ticket_id for rows in batches for row in rows) == sorted(
+            t.ticket_id for t in created
+        )
+        assert batches[0][0].status == TicketStatus.OPEN
+
+@pytest.mark.integration
+class TestTicketStats:
+    """Incrementally maintained ticket counters"""
+
+    async def test_counters_follow_transitions(self, test_db: AsyncSession):
+        service = TicketService(test_db)
+        tickets = [
+            await service.create_ticket(VOCCreate(
+                raw_voc=f"VOC {i}",
+                customer_name="User",
+                channel=Channel.EMAIL,
+                received_at=datetime.now(),
+            ))
+            for i in range(3)
+        ]
+
+        stats = await get_ticket_stats(test_db)
+        assert stats["total"] == 3
+        assert stats["by_status"]["OPEN"] == 3
+        assert stats["by_urgency"] == {"unset": 3}
+
+        # ORM change (as done by normalization/solver)
+        for ticket in tickets:
+            ticket.status = TicketStatus.WAITING_CONFIRM
+            ticket.urgency = Urgency.HIGH
+        await test_db.commit()
+
+        # Conditional UPDATE transitions
+        await service.confirm_ticket(tickets[0].ticket_id)
+        await service.bulk_action([
+            TicketBulkActionItem(
+                ticket_id=tickets[1].ticket_id, action="reject",
+                payload={"reject_reason": "오분류"},
+            ),
+        ])
+
+        stats = await get_ticket_stats(test_db)
+        assert stats["total"] == 3
+        assert stats["by_status"]["OPEN"] == 0
+        assert stats["by_status"]["WAITING_CONFIRM"] == 1
+        assert stats["by_status"]["DONE"] == 1
+        assert stats["by_status"]["REJECTED"] == 1
+        assert stats["by_urgency"] == {"high": 3}
+        assert len(stats["daily"]) == 1
+        assert stats["daily"][0]["total"] == 3
+
+        # Counters match a full recount
+        result = await test_db.execute(
+            select(Ticket.status, func.count()).group_by(Ticket.status)
+        )
+        for status, count in result.all():
+            assert stats["by_status"][status.value] == count
+
+    async def test_change_version_bumps_on_every_write(self, test_db: AsyncSession):
+        service = TicketService(test_db)
+        assert await get_change_version(test_db) == 0
+
+        ticket = await service.create_ticket(VOCCreate(
+            raw_voc="VOC",
+            customer_name="User",
+            channel=Channel.EMAIL,
+            received_at=datetime.now(),
+        ))
+        created = await get_change_version(test_db)
+        assert created > 0
+
+        # ORM change that leaves status/urgency alone
+        ticket.summary = "요약"
+        await test_db.commit()
+        summarized = await get_change_version(test_db)
+        assert summarized > created
+
+        # A flush without ticket changes
+        await test_db.commit()
+        assert await get_change_version(test_db) == summarized
+
+        # Conditional UPDATE transition
+        ticket.status = TicketStatus.WAITING_CONFIRM
+        await test_db.commit()
+        waiting = await get_change_version(test_db)
+        await service.confirm_ticket(ticket.ticket_id)
+        assert await get_change_version(test_db) > waiting
@@ -434,6 +434,64 @@ class TestWorkflowIntegration:
             assert isinstance(similar_cases, list)
 
 
+class TestToolGathering:
+    """Solver tool gathering tests"""
+
+    @pytest.mark.asyncio
+    async def test_independent_tools_run_concurrently(self):
+        """Similar-VOC search overlaps the log branch; system info follows analysis"""
+        import time
+        from app.agents.solver.agent import SolverAgent
+        from app.agents.solver.tools.schemas import (
+            GetLogsOutput, AnalyzeErrorPatternsOutput, ExternalSystemError,
+            GetSystemInfoOutput, SearchSimilarVocsOutput,
+        )
+
+        calls = []
+
+        async def slow_get_logs(**kwargs):
+            await asyncio.sleep(0.2)
+            calls.append("get_logs")
+            return GetLogsOutput(logs=[{"level": "ERROR", "message": "gateway timeout"}], total_count=1)
+
+        async def fake_analyze(**kwargs):
+            calls.append("analyze")
+            return AnalyzeErrorPatternsOutput(
+                external_system_errors=[ExternalSystemError(system="PaymentGateway", error_count=1)],
+                total_errors=1,
+            )
+
+        def fake_system_info(system_name):
+            calls.append("system_info")
+            return GetSystemInfoOutput(system_name=system_name, type="external")
+
+        def slow_search(**kwargs):
+            time.sleep(0.2)
+            calls.append("search")
+            return SearchSimilarVocsOutput()
+
+        agent = SolverAgent()
+        input_data = SolverAgentInput(
+            ticket_id="TEST-001",
+            raw_voc="결제가 실패했어요",
+            received_at=datetime(2024, 1, 15, 18, 30, tzinfo=timezone.utc),
+        )
+
+        with patch("app.agents.solver.agent.get_logs", slow_get_logs), \
+                patch("app.agents.solver.agent.analyze_service_error_patterns", fake_analyze), \
+                patch("app.agents.solver.agent.get_system_info", fake_system_info), \
+                patch("app.agents.solver.agent.search_similar_vocs", slow_search):
+            started = time.perf_counter()
+            tool_data = await agent._gather_tool_data(input_data)
+            elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.35
+        assert calls.index("get_logs") < calls.index("analyze") < calls.index("system_info")
+        assert tool_data["system_info"].system_name == "PaymentGateway"
+        assert tool_data["log_count"] == 1
+        assert tool_data["inferred_service"] == "PaymentService"
+
+
 class TestPerformance:
     """Performance and timeout tests"""
 
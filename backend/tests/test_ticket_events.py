@@ -0,0 +1,156 @@
+"""
+Ticket event bus and SSE stream tests
+"""
+
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.ticket import TicketStatus, Channel
+from app.routers.tickets import _event_stream
+from app.schemas.ticket import VOCCreate
+from app.services import ticket_events
+from app.services.ticket_events import TicketEvent, TicketEventBus
+from app.services.ticket_service import TicketService
+
+
+def make_event(ticket_id: str = "VOC-1", status: str = "DONE", previous: str = "WAITING_CONFIRM"):
+    return TicketEvent(ticket_id, status, previous, "high", datetime.utcnow().isoformat())
+
+
+@pytest.fixture
+def bus(monkeypatch) -> TicketEventBus:
+    """Fresh singleton bus for each test"""
+    bus = TicketEventBus(buffer_size=3, max_queue_size=2)
+    monkeypatch.setattr(ticket_events, "_event_bus", bus)
+    return bus
+
+
+async def drain(subscription) -> list:
+    events = []
+    while True:
+        try:
+            events.append(await asyncio.wait_for(subscription.get(), 0.01))
+        except asyncio.TimeoutError:
+            return events
+
+
+@pytest.mark.unit
+class TestTicketEventBus:
+    """Fan-out, replay and overflow tests"""
+
+    async def test_publish_and_replay(self, bus: TicketEventBus):
+        """Test events get ids and are replayed after Last-Event-ID"""
+        live = bus.subscribe()
+        bus.publish([make_event("VOC-1"), make_event("VOC-2")])
+
+        assert [e.id for e in await drain(live)] == [1, 2]
+
+        resumed = bus.subscribe("1")
+        assert [e.ticket_id for e in await drain(resumed)] == ["VOC-2"]
+        assert await drain(bus.subscribe("2")) == []
+
+    async def test_replay_gap_resets(self, bus: TicketEventBus):
+        """Test a resume point older than the buffer starts with a reset"""
+        bus.publish([make_event(f"VOC-{i}") for i in range(5)])
+
+        assert await drain(bus.subscribe("1")) == [None]
+        assert await drain(bus.subscribe("99")) == [None]
+        assert await drain(bus.subscribe("garbage")) == [None]
+        assert [e.id for e in await drain(bus.subscribe("2"))] == [3, 4, 5]
+
+    async def test_slow_consumer_resets(self, bus: TicketEventBus):
+        """Test an overflowing subscriber drops its backlog for a reset"""
+        subscription = bus.subscribe()
+        bus.publish([make_event(f"VOC-{i}") for i in range(3)])
+        bus.publish([make_event("VOC-9")])
+
+        events = await drain(subscription)
+        assert events[0] is None
+        assert [e.ticket_id for e in events[1:]] == ["VOC-9"]
+
+    def test_filters(self):
+        """Test status filters match tickets entering or leaving"""
+        event = make_event(status="DONE", previous="WAITING_CONFIRM")
+        assert event.matches(None, None)
+        assert event.matches({"WAITING_CONFIRM"}, None)
+        assert event.matches({"DONE"}, "high")
+        assert not event.matches({"OPEN"}, None)
+        assert not event.matches(None, "low")
+
+
+@pytest.mark.integration
+class TestTicketEventPublishing:
+    """Events follow committed ticket changes"""
+
+    async def _create(self, test_db: AsyncSession):
+        return await TicketService(test_db).create_ticket(VOCCreate(
+            raw_voc="결제가 안 됩니다",
+            customer_name="홍길동",
+            channel=Channel.EMAIL,
+            received_at=datetime.now(),
+        ))
+
+    async def test_orm_changes_published_on_commit(self, test_db: AsyncSession, bus):
+        """Test creation and status changes are published after commit"""
+        subscription = bus.subscribe()
+        ticket = await self._create(test_db)
+
+        ticket.status = TicketStatus.ANALYZING
+        await test_db.flush()
+        # Only the committed creation is visible before the next commit
+        assert [e.previous_status for e in await drain(subscription)] == [None]
+        await test_db.commit()
+
+        ticket.status = TicketStatus.MANUAL_REQUIRED
+        await test_db.flush()
+        await test_db.rollback()
+
+        events = [(e.status, e.previous_status) for e in bus._buffer]
+        assert events == [("OPEN", None), ("ANALYZING", "OPEN")]
+
+    async def test_transitions_published(self, test_db: AsyncSession, bus):
+        """Test conditional UPDATE transitions are published"""
+        ticket = await self._create(test_db)
+        ticket.status = TicketStatus.WAITING_CONFIRM
+        await test_db.commit()
+        subscription = bus.subscribe(str(bus.last_event_id))
+
+        await TicketService(test_db).confirm_ticket(ticket.ticket_id, assignee="admin")
+
+        [event] = await drain(subscription)
+        assert (event.ticket_id, event.status, event.previous_status) == (
+            ticket.ticket_id, "DONE", "WAITING_CONFIRM"
+        )
+
+
+class ConnectedRequest:
+    async def is_disconnected(self) -> bool:
+        return False
+
+
+@pytest.mark.unit
+class TestTicketEventStream:
+    """SSE rendering tests"""
+
+    async def test_stream_format(self, bus: TicketEventBus):
+        """Test filtered events, resets and heartbeats are rendered as SSE"""
+        bus.max_queue_size = 10
+        subscription = bus.subscribe("5")  # unknown id -> reset
+        bus.publish([make_event("VOC-1", status="OPEN", previous=None)])
+        bus.publish([make_event("VOC-2")])
+
+        stream = _event_stream(ConnectedRequest(), subscription, {"DONE"}, None, 0.01)
+        chunks = [await stream.__anext__() for _ in range(4)]
+        await stream.aclose()
+
+        assert chunks[0].startswith("retry:")
+        assert chunks[1] == "event: reset\ndata: {}\n\n"
+        lines = chunks[2].splitlines()
+        assert lines[:2] == ["id: 2", "event: status"]
+        assert json.loads(lines[2].removeprefix("data: "))["ticket_id"] == "VOC-2"
+        assert chunks[3] == ": keep-alive\n\n"
+        assert bus.subscriber_count == 0
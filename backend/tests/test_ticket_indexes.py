@@ -0,0 +1,94 @@
+"""
+Ticket list query plan tests
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.ticket import Ticket, TicketStatus, Channel, Urgency, ACTIVE_STATUSES
+from app.services.ticket_service import TicketService
+
+
+async def seed_tickets(test_db: AsyncSession, count: int = 300) -> None:
+    """Insert tickets with a realistic status mix and collect statistics"""
+    rng = random.Random(0)
+    statuses = list(TicketStatus) + [TicketStatus.DONE] * 6
+    base = datetime(2026, 1, 1)
+    test_db.add_all([
+        Ticket(
+            ticket_id=f"VOC-20260101-{i:04d}",
+            status=rng.choice(statuses),
+            urgency=rng.choice(list(Urgency)),
+            raw_voc=f"VOC {i}",
+            customer_name=f"Customer {i}",
+            channel=Channel.EMAIL,
+            received_at=base,
+            created_at=base + timedelta(minutes=i),
+        )
+        for i in range(count)
+    ])
+    await test_db.commit()
+    await test_db.execute(text("ANALYZE"))
+
+
+async def list_query_plans(test_db: AsyncSession, call) -> list:
+    """Run a list call and return the query plan of its ticket SELECT"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().startswith("SELECT tickets.ticket_id"):
+            statements.append((statement, parameters))
+
+    sync_engine = test_db.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        await call
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+
+    assert len(statements) == 1
+    statement, parameters = statements[0]
+    connection = await test_db.connection()
+    result = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    return [row[-1] for row in result.all()]
+
+
+@pytest.mark.integration
+class TestTicketListIndexes:
+    """The admin list queries are served by index scans without sorting"""
+
+    @pytest.mark.parametrize("filters,index", [
+        ({}, "ix_tickets_created_at_ticket_id"),
+        ({"status": [TicketStatus.WAITING_CONFIRM]}, "ix_tickets_status_created_at"),
+        ({"urgency": "high"}, "ix_tickets_urgency_created_at"),
+        ({"status": list(ACTIVE_STATUSES)}, "ix_tickets_active_created_at"),
+    ])
+    async def test_list_tickets_uses_index(self, test_db: AsyncSession, filters, index):
+        await seed_tickets(test_db)
+        service = TicketService(test_db)
+
+        plan = await list_query_plans(
+            test_db, service.list_tickets(include_total=False, **filters)
+        )
+
+        assert any(index in step for step in plan), plan
+        assert not any("TEMP B-TREE" in step for step in plan), plan
+
+    async def test_cursor_page_uses_index_range(self, test_db: AsyncSession):
+        await seed_tickets(test_db)
+        service = TicketService(test_db)
+        _, next_cursor, _, _ = await service.list_tickets_by_cursor(
+            status=list(ACTIVE_STATUSES), limit=20
+        )
+
+        plan = await list_query_plans(
+            test_db,
+            service.list_tickets_by_cursor(status=list(ACTIVE_STATUSES), cursor=next_cursor),
+        )
+
+        assert any("ix_tickets_active_created_at" in step for step in plan), plan
+        assert not any("TEMP B-TREE" in step for step in plan), plan